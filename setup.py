@@ -15,6 +15,11 @@ setuptools.setup(
     install_requires=[
         "typeguard"
     ],
+    entry_points={
+        "console_scripts": [
+            "typemock=typemock._cli:main",
+        ],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Programming Language :: Python :: 3.5",
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+class MyThing:
+    a_hinted_attribute: Optional[Result] = None
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def find(self, names: List[str]) -> Result:
+        pass
+
+
+class Result:
+    pass
+
+
+class MyUnHintedThing:
+
+    def convert_int_to_str(self, number):
+        pass
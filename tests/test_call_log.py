@@ -0,0 +1,136 @@
+from array import array
+from unittest import TestCase
+
+from typemock import tmock, when, verify, match, calls
+from typemock._mock.calls import CallLog
+
+
+class MyThing:
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def greet(self, name: str) -> str:
+        pass
+
+    def sum_list(self, numbers: list) -> int:
+        pass
+
+
+class TestCallLog(TestCase):
+
+    def test_append__repeated_calls_interned(self):
+        call_log = CallLog()
+        for number in [1, 2, 1, 1, 2]:
+            call_log.append((("number", number),))
+
+        self.assertEqual(5, len(call_log))
+        self.assertEqual([(("number", 1),), (("number", 2),)], call_log.distinct())
+        self.assertEqual([0, 1, 0, 0, 1], list(call_log.ids()))
+        self.assertEqual([1, 2, 1, 1, 2], [call[0][1] for call in call_log])
+
+    def test_append__equal_values_of_other_types_not_interned(self):
+        call_log = CallLog()
+        call_log.append((("number", 1),))
+        call_log.append((("number", True),))
+
+        self.assertIs(True, call_log[1][0][1])
+        self.assertEqual(2, call_log.count_equal((("number", 1),)))
+
+    def test_append__equal_values_of_other_types_each_interned_once(self):
+        call_log = CallLog()
+        for i in range(2000):
+            call_log.append((("number", 1 if i % 2 else True),))
+            call_log.append((("values", (0.0, -0.0, frozenset([1]))),))
+            call_log.append((("values", (-0.0, 0.0, frozenset([True]))),))
+
+        self.assertEqual(6000, len(call_log))
+        self.assertEqual(4, len(call_log.distinct()))
+        self.assertEqual([], call_log._unhashable_ids)
+        self.assertIs(True, call_log[0][0][1])
+        self.assertIs(1, call_log[3][0][1])
+        self.assertEqual("(-0.0, 0.0, frozenset({True}))", repr(call_log[2][0][1]))
+        self.assertEqual(2000, call_log.count_equal((("number", 1),)))
+        self.assertEqual(4000, call_log.count_equal((("values", (0.0, 0.0, frozenset([1]))),)))
+
+    def test_append__unhashable_calls(self):
+        call_log = CallLog()
+        call_log.append((("numbers", [1]),))
+        call_log.append((("numbers", [1]),))
+        call_log.append((("numbers", [2]),))
+
+        self.assertEqual(3, len(call_log))
+        self.assertEqual(2, call_log.count_equal((("numbers", [1]),)))
+
+    def test_column__values_of_each_call(self):
+        call_log = CallLog()
+        for number, ratio in [(1, 0.5), (2, 1.5), (1, 0.5)]:
+            call_log.append((("number", number), ("ratio", ratio)))
+
+        self.assertEqual(array('q', [1, 2, 1]), call_log.column(0))
+        self.assertEqual(array('d', [0.5, 1.5, 0.5]), call_log.column(1))
+
+    def test_column__values_of_other_types_kept_in_a_list(self):
+        call_log = CallLog()
+        for number in [1, True, 2 ** 70, "1"]:
+            call_log.append((("number", number),))
+
+        self.assertEqual([1, True, 2 ** 70, "1"], call_log.column(0))
+        self.assertIs(True, call_log.column(0)[1])
+        self.assertEqual([], CallLog().column(0))
+
+    def test_calls_read_back__have_their_own_values(self):
+        first = "".join(["a", "b"])
+        second = "".join(["a", "b"])
+        call_log = CallLog()
+        call_log.append((("name", first),))
+        call_log.append((("name", second),))
+
+        self.assertEqual(1, len(call_log.distinct()))
+        self.assertIs(second, call_log[1][0][1])
+        self.assertIs(second, call_log[-1][0][1])
+        self.assertEqual([first, second], [call[0][1] for call in call_log])
+        self.assertIs(second, list(call_log)[1][0][1])
+
+    def test_count_matching__first_other_call_in_call_order(self):
+        call_log = CallLog()
+        for number in [1, 3, 2, 3, 1]:
+            call_log.append((("number", number),))
+
+        count, first_other_call = call_log.count_matching(lambda call: call[0][1] == 1)
+
+        self.assertEqual(2, count)
+        self.assertEqual((("number", 3),), first_other_call)
+
+
+class TestInternedCallVerify(TestCase):
+
+    def test_verify__many_repeated_calls(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("something")
+            when(my_thing_mock.sum_list(match.anything())).then_return(1)
+        for number in range(1000):
+            my_thing_mock.convert_int_to_str(number % 3)
+            my_thing_mock.sum_list([number % 2])
+
+        verify(my_thing_mock, exactly=334).convert_int_to_str(0)
+        verify(my_thing_mock, exactly=666).convert_int_to_str(match.in_range(1, 2))
+        verify(my_thing_mock, exactly=500).sum_list([1])
+        self.assertEqual(3, len(my_thing_mock._mock_method_states_by_name["convert_int_to_str"].recorded_calls().distinct()))
+
+    def test_captors__capture_the_values_of_each_call(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.greet(match.anything())).then_return("hello")
+        first = "".join(["a", "b"])
+        second = "".join(["a", "b"])
+        my_thing_mock.greet(first)
+        my_thing_mock.greet(second)
+
+        names = match.captor()
+        verify(my_thing_mock, exactly=2).greet(names)
+        queried_names = match.captor()
+        calls(my_thing_mock).greet.where(name=queried_names)
+
+        for captured in [names.values, queried_names.values]:
+            self.assertIs(first, captured[0])
+            self.assertIs(second, captured[1])
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from typemock import tmock, when, chaos, match
+from typemock.api import MockTypeSafetyError
+
+
+class MyService:
+
+    def fetch(self, key: str) -> str:
+        pass
+
+
+def call_many(service: MyService, times: int):
+    outcomes = []
+    for _ in range(times):
+        try:
+            outcomes.append(service.fetch("k"))
+        except IOError:
+            outcomes.append("error")
+    return outcomes
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestChaosMocking(TestCase):
+
+    def test_weighted__reproducible_for_seed(self):
+        schedule = chaos.weighted([(95, chaos.returns("ok")), (5, chaos.raises(IOError()))], seed=7)
+
+        runs = []
+        for _ in range(2):
+            with tmock(MyService) as my_service_mock:
+                when(my_service_mock.fetch(match.anything())).then_chaos(schedule)
+            runs.append(call_many(my_service_mock, 1000))
+
+        self.assertEqual(runs[0], runs[1])
+        errors = runs[0].count("error")
+        self.assertTrue(20 < errors < 80, errors)
+
+    def test_weighted__burst_length__errors_repeat(self):
+        with tmock(MyService) as my_service_mock:
+            when(my_service_mock.fetch("k")).then_chaos(
+                chaos.weighted([(1, chaos.returns("ok")), (1, chaos.raises(IOError()))], seed=1, burst_length=3)
+            )
+
+        outcomes = "".join("e" if outcome == "error" else "." for outcome in call_many(my_service_mock, 200))
+
+        error_runs = [run for run in outcomes.rstrip("e").split(".") if run]
+        self.assertTrue(len(error_runs) > 0)
+        for run in error_runs:
+            self.assertGreaterEqual(len(run), 3)
+
+    def test_outage__errors_during_window(self):
+        clock = FakeClock()
+        with tmock(MyService) as my_service_mock:
+            when(my_service_mock.fetch("k")).then_chaos(
+                chaos.weighted([(1, chaos.returns("ok"))], clock=clock).with_outage(10, 20, IOError())
+            )
+
+        self.assertEqual(["ok"], call_many(my_service_mock, 1))
+        clock.now += 15
+        self.assertEqual(["error"], call_many(my_service_mock, 1))
+        clock.now += 10
+        self.assertEqual(["ok"], call_many(my_service_mock, 1))
+
+    def test_weighted__wrong_result_type__error(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(MyService) as my_service_mock:
+                when(my_service_mock.fetch("k")).then_chaos(chaos.weighted([(1, chaos.returns(1))]))
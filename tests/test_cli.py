@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from typemock import _cli
+from typemock._cli import main, validate_package
+from typemock.api import TypeSafety
+
+
+class TestValidatePackage(TestCase):
+
+    def test_validate_package__reports_missing_hints_by_module_and_class(self):
+        report = validate_package("tests", workers=1)
+
+        self.assertEqual("STRICT", report["type_safety"])
+        safety_report = report["modules"]["tests.test_safety"]
+        self.assertIsNone(safety_report["error"])
+        self.assertEqual(
+            [{"path": ["method_with_missing_return_type"], "member_type": "return"}],
+            safety_report["classes"]["ClassWithNoResponseType"]
+        )
+        self.assertNotIn("MyThing", safety_report["classes"])
+
+    def test_validate_package__process_pool(self):
+        self.assertEqual(
+            validate_package("tests", TypeSafety.NO_RETURN_IS_NONE_RETURN, workers=1),
+            validate_package("tests", TypeSafety.NO_RETURN_IS_NONE_RETURN, workers=2)
+        )
+
+    def test_validate_package__unknown_package(self):
+        with self.assertRaises(ValueError):
+            validate_package("not_a_package_anywhere")
+
+
+class TestMain(TestCase):
+
+    def test_main__writes_report_and_fails_on_missing_hints(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "report.json")
+
+            exit_code = main(["tests", "--workers", "1", "--report", report_path])
+
+            with open(report_path) as report_file:
+                report = json.load(report_file)
+        self.assertEqual(1, exit_code)
+        self.assertIn("tests.test_safety", report["modules"])
+
+    def test_main__incremental__skips_unchanged_modules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "report.json")
+            main(["tests", "--workers", "1", "--report", report_path])
+            with open(report_path) as report_file:
+                first_report = json.load(report_file)
+
+            with patch("typemock._cli.validate_module", wraps=_cli.validate_module) as validate_module:
+                main(["tests", "--workers", "1", "--report", report_path, "--incremental"])
+            with open(report_path) as report_file:
+                second_report = json.load(report_file)
+
+        self.assertEqual(0, validate_module.call_count)
+        self.assertEqual(first_report, second_report)
+
+    def test_main__incremental__type_safety_changed__validates_again(self):
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, "report.json")
+            main(["tests", "--workers", "1", "--report", report_path])
+
+            with patch("typemock._cli.validate_module", wraps=_cli.validate_module) as validate_module:
+                main([
+                    "tests", "--workers", "1", "--report", report_path, "--incremental",
+                    "--type-safety", "NO_RETURN_IS_NONE_RETURN"
+                ])
+
+        self.assertGreater(validate_module.call_count, 0)
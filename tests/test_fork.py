@@ -0,0 +1,151 @@
+from unittest import TestCase
+
+from typemock import tmock, when, stub, fork, verify, reset, match
+from typemock.api import MockingError, NoBehaviourSpecifiedError, VerifyError
+
+
+class MyThing:
+    an_attribute: str = "initial"
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def concat(self, prefix: str, number: int) -> str:
+        pass
+
+
+def convert_int_to_str(number: int) -> str:
+    return str(number)
+
+
+class TestFork(TestCase):
+
+    def setUp(self):
+        with tmock(MyThing) as base_mock:
+            for i in range(100):
+                when(base_mock.convert_int_to_str(i)).then_return(str(i))
+            when(base_mock.concat(match.anything(), 1)).then_return("matched")
+            when(base_mock.an_attribute).then_return("specified")
+        self.base_mock = base_mock
+
+    def test_fork_has_base_behaviour(self):
+        forked = fork(self.base_mock)
+
+        self.assertIsInstance(forked, MyThing)
+        self.assertEqual("99", forked.convert_int_to_str(99))
+        self.assertEqual("matched", forked.concat("a", 1))
+        self.assertEqual("specified", forked.an_attribute)
+
+    def test_overrides_are_kept_to_the_fork(self):
+        forked = fork(self.base_mock)
+        other_fork = fork(self.base_mock)
+
+        stub(forked).convert_int_to_str(1).then_return("one")
+        stub(forked).concat(match.anything(), 1).then_return("overridden")
+        stub(forked).concat("a", 2).then_return("new")
+        with forked:
+            when(forked.an_attribute).then_return("forked")
+
+        self.assertEqual("one", forked.convert_int_to_str(1))
+        self.assertEqual("overridden", forked.concat("a", 1))
+        self.assertEqual("new", forked.concat("a", 2))
+        self.assertEqual("forked", forked.an_attribute)
+        for mock in [self.base_mock, other_fork]:
+            self.assertEqual("1", mock.convert_int_to_str(1))
+            self.assertEqual("matched", mock.concat("a", 1))
+            self.assertEqual("specified", mock.an_attribute)
+            with self.assertRaises(NoBehaviourSpecifiedError):
+                mock.concat("a", 2)
+
+    def test_base_changes_after_forking_are_kept_to_the_base(self):
+        forked = fork(self.base_mock)
+
+        stub(self.base_mock).convert_int_to_str(1).then_return("one")
+        stub(self.base_mock).concat(match.anything(), 2).then_return("two")
+
+        self.assertEqual("one", self.base_mock.convert_int_to_str(1))
+        self.assertEqual("1", forked.convert_int_to_str(1))
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            forked.concat("a", 2)
+
+    def test_fork_has_its_own_interactions(self):
+        self.base_mock.convert_int_to_str(1)
+        forked = fork(self.base_mock)
+
+        forked.convert_int_to_str(2)
+
+        verify(forked, exactly=0).convert_int_to_str(1)
+        verify(forked).convert_int_to_str(2)
+        verify(self.base_mock).convert_int_to_str(1)
+        with self.assertRaises(VerifyError):
+            verify(self.base_mock).convert_int_to_str(2)
+
+    def test_series_responses_are_not_shared(self):
+        stub(self.base_mock).convert_int_to_str(1).then_return_many(["a", "b"])
+        stub(self.base_mock).concat(match.anything(), 3).then_return_many(["c", "d"])
+        self.assertEqual("a", self.base_mock.convert_int_to_str(1))
+        forked = fork(self.base_mock)
+
+        self.assertEqual("b", forked.convert_int_to_str(1))
+        self.assertEqual("c", forked.concat("x", 3))
+        self.assertEqual("b", self.base_mock.convert_int_to_str(1))
+        self.assertEqual("c", self.base_mock.concat("x", 3))
+
+        reset(forked, behaviour=False)
+
+        self.assertEqual("a", forked.convert_int_to_str(1))
+        self.assertEqual("c", forked.concat("x", 3))
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            self.base_mock.convert_int_to_str(1)
+
+    def test_series_responses_of_other_matchers_are_not_shared(self):
+        stub(self.base_mock).concat(match.anything(), 1).then_return_many(["a", "b"])
+        stub(self.base_mock).concat(match.anything(), 2).then_return_many(["x", "y", "z"])
+        forked = fork(self.base_mock)
+
+        self.assertEqual("a", self.base_mock.concat("0", 1))
+        self.assertEqual("x", self.base_mock.concat("0", 2))
+        self.assertEqual("y", self.base_mock.concat("0", 2))
+
+        self.assertEqual("x", forked.concat("0", 2))
+        self.assertEqual("a", forked.concat("0", 1))
+        self.assertEqual("z", self.base_mock.concat("0", 2))
+
+    def test_fork_of_a_fork(self):
+        forked = fork(self.base_mock)
+        stub(forked).convert_int_to_str(1).then_return("one")
+
+        forked_again = fork(forked)
+        stub(forked_again).convert_int_to_str(2).then_return("two")
+
+        self.assertEqual("one", forked_again.convert_int_to_str(1))
+        self.assertEqual("two", forked_again.convert_int_to_str(2))
+        self.assertEqual("2", forked.convert_int_to_str(2))
+
+    def test_reset_behaviour_of_fork(self):
+        forked = fork(self.base_mock)
+
+        reset(forked)
+
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            forked.convert_int_to_str(1)
+        self.assertEqual("initial", forked.an_attribute)
+        self.assertEqual("1", self.base_mock.convert_int_to_str(1))
+
+    def test_fork_function(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(1)).then_return("one")
+
+        forked = fork(convert_mock)
+        stub(forked)(1).then_return("uno")
+
+        self.assertEqual("uno", forked(1))
+        self.assertEqual("one", convert_mock(1))
+        verify(forked)(1)
+
+    def test_fork_only_closed_mocks(self):
+        with self.assertRaises(MockingError):
+            fork(MyThing())
+        with self.base_mock:
+            with self.assertRaises(MockingError):
+                fork(self.base_mock)
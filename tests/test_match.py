@@ -1,6 +1,7 @@
+from typing import List
 from unittest import TestCase
 
-from typemock import match, tmock, when
+from typemock import match, tmock, when, verify
 from typemock.api import MockTypeSafetyError
 
 
@@ -18,6 +19,22 @@ class MyThing:
     def do_something_with_side_effects(self) -> None:
         pass
 
+    def join(self, *parts: str) -> str:
+        pass
+
+    def tag(self, *parts: str, **labels: str) -> str:
+        pass
+
+    def sum_list(self, numbers: List[int]) -> int:
+        pass
+
+
+class Point:
+
+    def __init__(self, x: int, y: int):
+        self.x = x
+        self.y = y
+
 
 class TestMatcherAny(TestCase):
 
@@ -27,6 +44,39 @@ class TestMatcherAny(TestCase):
         self.assertEqual(1, matcher)
 
 
+class TestMatchers(TestCase):
+
+    def test_matchers(self):
+        cases = [
+            (match.instance_of(int), 1, "1"),
+            (match.instance_of(int, str), "1", 1.0),
+            (match.equal_to([1]), [1], [2]),
+            (match.in_range(1, 3), 3, 4),
+            (match.in_range(minimum=1), 100, "not comparable"),
+            (match.regex(r"^ab+$"), "abbb", "abc"),
+            (match.contains(1, 2), [2, 1, 3], [1]),
+            (match.has_attrs(x=1, y=match.in_range(0, 5)), Point(1, 5), Point(1, 6)),
+            (match.all_of(match.instance_of(int), match.in_range(0, 5)), 3, 6),
+            (match.any_of(1, match.regex("a")), "a", 2),
+            (match.not_(1), 2, 1),
+        ]
+        for matcher, matching, not_matching in cases:
+            with self.subTest(repr(matcher)):
+                predicate = matcher.compile()
+
+                self.assertTrue(matcher.matches(matching))
+                self.assertTrue(predicate(matching))
+                self.assertFalse(matcher.matches(not_matching))
+                self.assertFalse(predicate(not_matching))
+
+    def test_matchers__equal_and_hash_by_parameters(self):
+        self.assertEqual(match.in_range(1, 2), match.in_range(1, 2))
+        self.assertEqual(hash(match.equal_to([1])), hash(match.equal_to([1])))
+        self.assertNotEqual(match.in_range(1, 2), match.in_range(1, 3))
+        self.assertNotEqual(match.equal_to(1), match.in_range(1, 1))
+        self.assertNotEqual(match.equal_to(1), 1)
+
+
 class TestMockObjectMatching(TestCase):
 
     def test_specify_any_matcher_arg__called_with_correct_type__return_single(self):
@@ -61,3 +111,107 @@ class TestMockObjectMatching(TestCase):
 
         with self.assertRaises(MockTypeSafetyError):
             my_thing_mock.convert_int_to_str("not an int")
+
+    def test_specify_matchers__first_matching_behaviour_responds(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.in_range(0, 9))).then_return("digit")
+            when(my_thing_mock.convert_int_to_str(match.instance_of(int))).then_return("number")
+
+        self.assertEqual("digit", my_thing_mock.convert_int_to_str(5))
+        self.assertEqual("number", my_thing_mock.convert_int_to_str(50))
+
+    def test_specify_same_matchers_twice__last_behaviour_replaces(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.in_range(0, 9))).then_return("first")
+            when(my_thing_mock.convert_int_to_str(match.in_range(0, 9))).then_return("second")
+
+        self.assertEqual("second", my_thing_mock.convert_int_to_str(5))
+
+    def test_specify_matchers_in_var_args(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.join("a", match.regex("^b"))).then_return("joined")
+
+        self.assertEqual("joined", my_thing_mock.join("a", "bc"))
+        verify(my_thing_mock).join(match.anything(), match.regex("c$"))
+        verify(my_thing_mock, exactly=0).join("a", match.regex("^c"))
+
+    def test_specify_unhashable_args__exact_and_matched(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.sum_list([1, 2])).then_return(3)
+            when(my_thing_mock.sum_list(match.contains(5))).then_return(5)
+
+        self.assertEqual(3, my_thing_mock.sum_list([1, 2]))
+        self.assertEqual(5, my_thing_mock.sum_list([4, 5]))
+        verify(my_thing_mock).sum_list(match.contains(4))
+
+    def test_verify_with_matchers(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("a string")
+
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(2)
+
+        verify(my_thing_mock, exactly=2).convert_int_to_str(match.in_range(1, 2))
+        verify(my_thing_mock, exactly=1).convert_int_to_str(match.not_(1))
+
+
+class TestCaptor(TestCase):
+
+    def test_captor__verify__captures_matching_calls(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(match.anything(), match.anything())).then_return("a string")
+
+        for number in [3, 1, 3]:
+            my_thing_mock.multiple_arg("batch", number)
+        my_thing_mock.multiple_arg("other", 10)
+
+        numbers = match.captor("q")
+        verify(my_thing_mock).multiple_arg("batch", numbers)
+
+        self.assertEqual([3, 1, 3], list(numbers.values))
+        self.assertEqual(3, numbers.value)
+        self.assertEqual(7, numbers.sum())
+        self.assertEqual(3, numbers.max())
+        self.assertEqual({3: 2, 1: 1}, numbers.histogram())
+        self.assertEqual({0: 1, 2: 2}, numbers.histogram(bin_width=2))
+
+    def test_captor__when__captures_calls_which_get_the_behaviour(self):
+        prefixes = match.captor()
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(prefixes, 1)).then_return("a string")
+
+        my_thing_mock.multiple_arg("a", 1)
+        my_thing_mock.multiple_arg("b", 1)
+
+        self.assertEqual(["a", "b"], prefixes.values)
+
+    def test_captor__in_var_args__captures_only_whole_matching_calls(self):
+        parts = match.captor()
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.join(parts, "end")).then_return("joined")
+            when(my_thing_mock.join(match.anything(), match.anything())).then_return("other")
+
+        my_thing_mock.join("a", "end")
+        my_thing_mock.join("b", "other")
+
+        self.assertEqual(["a"], parts.values)
+
+    def test_captor__in_var_args__captures_only_when_kwargs_match(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.tag(match.anything(), a=match.anything())).then_return("tagged")
+
+        my_thing_mock.tag("p", a="1")
+        my_thing_mock.tag("q", a="2")
+
+        parts = match.captor()
+        labels = match.captor()
+        verify(my_thing_mock).tag(parts, a="1")
+        verify(my_thing_mock).tag(match.anything(), a=labels)
+
+        self.assertEqual(["p"], parts.values)
+        self.assertEqual(["1", "2"], labels.values)
+
+    def test_captor__nothing_captured__no_value(self):
+        captor = match.captor()
+        with self.assertRaises(ValueError):
+            captor.value
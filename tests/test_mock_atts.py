@@ -64,6 +64,16 @@ class TestBasicClassAttributeMocking(TestCase):
 
                 self.assertEqual(expected, actual)
 
+    def test_mock__generic_attribute__get__snapshot(self):
+        for mocked_thing in mocked_things:
+            with self.subTest():
+                with tmock(mocked_thing) as my_thing_mock:
+                    when(my_thing_mock.generic_att).then_return_snapshot(["hello"])
+
+                my_thing_mock.generic_att.append("mutated")
+
+                self.assertEqual(["hello"], my_thing_mock.generic_att)
+
     def test_mock__class_attribute__get__many(self):
         expected_responses = [
             3,
@@ -164,3 +174,19 @@ class TestBasicClassAttributeMocking(TestCase):
                 actual = my_thing_mock.derived_property_throws_error
 
                 self.assertEqual(expected, actual)
+
+    def test_mocked_attributes_served_by_descriptors_of_shared_mock_type(self):
+        first_mock = tmock(MyThing)
+        second_mock = tmock(MyThing)
+
+        self.assertIs(type(first_mock), type(second_mock))
+        self.assertIn("class_att_with_type", type(first_mock).__dict__)
+        self.assertIs(MyThing, first_mock.__class__)
+        self.assertTrue(isinstance(first_mock, MyThing))
+
+    def test_non_mocked_attributes__set_and_get_as_normal(self):
+        my_thing_mock = tmock(MyThing)
+
+        my_thing_mock.not_an_attribute_of_my_thing = 1
+
+        self.assertEqual(1, my_thing_mock.not_an_attribute_of_my_thing)
@@ -1,7 +1,20 @@
-from unittest import TestCase
+import abc
+from typing import List
+from unittest import TestCase, skipIf
 
-from typemock import tmock
-from typemock.api import MockingError
+from typemock import tmock, when, verify
+from typemock._utils import try_instantiate_class
+from typemock.api import MockTypeSafetyError
+
+try:
+    from typing import Protocol
+except ImportError:  # Before python 3.8
+    Protocol = None  # type: ignore
+
+try:
+    import dataclasses
+except ImportError:  # Before python 3.7
+    dataclasses = None  # type: ignore
 
 
 def a_static_function(func_arg: str) -> int:
@@ -24,6 +37,38 @@ class MyThingInitWithArgsAndLogic:
         self.an_attribute = an_attribute + 3
 
 
+class MyAbstractThing(abc.ABC):
+    count: int = 0
+
+    def __init__(self, name: str):
+        raise AssertionError("Should not be instantiated")
+
+    @abc.abstractmethod
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+
+class MySlottedThing:
+    __slots__ = ("name", "size")
+
+    def __init__(self, name: str, size: int):
+        raise AssertionError("Should not be instantiated")
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+
+if dataclasses is not None:
+    @dataclasses.dataclass
+    class MyDataThing:
+        name: str
+        size: int = 3
+        tags: List[str] = dataclasses.field(default_factory=list)
+
+        def convert_int_to_str(self, number: int) -> str:
+            pass
+
+
 class TestMockClass(TestCase):
 
     def test_mock__class__empty_init__no_errors(self):
@@ -35,6 +80,55 @@ class TestMockClass(TestCase):
     def test_mock__class__init_with_args_and_complex_logic__no_errors(self):
         tmock(MyThingInitWithArgsAndLogic)
 
-    def test_mock_function__expect_error(self):
-        with self.assertRaises(MockingError):
-            tmock(a_static_function)
+    def test_mock_function__no_errors(self):
+        tmock(a_static_function)
+
+
+class TestMockDeclaredClass(TestCase):
+
+    def test_mock__abstract_class(self):
+        self.assertIsNone(try_instantiate_class(MyAbstractThing))
+        with tmock(MyAbstractThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(1)).then_return("one")
+
+        self.assertEqual("one", my_thing_mock.convert_int_to_str(1))
+        self.assertEqual(0, my_thing_mock.count)
+
+    def test_mock__slotted_class(self):
+        self.assertIsNone(try_instantiate_class(MySlottedThing))
+        with tmock(MySlottedThing) as my_thing_mock:
+            when(my_thing_mock.name).then_return("a name")
+            with self.assertRaises(MockTypeSafetyError):
+                when(my_thing_mock.size).then_return("not an int")
+
+        self.assertEqual("a name", my_thing_mock.name)
+        my_thing_mock.size = 2
+        verify(my_thing_mock).size = 2
+
+    @skipIf(dataclasses is None, "dataclasses need python 3.7")
+    def test_mock__dataclass__fields_with_defaults(self):
+        first_mock = tmock(MyDataThing)
+        second_mock = tmock(MyDataThing)
+
+        self.assertEqual(3, first_mock.size)
+        self.assertEqual([], first_mock.tags)
+        self.assertIsNot(first_mock.tags, second_mock.tags)
+        with self.assertRaises(MockTypeSafetyError):
+            first_mock.name = 1
+
+    def test_mock__protocol__annotated_members(self):
+        if Protocol is None:
+            self.skipTest("Protocols need python 3.8")
+
+        class MyProtocol(Protocol):
+            name: str
+
+            def convert_int_to_str(self, number: int) -> str:
+                ...
+
+        with tmock(MyProtocol) as my_protocol_mock:
+            when(my_protocol_mock.name).then_return("a name")
+            when(my_protocol_mock.convert_int_to_str(1)).then_return("one")
+
+        self.assertEqual("a name", my_protocol_mock.name)
+        self.assertEqual("one", my_protocol_mock.convert_int_to_str(1))
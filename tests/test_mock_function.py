@@ -0,0 +1,180 @@
+import json
+import sys
+from typing import List
+from unittest import TestCase
+
+from tests.test_async import async_test
+from typemock import tmock, when, verify, reset, calls, in_order, verify_all, match
+from typemock.api import MissingTypeHintsError, MockTypeSafetyError, NoBehaviourSpecifiedError, TypeSafety, VerifyError, MockingError
+
+
+def convert_int_to_str(number: int, prefix: str = "") -> str:
+    return prefix + str(number)
+
+
+def first_numbers(count: int) -> List[int]:
+    return list(range(count))
+
+
+def unhinted_function(number):
+    pass
+
+
+async def fetch(path: str) -> str:
+    return "real " + path
+
+
+class TestMockFunction(TestCase):
+
+    def test_specify_behaviour_and_call(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(1)).then_return("one")
+            when(convert_mock(match.anything(), prefix="#")).then_return("#something")
+
+        self.assertEqual("one", convert_mock(1))
+        self.assertEqual("one", convert_mock(number=1))
+        self.assertEqual("#something", convert_mock(2, prefix="#"))
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            convert_mock(2)
+
+    def test_type_safety(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            with self.assertRaises(MockTypeSafetyError):
+                when(convert_mock("1")).then_return("one")
+            with self.assertRaises(MockTypeSafetyError):
+                when(convert_mock(1)).then_return(1)
+
+    def test_type_safety__of_repeated_calls(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(match.anything())).then_return("something")
+        with tmock(first_numbers) as numbers_mock:
+            numbers = [0]
+            when(numbers_mock(1)).then_return(numbers)
+
+        self.assertEqual("something", convert_mock(1))
+        self.assertEqual("something", convert_mock(1))
+        with self.assertRaises(MockTypeSafetyError):
+            # Equal to a call which was checked already.
+            convert_mock(1.0)
+        self.assertEqual([0], numbers_mock(1))
+        numbers.append("1")
+        with self.assertRaises(MockTypeSafetyError):
+            numbers_mock(1)
+
+    def test_repeated_calls__respond_with_their_own_args(self):
+        received = []
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(match.anything(), prefix=match.anything())).then_do(
+                lambda number, prefix: received.append(prefix) or prefix
+            )
+        first = "".join(["#", "1"])
+        second = "".join(["#", "1"])
+
+        convert_mock(1, prefix=first)
+        convert_mock(1, prefix=second)
+
+        self.assertIs(first, received[0])
+        self.assertIs(second, received[1])
+        self.assertIs(second, calls(convert_mock).column("prefix")[1])
+
+    def test_repeated_calls__bound_by_position_keyword_and_default(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(1, prefix="#")).then_return("#1")
+            when(convert_mock(1)).then_return("1")
+
+        for _ in range(2):
+            self.assertEqual("#1", convert_mock(1, "#"))
+            self.assertEqual("#1", convert_mock(prefix="#", number=1))
+            self.assertEqual("1", convert_mock(1))
+            with self.assertRaises(MockTypeSafetyError):
+                convert_mock(1, "#", "extra")
+            with self.assertRaises(MockTypeSafetyError):
+                convert_mock(prefix="#")
+
+        verify(convert_mock, exactly=4)(1, prefix="#")
+
+    def test_missing_type_hints(self):
+        with self.assertRaises(MissingTypeHintsError):
+            tmock(unhinted_function)
+        tmock(unhinted_function, type_safety=TypeSafety.RELAXED)
+
+    def test_relaxed__unhinted_calls_recorded(self):
+        with tmock(unhinted_function, type_safety=TypeSafety.RELAXED) as function_mock:
+            when(function_mock(match.anything())).then_return(None)
+        function_mock(1)
+        function_mock("1")
+        function_mock([1])
+        function_mock(1)
+
+        verify(function_mock, exactly=2)(1)
+        verify(function_mock, exactly=1)([1])
+        self.assertEqual([1, "1", [1], 1], calls(function_mock).column("number"))
+
+    def test_verify(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(match.anything())).then_return("something")
+        convert_mock(1)
+        convert_mock(2)
+        convert_mock(2)
+
+        verify(convert_mock)(1)
+        verify(convert_mock, exactly=2)(2)
+        verify(convert_mock, exactly=0)(3)
+        with self.assertRaises(VerifyError):
+            verify(convert_mock)(3)
+
+        order = in_order(convert_mock)
+        order.verify(convert_mock)(1)
+        order.verify(convert_mock, exactly=2)(2)
+
+        with verify_all() as expected:
+            expected.verify(convert_mock, exactly=3)(match.anything())
+
+        self.assertEqual({1: 1, 2: 2}, calls(convert_mock).group_by("number"))
+
+    def test_verify__a_mocked_object_cannot_be_called(self):
+        with self.assertRaises(MockingError):
+            verify(tmock(json, type_safety=TypeSafety.RELAXED))("something")
+
+    def test_reset(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(1)).then_return("one")
+        convert_mock(1)
+
+        reset(convert_mock)
+
+        verify(convert_mock, exactly=0)(1)
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            convert_mock(1)
+
+    def test_spy(self):
+        convert_spy = tmock(convert_int_to_str, spy=True)
+        with convert_spy:
+            when(convert_spy(1)).then_return("one")
+
+        self.assertEqual("one", convert_spy(1))
+        self.assertEqual("#2", convert_spy(2, prefix="#"))
+        verify(convert_spy)(2, "#")
+
+    @async_test
+    async def test_async_function(self):
+        with tmock(fetch) as fetch_mock:
+            when(await fetch_mock("a")).then_return("mocked a")
+
+        self.assertEqual("mocked a", await fetch_mock("a"))
+        verify(fetch_mock)("a")
+
+
+class TestMockModule(TestCase):
+
+    def test_mock_module__functions_defined_in_module(self):
+        with tmock(json, type_safety=TypeSafety.RELAXED) as json_mock:
+            when(json_mock.dumps({"a": 1})).then_return("mocked")
+
+        self.assertEqual("mocked", json_mock.dumps({"a": 1}))
+        verify(json_mock).dumps({"a": 1})
+        self.assertFalse(hasattr(json_mock, "JSONDecoder"))
+
+    def test_mock_module__type_safety(self):
+        with self.assertRaises(MissingTypeHintsError):
+            tmock(sys.modules[__name__])
@@ -1,8 +1,12 @@
-from typing import Dict, Any, List
+import logging
+from collections.abc import Mapping
+from typing import Dict, Any, List, Iterator
 from unittest import TestCase
+from unittest.mock import patch
 
 from typemock import tmock, when, verify, match
-from typemock.api import NoBehaviourSpecifiedError
+from typemock.api import NoBehaviourSpecifiedError, TypeSafety
+from typemock._mock.methods import MockMethodState
 
 
 class NestedThing:
@@ -223,6 +227,38 @@ class TestBasicMethodMocking(TestCase):
 
                 verify(my_thing_mock).do_something_with_side_effects()
 
+    def test_mock__then_return_snapshot__responses_isolated(self):
+        for mocked_thing in mocked_things:
+            with self.subTest("{}".format(mocked_thing)):
+                expected_result = {"nested": [1, 2], "flat": "value"}
+
+                with tmock(mocked_thing) as my_thing_mock:
+                    when(my_thing_mock.method_with_standard_generic_args_and_return(
+                        list_arg=[],
+                        dict_arg={}
+                    )).then_return_snapshot(expected_result)
+
+                first = my_thing_mock.method_with_standard_generic_args_and_return(list_arg=[], dict_arg={})
+                first["nested"].append(3)
+                first["added"] = True
+                expected_result["flat"] = "changed"
+                second = my_thing_mock.method_with_standard_generic_args_and_return(list_arg=[], dict_arg={})
+
+                self.assertEqual({"nested": [1, 2], "flat": "value"}, second)
+
+    def test_mock__then_return_snapshot__copies_not_type_checked_again(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.method_with_standard_generic_args_and_return(
+                list_arg=[],
+                dict_arg={}
+            )).then_return_snapshot({"nested": [1, 2]})
+
+        with patch.object(MockMethodState, "_validate_return") as validate_return:
+            result = my_thing_mock.method_with_standard_generic_args_and_return(list_arg=[], dict_arg={})
+
+        self.assertEqual({"nested": [1, 2]}, result)
+        validate_return.assert_not_called()
+
     def test_mock__then_raise(self):
         for mocked_thing in mocked_things:
             with self.subTest("{}".format(mocked_thing)):
@@ -287,4 +323,154 @@ class TestBasicMethodMocking(TestCase):
 
             self.assertEqual("1", actual)
 
+    def test_mock__then_do__exact_args(self):
+
+        def bounce_back_handler(number: int):
+            return "{}".format(number)
+
+        for mocked_thing in mocked_things:
+            with self.subTest("{}".format(mocked_thing)):
+                with tmock(mocked_thing) as my_thing_mock:
+                    when(my_thing_mock.convert_int_to_str(1)).then_do(bounce_back_handler)
+
+                actual = my_thing_mock.convert_int_to_str(1)
+
+                self.assertEqual("1", actual)
+
 # TODO: We can still mock a context object - idea: setup can only happen on_first - successive contexts revert.
+
+
+class TestNoBehaviourMessage(TestCase):
+
+    def test_no_behaviour__closest_specified_args_hinted(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg("a", 1)).then_return("first")
+            when(my_thing_mock.multiple_arg("b", match.in_range(5, 6))).then_return("second")
+
+        with self.assertRaises(NoBehaviourSpecifiedError) as context:
+            my_thing_mock.multiple_arg("b", 2)
+
+        message = str(context.exception)
+        self.assertIn("closest", message)
+        self.assertIn("in_range(5, 6)", message)
+
+    def test_no_behaviour__large_args__message_bounded(self):
+        my_thing_mock = tmock(MyThing)
+
+        with self.assertRaises(NoBehaviourSpecifiedError) as context:
+            my_thing_mock.method_with_standard_generic_args_and_return(
+                list_arg=["x" * 10000] * 10000,
+                dict_arg={}
+            )
+
+        self.assertLess(len(str(context.exception)), 1000)
+
+
+class MyBaseService:
+
+    def fetch(self, path: str) -> str:
+        pass
+
+    def overridden(self, number: int) -> int:
+        pass
+
+    def hidden(self) -> str:
+        pass
+
+    @staticmethod
+    def parse(text: str) -> int:
+        pass
+
+    @classmethod
+    def create(cls, name: str) -> str:
+        pass
+
+
+class MyService(MyBaseService):
+
+    def overridden(self, number: int, other: int = 0) -> int:
+        pass
+
+    hidden: Any = None
+
+
+class MyMapping(Mapping):
+
+    def __getitem__(self, key: str) -> int:
+        pass
+
+    def __iter__(self) -> Iterator[str]:
+        pass
+
+    def __len__(self) -> int:
+        pass
+
+    def lookup(self, key: str) -> int:
+        pass
+
+
+class TestInheritedMethodMocking(TestCase):
+
+    def test_inherited_methods_mocked(self):
+        with tmock(MyService) as my_service_mock:
+            when(my_service_mock.fetch("a")).then_return("fetched a")
+
+        self.assertEqual("fetched a", my_service_mock.fetch("a"))
+        verify(my_service_mock).fetch("a")
+
+    def test_overridden_method__signature_of_override(self):
+        with tmock(MyService) as my_service_mock:
+            when(my_service_mock.overridden(1, other=2)).then_return(3)
+
+        self.assertEqual(3, my_service_mock.overridden(1, 2))
+
+    def test_method_hidden_by_override__not_mocked(self):
+        self.assertNotIn("hidden", tmock(MyService)._mock_method_states_by_name)
+
+    def test_staticmethod_and_classmethod(self):
+        with tmock(MyService) as my_service_mock:
+            when(my_service_mock.parse("1")).then_return(1)
+            when(my_service_mock.create("a")).then_return("created a")
+
+        self.assertEqual(1, my_service_mock.parse("1"))
+        self.assertEqual("created a", my_service_mock.create(name="a"))
+        verify(my_service_mock).parse("1")
+        verify(my_service_mock).create("a")
+
+    def test_standard_library_mixin_methods__not_mocked(self):
+        with tmock(MyMapping) as my_mapping_mock:
+            when(my_mapping_mock.lookup("a")).then_return(1)
+
+        self.assertEqual(1, my_mapping_mock.lookup("a"))
+        self.assertEqual(["lookup"], list(my_mapping_mock._mock_method_states_by_name))
+
+    def test_standard_library_class__mocked_with_its_standard_library_bases(self):
+        with tmock(logging.Logger, type_safety=TypeSafety.RELAXED) as logger_mock:
+            when(logger_mock.isEnabledFor(logging.INFO)).then_return(False)
+            when(logger_mock.filter(match.anything())).then_return(True)
+
+        self.assertFalse(logger_mock.isEnabledFor(logging.INFO))
+        self.assertTrue(logger_mock.filter(None))
+        verify(logger_mock).isEnabledFor(logging.INFO)
+
+    def test_method_added_to_base_after_mocking__mocked(self):
+        class MyLateBase:
+
+            def early(self) -> str:
+                pass
+
+        class MyLateService(MyLateBase):
+            pass
+
+        tmock(MyLateService)
+
+        def late(self, number: int) -> str:
+            pass
+
+        MyLateBase.late = late  # type: ignore
+
+        with tmock(MyLateService) as my_service_mock:
+            when(my_service_mock.late(1)).then_return("late")
+
+        self.assertEqual("late", my_service_mock.late(1))
+        self.assertEqual(["early", "late"], sorted(my_service_mock._mock_method_states_by_name))
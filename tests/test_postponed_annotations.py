@@ -0,0 +1,57 @@
+import sys
+from typing import Optional
+from unittest import TestCase, skipIf
+
+from typemock import tmock, when
+from typemock._utils import type_hints
+from typemock.api import MockTypeSafetyError, MissingTypeHintsError
+
+# Postponed annotations are a syntax error before python 3.7, so the annotated classes are kept in their own module.
+if sys.version_info >= (3, 7):
+    from tests.postponed_annotations_things import MyThing, Result, MyUnHintedThing
+
+
+@skipIf(sys.version_info < (3, 7), "Postponed annotations need python 3.7")
+class TestPostponedAnnotations(TestCase):
+
+    def test_hints_resolved(self):
+        self.assertEqual(
+            {"number": int, "return": str},
+            type_hints(MyThing.convert_int_to_str)
+        )
+        self.assertEqual({"a_hinted_attribute": Optional[Result]}, type_hints(MyThing))
+
+    def test_hints_resolved__cached(self):
+        self.assertIs(type_hints(MyThing.find), type_hints(MyThing.find))
+
+    def test_unresolvable_hint__left_as_is(self):
+        def method(self, number: int, thing: "NotDefinedAnywhere") -> str:  # noqa: F821
+            pass
+
+        self.assertEqual(
+            {"number": int, "thing": "NotDefinedAnywhere", "return": str},
+            type_hints(method)
+        )
+
+    def test_type_safety__args_and_returns(self):
+        result = Result()
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(1)).then_return("one")
+            when(my_thing_mock.find(["a"])).then_return(result)
+
+            with self.assertRaises(MockTypeSafetyError):
+                when(my_thing_mock.convert_int_to_str("1")).then_return("one")
+            with self.assertRaises(MockTypeSafetyError):
+                when(my_thing_mock.find(["a"])).then_return("not a result")
+
+        self.assertEqual("one", my_thing_mock.convert_int_to_str(1))
+        self.assertIs(result, my_thing_mock.find(["a"]))
+
+    def test_type_safety__attributes(self):
+        with tmock(MyThing) as my_thing_mock:
+            with self.assertRaises(MockTypeSafetyError):
+                when(my_thing_mock.a_hinted_attribute).then_return("not a result")
+
+    def test_missing_hints__still_missing(self):
+        with self.assertRaises(MissingTypeHintsError):
+            tmock(MyUnHintedThing)
@@ -0,0 +1,182 @@
+import time
+from unittest import TestCase, skipIf
+
+import trio
+
+from tests.test_async import async_test
+from typemock import tmock, when, calls, match
+from typemock.api import MockingError
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+
+class MyThing:
+
+    def fetch(self, path: str, size: int, retries: int = 0) -> str:
+        pass
+
+    name: str = "thing"
+
+
+class MyAsyncThing:
+
+    async def fetch(self, delay: float) -> str:
+        await trio.sleep(delay)
+        return "fetched"
+
+
+def called_mock():
+    with tmock(MyThing) as my_thing_mock:
+        when(my_thing_mock.fetch(match.anything(), match.anything(), match.anything())).then_return("ok")
+    my_thing_mock.fetch("/a", 5)
+    my_thing_mock.fetch("/a", 15, retries=1)
+    my_thing_mock.fetch("/b", 25)
+    my_thing_mock.fetch("/c", 12, 2)
+    return my_thing_mock
+
+
+class TestCallQuery(TestCase):
+
+    def test_count__all_calls(self):
+        my_thing_mock = called_mock()
+
+        self.assertEqual(4, calls(my_thing_mock).fetch.count())
+
+    def test_where__values_and_matchers(self):
+        my_thing_mock = called_mock()
+
+        self.assertEqual(2, calls(my_thing_mock).fetch.where(path="/a").count())
+        self.assertEqual(1, calls(my_thing_mock).fetch.where(path="/a", size=match.in_range(10)).count())
+        self.assertEqual(2, calls(my_thing_mock).fetch.where(retries=match.not_(0)).count())
+
+    def test_column__in_call_order(self):
+        my_thing_mock = called_mock()
+
+        query = calls(my_thing_mock).fetch.where(size=match.in_range(10))
+
+        self.assertEqual(["/a", "/b", "/c"], query.column("path"))
+        self.assertEqual([1, 0, 2], query.column("retries"))
+
+    def test_group_by(self):
+        my_thing_mock = called_mock()
+
+        self.assertEqual({"/a": 2, "/b": 1, "/c": 1}, calls(my_thing_mock).fetch.group_by("path"))
+
+    def test_histogram(self):
+        my_thing_mock = called_mock()
+
+        self.assertEqual({0: 1, 10: 2, 20: 1}, calls(my_thing_mock).fetch.histogram("size", 10))
+
+    def test_sequences__ordered(self):
+        my_thing_mock = called_mock()
+
+        sequences = calls(my_thing_mock).fetch.sequences()
+
+        self.assertEqual(4, len(sequences))
+        self.assertEqual(sorted(sequences), sequences)
+
+    def test_unknown_arg__error(self):
+        my_thing_mock = called_mock()
+
+        with self.assertRaises(MockingError):
+            calls(my_thing_mock).fetch.where(colour="red")
+
+    def test_not_a_method__error(self):
+        my_thing_mock = called_mock()
+
+        with self.assertRaises(MockingError):
+            calls(my_thing_mock).name
+
+    def test_not_a_mock__error(self):
+        with self.assertRaises(MockingError):
+            calls(MyThing())
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_array(self):
+        my_thing_mock = called_mock()
+
+        sizes = calls(my_thing_mock).fetch.array("size")
+
+        self.assertEqual(57, int(sizes.sum()))
+        self.assertEqual(numpy.int64, sizes.dtype)
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_array__of_matching_calls(self):
+        my_thing_mock = called_mock()
+
+        sizes = calls(my_thing_mock).fetch.where(path="/a").array("size")
+        paths = calls(my_thing_mock).fetch.where(path="/a").array("path")
+
+        self.assertEqual([5, 15], sizes.tolist())
+        self.assertEqual(["/a", "/a"], paths.tolist())
+
+
+class TestTimedCallQuery(TestCase):
+
+    def test_timestamps_and_durations__recorded_per_call(self):
+        with tmock(MyThing, timed=True) as my_thing_mock:
+            when(my_thing_mock.fetch("/a", 1)).then_return("ok")
+            when(my_thing_mock.fetch("/b", 1)).then_raise(IOError())
+        my_thing_mock.fetch("/a", 1)
+        my_thing_mock.fetch("/a", 1)
+        with self.assertRaises(IOError):
+            my_thing_mock.fetch("/b", 1)
+
+        fetches = calls(my_thing_mock).fetch
+
+        timestamps = fetches.timestamps()
+        self.assertEqual(3, len(timestamps))
+        self.assertEqual(sorted(timestamps), timestamps)
+        self.assertEqual(3, len(fetches.durations()))
+        self.assertEqual(2, len(fetches.where(path="/a").durations()))
+        self.assertTrue(all(duration >= 0 for duration in fetches.durations()))
+
+    @async_test
+    async def test_durations__include_awaiting_a_spied_method(self):
+        my_thing_spy = tmock(MyAsyncThing(), spy=True, timed=True)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(my_thing_spy.fetch, 0.05)
+            nursery.start_soon(my_thing_spy.fetch, 0.0)
+
+        fetches = calls(my_thing_spy).fetch
+        self.assertEqual(2, fetches.count())
+        for delay, duration in zip(fetches.column("delay"), fetches.durations()):
+            if delay > 0:
+                self.assertGreaterEqual(duration, delay)
+            else:
+                self.assertLess(duration, 0.05)
+
+    def test_durations__include_then_do(self):
+        with tmock(MyThing, timed=True) as my_thing_mock:
+            when(my_thing_mock.fetch("/slow", 1)).then_do(lambda *args: time.sleep(0.01) or "ok")
+            when(my_thing_mock.fetch("/fast", 1)).then_return("ok")
+        my_thing_mock.fetch("/slow", 1)
+        my_thing_mock.fetch("/fast", 1)
+
+        fetches = calls(my_thing_mock).fetch
+
+        self.assertGreaterEqual(fetches.where(path="/slow").duration_percentile(50), 0.01)
+        self.assertLess(fetches.where(path="/fast").duration_percentile(50), 0.01)
+        self.assertGreaterEqual(fetches.duration_percentile(100), 0.01)
+
+    def test_rate(self):
+        with tmock(MyThing, timed=True) as my_thing_mock:
+            when(my_thing_mock.fetch("/a", 1)).then_return("ok")
+        my_thing_mock.fetch("/a", 1)
+        time.sleep(0.01)
+        my_thing_mock.fetch("/a", 1)
+
+        rate = calls(my_thing_mock).fetch.rate()
+
+        self.assertGreater(rate, 0)
+        self.assertLessEqual(rate, 100)
+
+    def test_not_timed__error(self):
+        my_thing_mock = called_mock()
+
+        with self.assertRaises(MockingError):
+            calls(my_thing_mock).fetch.durations()
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from typemock import tmock, when, verify, reset, MockPool
+from typemock.api import NoBehaviourSpecifiedError, VerifyError, MockingError
+
+
+class MyThing:
+    name: str = "initial"
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+
+class TestReset(TestCase):
+
+    def test_reset__clears_behaviour_and_interactions(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(1)).then_return("one")
+            when(my_thing_mock.name).then_return("mocked")
+
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.name = "set"
+
+        reset(my_thing_mock)
+
+        with self.assertRaises(VerifyError):
+            verify(my_thing_mock).convert_int_to_str(1)
+        with self.assertRaises(VerifyError):
+            verify(my_thing_mock).name = "set"
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            my_thing_mock.convert_int_to_str(1)
+        self.assertEqual("initial", my_thing_mock.name)
+
+    def test_reset__interactions_only__rewinds_behaviour(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(1)).then_return_many(["first", "second"])
+
+        self.assertEqual("first", my_thing_mock.convert_int_to_str(1))
+
+        reset(my_thing_mock, behaviour=False)
+
+        verify(my_thing_mock, exactly=0).convert_int_to_str(1)
+        self.assertEqual("first", my_thing_mock.convert_int_to_str(1))
+
+    def test_reset__not_a_mock__error(self):
+        with self.assertRaises(MockingError):
+            reset(MyThing())
+
+
+class TestMockPool(TestCase):
+
+    def test_pool__released_mock_reused_and_reset(self):
+        pool = MockPool()
+        first = pool.tmock(MyThing)
+        with first:
+            when(first.convert_int_to_str(1)).then_return("one")
+        first.convert_int_to_str(1)
+
+        pool.release_all()
+        second = pool.tmock(MyThing)
+
+        self.assertIs(first, second)
+        verify(second, exactly=0).convert_int_to_str(1)
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            second.convert_int_to_str(1)
+
+    def test_pool__mocks_in_use_not_handed_out(self):
+        pool = MockPool()
+
+        first = pool.tmock(MyThing)
+        second = pool.tmock(MyThing)
+
+        self.assertIsNot(first, second)
+        pool.release(second)
+        self.assertIs(second, pool.tmock(MyThing))
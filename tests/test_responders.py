@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from typemock._mock.methods import CallCount, MethodResponseBuilder
+from typemock._mock.responders import ResponderSnapshot, ResponderBasic, ResponderMany
+
+
+class Custom:
+
+    def __init__(self):
+        self.items = [1]
+
+
+class TestResponderSnapshot(TestCase):
+
+    def test_response__mutable_members_are_copied__immutable_members_shared(self):
+        shared_str = "a" * 100
+        responder = ResponderSnapshot({"rows": [[1, 2], (3, [4])], "name": shared_str, "tags": {"x"}})
+
+        first = responder.response()
+        second = responder.response()
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first["rows"][0], second["rows"][0])
+        self.assertIsNot(first["rows"][1][1], second["rows"][1][1])
+        self.assertIsNot(first["tags"], second["tags"])
+        self.assertIs(first["name"], second["name"])
+
+    def test_response__unknown_objects__deep_copied(self):
+        responder = ResponderSnapshot([Custom()])
+
+        first = responder.response()
+        first[0].items.append(2)
+
+        self.assertEqual([1], responder.response()[0].items)
+
+    def test_response__self_referencing_and_shared_containers__same_shape(self):
+        cyclic = [1]
+        cyclic.append(cyclic)
+        shared = {"a": [1]}
+        responder = ResponderSnapshot({"cyclic": cyclic, "shared": (shared, shared)})
+
+        first = responder.response()
+        second = responder.response()
+
+        self.assertIs(first["cyclic"], first["cyclic"][1])
+        self.assertIs(first["shared"][0], first["shared"][1])
+        self.assertIsNot(first["cyclic"], second["cyclic"])
+        self.assertIsNot(first["shared"][0], second["shared"][0])
+
+
+class TestCompactRecords(TestCase):
+
+    def test_records_have_no_instance_dict(self):
+        records = [
+            CallCount((), 1, 0, None),
+            MethodResponseBuilder(None),
+            ResponderBasic(1),
+            ResponderMany([1], loop=False),
+            ResponderSnapshot([1]),
+        ]
+        for record in records:
+            with self.subTest(record.__class__.__name__):
+                self.assertFalse(hasattr(record, "__dict__"))
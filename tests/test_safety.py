@@ -1,6 +1,10 @@
-from unittest import TestCase
+import gc
+import sys
+from unittest import TestCase, skipIf
+from unittest.mock import patch
 
-from typemock import tmock, when
+from typemock import tmock, when, validate_module_type_hints
+from typemock._safety import get_missing_class_type_hints, _validation_cache
 from typemock.api import MemberType, MissingHint, MissingTypeHintsError, MockTypeSafetyError, TypeSafety
 
 
@@ -209,3 +213,58 @@ class TestTypeSafetyNoResponseIsNone(TestCase):
         with self.assertRaises(MockTypeSafetyError):
             with tmock(ClassWithNoResponseType, type_safety=TypeSafety.NO_RETURN_IS_NONE_RETURN) as my_mock:
                 when(my_mock.method_with_missing_return_type()).then_return("Something")
+
+
+class TestValidationCache(TestCase):
+
+    def test_validate_class_type_hints__cached_per_safety_level(self):
+        class Cached:
+
+            def method_with_missing_return_type(self, number: int):
+                pass
+
+        with patch("typemock._safety.get_missing_class_type_hints", wraps=get_missing_class_type_hints) as validate:
+            for _ in range(3):
+                tmock(Cached, type_safety=TypeSafety.NO_RETURN_IS_NONE_RETURN)
+                with self.assertRaises(MissingTypeHintsError):
+                    tmock(Cached, type_safety=TypeSafety.STRICT)
+
+        self.assertEqual(2, validate.call_count)
+
+    def test_validate_class_type_hints__dropped_with_class(self):
+        class Discarded:
+
+            def method(self) -> None:
+                pass
+
+        tmock(Discarded)
+        self.assertIn(Discarded, _validation_cache)
+
+        del Discarded
+        gc.collect()
+
+        self.assertFalse(any(clazz.__name__ == "Discarded" for clazz in _validation_cache.keys()))
+
+
+class TestValidateModuleTypeHints(TestCase):
+
+    def test_validate_module_type_hints__reports_all_classes(self):
+        report = validate_module_type_hints(__name__)
+
+        self.assertEqual(
+            [MissingHint(['method_with_missing_return_type'], MemberType.RETURN)],
+            report[ClassWithNoResponseType]
+        )
+        self.assertIn(ClassWithMultipleUnHintedThings, report)
+        self.assertNotIn(MyThing, report)
+        self.assertNotIn(TestCase, report)
+
+    @skipIf(sys.version_info < (3, 7), "The tests package holds postponed annotations, which need python 3.7")
+    def test_validate_module_type_hints__package(self):
+        report = validate_module_type_hints("tests", type_safety=TypeSafety.NO_RETURN_IS_NONE_RETURN)
+
+        self.assertNotIn(ClassWithNoResponseType, report)
+        self.assertIn(ClassWithMultipleUnHintedThings, report)
+
+    def test_validate_module_type_hints__relaxed(self):
+        self.assertEqual({}, validate_module_type_hints(__name__, type_safety=TypeSafety.RELAXED))
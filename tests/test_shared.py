@@ -0,0 +1,116 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase
+
+from typemock import tmock, when, verify, share, stub, match
+from typemock.api import MockingError, VerifyError
+
+
+class MyThing:
+    an_attribute: str = "initial"
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def next_id(self) -> int:
+        pass
+
+
+def convert_int_to_str(number: int) -> str:
+    return str(number)
+
+
+def _convert_all(my_thing: MyThing, numbers: range) -> list:
+    return [my_thing.convert_int_to_str(number) for number in numbers]
+
+
+def _next_ids(my_thing: MyThing, count: int) -> list:
+    return [my_thing.next_id() for _ in range(count)]
+
+
+def _get_and_set(my_thing: MyThing, value: str) -> str:
+    current = my_thing.an_attribute
+    my_thing.an_attribute = value
+    return current
+
+
+def _call_function(convert_mock, number: int) -> str:
+    return convert_mock(number)
+
+
+class TestSharedMocks(TestCase):
+
+    def setUp(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("something")
+            when(my_thing_mock.convert_int_to_str(1)).then_return("one")
+        self.my_thing_mock = my_thing_mock
+
+    def test_workers_respond_and_parent_verifies(self):
+        with share(self.my_thing_mock, batch_size=7):
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(_convert_all, [self.my_thing_mock] * 4, [range(10)] * 4))
+
+        for result in results:
+            self.assertEqual(["something", "one"] + ["something"] * 8, result)
+        verify(self.my_thing_mock, exactly=4).convert_int_to_str(1)
+        verify(self.my_thing_mock, exactly=40).convert_int_to_str(match.anything())
+        verify(self.my_thing_mock, exactly=0).convert_int_to_str(10)
+
+    def test_series_of_responses_are_shared(self):
+        stub(self.my_thing_mock).next_id().then_return_many(list(range(12)))
+        self.assertEqual(0, self.my_thing_mock.next_id())
+
+        with share(self.my_thing_mock):
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(_next_ids, [self.my_thing_mock] * 2, [4, 4]))
+            self.assertEqual(9, self.my_thing_mock.next_id())
+
+        self.assertEqual(list(range(1, 9)), sorted(results[0] + results[1]))
+        self.assertEqual(10, self.my_thing_mock.next_id())
+        verify(self.my_thing_mock, exactly=11).next_id()
+
+    def test_attributes(self):
+        with share(self.my_thing_mock):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                results = list(executor.map(_get_and_set, [self.my_thing_mock] * 2, ["a", "b"]))
+
+        self.assertEqual(["initial", "a"], results)
+        verify(self.my_thing_mock, exactly=2).an_attribute
+        verify(self.my_thing_mock).an_attribute = "a"
+        verify(self.my_thing_mock).an_attribute = "b"
+        self.assertEqual("initial", self.my_thing_mock.an_attribute)
+
+    def test_function(self):
+        with tmock(convert_int_to_str) as convert_mock:
+            when(convert_mock(1)).then_return("one")
+
+        with share(convert_mock):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                self.assertEqual("one", executor.submit(_call_function, convert_mock, 1).result())
+
+        verify(convert_mock)(1)
+
+    def test_unpickled_in_the_same_process_is_the_mock(self):
+        with share(self.my_thing_mock) as shared:
+            self.assertIs(self.my_thing_mock, pickle.loads(pickle.dumps(self.my_thing_mock)))
+            self.my_thing_mock.convert_int_to_str(1)
+            shared.sync()
+            verify(self.my_thing_mock).convert_int_to_str(1)
+
+        with self.assertRaises(Exception):
+            pickle.dumps(self.my_thing_mock)
+
+    def test_only_closed_mocks_are_shared(self):
+        with self.assertRaises(MockingError):
+            share(MyThing())
+        with self.my_thing_mock:
+            with self.assertRaises(MockingError):
+                share(self.my_thing_mock)
+
+    def test_nothing_recorded_without_calls(self):
+        with share(self.my_thing_mock):
+            pass
+
+        with self.assertRaises(VerifyError):
+            verify(self.my_thing_mock).convert_int_to_str(1)
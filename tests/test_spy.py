@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from typemock import tmock, when, verify
+from typemock.api import MockingError, MockTypeSafetyError
+from tests.test_async import async_test
+
+
+class MyThing:
+    name: str = "real name"
+
+    def expensive(self, number: int) -> str:
+        return "real {}".format(number)
+
+    def cheap(self, number: int) -> int:
+        return number * 2
+
+    async def fetch(self, key: str) -> str:
+        return "real {}".format(key)
+
+
+class TestSpy(TestCase):
+
+    def test_spy__unstubbed_calls_pass_through(self):
+        with tmock(MyThing(), spy=True) as my_thing_spy:
+            when(my_thing_spy.expensive(1)).then_return("stubbed")
+
+        self.assertEqual("stubbed", my_thing_spy.expensive(1))
+        self.assertEqual("real 2", my_thing_spy.expensive(2))
+        self.assertEqual(6, my_thing_spy.cheap(3))
+
+        verify(my_thing_spy).expensive(2)
+        verify(my_thing_spy, exactly=1).cheap(3)
+
+    def test_spy__stubbed_calls_are_type_checked(self):
+        with tmock(MyThing(), spy=True) as my_thing_spy:
+            when(my_thing_spy.expensive(1)).then_return("stubbed")
+
+        with self.assertRaises(MockTypeSafetyError):
+            # Equal to the stubbed call.
+            my_thing_spy.expensive(1.0)
+        self.assertEqual("real 2.0", my_thing_spy.expensive(2.0))
+
+    def test_spy__attributes_pass_through(self):
+        real = MyThing()
+        my_thing_spy = tmock(real, spy=True)
+
+        self.assertEqual("real name", my_thing_spy.name)
+
+        my_thing_spy.name = "changed"
+
+        self.assertEqual("changed", real.name)
+        self.assertEqual("changed", my_thing_spy.name)
+        verify(my_thing_spy).name = "changed"
+
+    def test_spy__class__error(self):
+        with self.assertRaises(MockingError):
+            tmock(MyThing, spy=True)
+
+    @async_test
+    async def test_spy__async_calls_pass_through(self):
+        with tmock(MyThing(), spy=True) as my_thing_spy:
+            when(await my_thing_spy.fetch("a")).then_return("stubbed")
+
+        self.assertEqual("stubbed", await my_thing_spy.fetch("a"))
+        self.assertEqual("real b", await my_thing_spy.fetch("b"))
+        verify(my_thing_spy).fetch("b")
@@ -0,0 +1,79 @@
+from typing import Iterator, AsyncIterator
+from unittest import TestCase
+
+from typemock import tmock, when, verify
+from typemock.api import MockTypeSafetyError
+from tests.test_async import async_test
+
+
+class MyReader:
+
+    def read_rows(self, table: str) -> Iterator[int]:
+        pass
+
+    def read_name(self) -> str:
+        pass
+
+    async def read_rows_async(self, table: str) -> AsyncIterator[int]:
+        pass
+
+
+def count_to(limit: int):
+    def source(table: str):
+        for i in range(limit):
+            yield i
+
+    return source
+
+
+class TestStreamMocking(TestCase):
+
+    def test_stream__items_yielded_lazily(self):
+        pulled = []
+
+        def source(table: str):
+            for i in range(3):
+                pulled.append(i)
+                yield i
+
+        with tmock(MyReader) as my_reader_mock:
+            when(my_reader_mock.read_rows("t")).then_stream(source)
+
+        stream = my_reader_mock.read_rows("t")
+
+        self.assertEqual([], pulled)
+        self.assertEqual(0, next(stream))
+        self.assertEqual([0], pulled)
+        self.assertEqual([1, 2], list(stream))
+        verify(my_reader_mock).read_rows("t")
+
+    def test_stream__fresh_stream_per_call(self):
+        with tmock(MyReader) as my_reader_mock:
+            when(my_reader_mock.read_rows("t")).then_stream(count_to(2))
+
+        self.assertEqual([0, 1], list(my_reader_mock.read_rows("t")))
+        self.assertEqual([0, 1], list(my_reader_mock.read_rows("t")))
+
+    def test_stream__item_of_wrong_type__error_when_yielded(self):
+        with tmock(MyReader) as my_reader_mock:
+            when(my_reader_mock.read_rows("t")).then_stream(lambda table: iter([1, "two"]))
+
+        stream = my_reader_mock.read_rows("t")
+
+        self.assertEqual(1, next(stream))
+        with self.assertRaises(MockTypeSafetyError):
+            next(stream)
+
+    def test_stream__not_an_iterator_return__error(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(MyReader) as my_reader_mock:
+                when(my_reader_mock.read_name()).then_stream(count_to(2))
+
+    @async_test
+    async def test_stream__async_iterator(self):
+        with tmock(MyReader) as my_reader_mock:
+            when(await my_reader_mock.read_rows_async("t")).then_stream(count_to(3))
+
+        actual = [row async for row in await my_reader_mock.read_rows_async("t")]
+
+        self.assertEqual([0, 1, 2], actual)
@@ -0,0 +1,107 @@
+from unittest import TestCase
+
+from tests.test_async import async_test
+from typemock import tmock, when, stub, verify, match
+from typemock.api import MockTypeSafetyError, MockingError, NoBehaviourSpecifiedError
+
+
+class MyThing:
+    an_attribute: str = "initial"
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def concat(self, prefix: str, number: int = 1) -> str:
+        pass
+
+    async def fetch(self, path: str) -> str:
+        pass
+
+
+def convert_int_to_str(number: int) -> str:
+    return str(number)
+
+
+class TestStub(TestCase):
+
+    def test_stub_methods_without_a_context(self):
+        my_mock = tmock(MyThing)
+
+        stub(my_mock).convert_int_to_str(1).then_return("one")
+        stub(my_mock.convert_int_to_str)(2).then_return("two")
+        when(stub(my_mock).concat("#", number=match.anything())).then_return("#something")
+
+        self.assertEqual("one", my_mock.convert_int_to_str(1))
+        self.assertEqual("two", my_mock.convert_int_to_str(2))
+        self.assertEqual("#something", my_mock.concat("#", 3))
+        verify(my_mock).convert_int_to_str(1)
+
+    def test_restub_between_calls(self):
+        with tmock(MyThing) as my_mock:
+            when(my_mock.convert_int_to_str(1)).then_return("one")
+
+        self.assertEqual("one", my_mock.convert_int_to_str(1))
+
+        stub(my_mock).convert_int_to_str(1).then_return("uno")
+
+        self.assertEqual("uno", my_mock.convert_int_to_str(1))
+        verify(my_mock, exactly=2).convert_int_to_str(1)
+
+    def test_stub_attribute(self):
+        my_mock = tmock(MyThing)
+
+        self.assertEqual("initial", my_mock.an_attribute)
+
+        stub(my_mock).an_attribute.then_return_many(["first", "second"])
+
+        self.assertEqual("first", my_mock.an_attribute)
+        self.assertEqual("second", my_mock.an_attribute)
+
+    def test_stub_function(self):
+        convert_mock = tmock(convert_int_to_str)
+
+        stub(convert_mock)(1).then_return("one")
+
+        self.assertEqual("one", convert_mock(1))
+
+    @async_test
+    async def test_stub_async_method__without_await(self):
+        my_mock = tmock(MyThing)
+
+        stub(my_mock).fetch("a").then_return("fetched")
+
+        self.assertEqual("fetched", await my_mock.fetch("a"))
+
+    def test_stub_is_type_safe(self):
+        my_mock = tmock(MyThing)
+
+        with self.assertRaises(MockTypeSafetyError):
+            stub(my_mock).convert_int_to_str("1").then_return("one")
+        with self.assertRaises(MockTypeSafetyError):
+            stub(my_mock).convert_int_to_str(1).then_return(1)
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            my_mock.convert_int_to_str(1)
+
+    def test_stub_only_mocks(self):
+        my_mock = tmock(MyThing)
+
+        with self.assertRaises(MockingError):
+            stub(MyThing())
+        with self.assertRaises(MockingError):
+            stub(my_mock).not_a_member
+        with self.assertRaises(MockingError):
+            stub(my_mock)(1)
+
+    def test_context_switches_type_only_while_open(self):
+        my_mock = tmock(MyThing)
+        closed_type = type(my_mock)
+
+        with my_mock:
+            self.assertTrue(my_mock.is_open())
+            self.assertIsNot(closed_type, type(my_mock))
+            when(my_mock.an_attribute).then_return("specified")
+
+        self.assertFalse(my_mock.is_open())
+        self.assertIs(closed_type, type(my_mock))
+        self.assertIsInstance(my_mock, MyThing)
+        self.assertEqual("specified", my_mock.an_attribute)
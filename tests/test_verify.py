@@ -1,3 +1,4 @@
+from typing import Optional
 from unittest import TestCase
 
 from typemock import tmock, when, verify, match
@@ -20,6 +21,10 @@ class MyThing:
         pass
 
 
+class MyOptionalThing:
+    name: Optional[str] = None
+
+
 class TestMockVerify(TestCase):
 
     def test_verify__at_least__no_calls__verify_error(self):
@@ -158,3 +163,52 @@ class TestMockVerify(TestCase):
 
         with self.assertRaises(VerifyError):
             verify(my_thing_mock).some_instance_attribute = match.anything()
+
+    def test_verify__captor(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("something")
+
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.some_instance_attribute = "bye"
+
+        numbers = match.captor()
+        verify(my_thing_mock).convert_int_to_str(numbers)
+        values = match.captor()
+        verify(my_thing_mock).some_instance_attribute = values
+
+        self.assertEqual([1], numbers.values)
+        self.assertEqual(["bye"], values.values)
+
+    def test_verify__objects_reused_per_exactly(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("something")
+
+        my_thing_mock.convert_int_to_str(1)
+
+        self.assertIs(verify(my_thing_mock), verify(my_thing_mock))
+        self.assertIsNot(verify(my_thing_mock), verify(my_thing_mock, exactly=1))
+        verify(my_thing_mock).convert_int_to_str(1)
+        verify(my_thing_mock).convert_int_to_str(1)
+        with self.assertRaises(VerifyError):
+            verify(my_thing_mock, exactly=2).convert_int_to_str(1)
+
+    def test_verify__large_args__message_bounded(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(match.anything(), match.anything())).then_return("something")
+
+        my_thing_mock.multiple_arg("x" * 100000, 1)
+
+        with self.assertRaises(VerifyError) as context:
+            verify(my_thing_mock).multiple_arg("y" * 100000, 1)
+
+        self.assertLess(len(str(context.exception)), 2000)
+
+    def test_verify__attribute_first_set_to_none__first_other_set_reported(self):
+        my_thing_mock = tmock(MyOptionalThing)
+        my_thing_mock.name = None
+        my_thing_mock.name = "b"
+
+        with self.assertRaises(VerifyError) as context:
+            verify(my_thing_mock).name = "c"
+
+        self.assertIn("2 other interaction(s):\n\n[\n    None\n...", str(context.exception))
@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from typemock import tmock, when, verify_all, match
+from typemock.api import VerifyError, MockingError
+
+
+class MyThing:
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def sum_list(self, numbers: list) -> int:
+        pass
+
+
+def called_mock():
+    with tmock(MyThing) as my_thing_mock:
+        when(my_thing_mock.convert_int_to_str(match.anything())).then_return("something")
+        when(my_thing_mock.sum_list(match.anything())).then_return(1)
+    for number in [1, 2, 2, 3, 3, 3]:
+        my_thing_mock.convert_int_to_str(number)
+    my_thing_mock.sum_list([1, 2])
+    return my_thing_mock
+
+
+class TestVerifyAll(TestCase):
+
+    def test_verify_all__all_expectations_met(self):
+        my_thing_mock = called_mock()
+
+        with verify_all() as expected:
+            expected.verify(my_thing_mock).convert_int_to_str(1)
+            expected.verify(my_thing_mock, exactly=2).convert_int_to_str(2)
+            expected.verify(my_thing_mock, exactly=3).convert_int_to_str(3)
+            expected.verify(my_thing_mock, exactly=0).convert_int_to_str(4)
+            expected.verify(my_thing_mock, exactly=5).convert_int_to_str(match.in_range(2, 3))
+            expected.verify(my_thing_mock).sum_list([1, 2])
+
+    def test_verify_all__mismatches__all_reported_together(self):
+        my_thing_mock = called_mock()
+
+        expected = verify_all()
+        expected.verify(my_thing_mock).convert_int_to_str(1)
+        expected.verify(my_thing_mock, exactly=1).convert_int_to_str(2)
+        expected.verify(my_thing_mock).convert_int_to_str(4)
+        expected.verify(my_thing_mock).sum_list([2])
+
+        with self.assertRaises(VerifyError) as context:
+            expected.check()
+
+        message = str(context.exception)
+        self.assertIn("3 of 4", message)
+        self.assertIn("There were 2", message)
+        self.assertIn("There were 0", message)
+
+    def test_verify_all__captor__sees_every_call(self):
+        my_thing_mock = called_mock()
+        numbers = match.captor()
+
+        with verify_all() as expected:
+            expected.verify(my_thing_mock, exactly=6).convert_int_to_str(numbers)
+
+        self.assertEqual([1, 2, 2, 3, 3, 3], numbers.values)
+
+    def test_verify_all__not_a_mock__error(self):
+        with self.assertRaises(MockingError):
+            verify_all().verify(MyThing())
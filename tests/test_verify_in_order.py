@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from typemock import tmock, when, in_order, match
+from typemock.api import VerifyError, MockingError
+
+
+class MyReader:
+
+    def read(self, key: str) -> str:
+        pass
+
+
+class MyWriter:
+
+    def open(self) -> None:
+        pass
+
+    def write(self, value: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def mocks():
+    with tmock(MyReader) as reader_mock:
+        when(reader_mock.read(match.anything())).then_return("value")
+    with tmock(MyWriter) as writer_mock:
+        when(writer_mock.open()).then_return(None)
+        when(writer_mock.write(match.anything())).then_return(None)
+        when(writer_mock.close()).then_return(None)
+    return reader_mock, writer_mock
+
+
+def copy(reader: MyReader, writer: MyWriter, keys):
+    writer.open()
+    for key in keys:
+        writer.write(reader.read(key))
+    writer.close()
+
+
+class TestVerifyInOrder(TestCase):
+
+    def test_in_order__across_mocks(self):
+        reader_mock, writer_mock = mocks()
+
+        copy(reader_mock, writer_mock, ["a", "b"])
+
+        ordered = in_order(reader_mock, writer_mock)
+        ordered.verify(writer_mock).open()
+        ordered.verify(reader_mock).read("a")
+        ordered.verify(writer_mock).write("value")
+        ordered.verify(reader_mock).read("b")
+        ordered.verify(writer_mock).close()
+
+    def test_in_order__out_of_order__verify_error(self):
+        reader_mock, writer_mock = mocks()
+
+        copy(reader_mock, writer_mock, ["a"])
+
+        ordered = in_order(reader_mock, writer_mock)
+        ordered.verify(writer_mock).close()
+        with self.assertRaises(VerifyError):
+            ordered.verify(reader_mock).read("a")
+
+    def test_in_order__exactly(self):
+        reader_mock, writer_mock = mocks()
+
+        copy(reader_mock, writer_mock, ["a", "b", "c"])
+
+        ordered = in_order(writer_mock)
+        ordered.verify(writer_mock).open()
+        ordered.verify(writer_mock, exactly=3).write(match.anything())
+        ordered.verify(writer_mock, exactly=0).write(match.anything())
+        ordered.verify(writer_mock).close()
+
+        with self.assertRaises(VerifyError):
+            in_order(writer_mock).verify(writer_mock, exactly=2).write(match.anything())
+
+    def test_in_order__mock_not_given__error(self):
+        reader_mock, writer_mock = mocks()
+
+        with self.assertRaises(MockingError):
+            in_order(reader_mock).verify(writer_mock)
@@ -1,23 +1,71 @@
-from typing import TypeVar, Type, Union
+from types import ModuleType
+from typing import TypeVar, Type, Union, Any, Dict, List
 
 from typemock._mock import (
     _tmock,
-    _when
+    _when,
+    _reset,
+    _fork
 )
-from typemock._verify import _verify
-from typemock.api import TypeSafety, ResponseBuilder
+from typemock._mock.pool import MockPool  # noqa: F401
+from typemock._mock.shared import _share, SharedMocks
+from typemock._query import _calls
+from typemock._safety import _validate_module_type_hints
+from typemock._stub import _stub
+from typemock._verify import _verify, _in_order, _InOrder, _verify_all, _BulkVerify
+from typemock.api import TypeSafety, ResponseBuilder, MissingHint
 
 T = TypeVar('T')
 R = TypeVar('R')
 
 
-def tmock(clazz: Union[Type[T], T], type_safety: TypeSafety = TypeSafety.STRICT) -> T:
-    return _tmock(clazz=clazz, type_safety=type_safety)
+def tmock(
+        clazz: Union[Type[T], T],
+        type_safety: TypeSafety = TypeSafety.STRICT,
+        spy: bool = False,
+        timed: bool = False
+) -> T:
+    return _tmock(clazz=clazz, type_safety=type_safety, spy=spy, timed=timed)
 
 
 def when(mock_call_result: R) -> ResponseBuilder[R]:
     return _when(mock_call_result=mock_call_result)
 
 
+def stub(mock: T) -> T:
+    return _stub(mock)
+
+
 def verify(mock: T, exactly: int = -1) -> T:
     return _verify(mock=mock, exactly=exactly)
+
+
+def reset(mock: T, behaviour: bool = True, interactions: bool = True) -> None:
+    _reset(mock=mock, behaviour=behaviour, interactions=interactions)
+
+
+def fork(mock: T) -> T:
+    return _fork(mock)
+
+
+def share(*mocks: Any, batch_size: int = 100) -> SharedMocks:
+    return _share(*mocks, batch_size=batch_size)
+
+
+def in_order(*mocks: Any) -> _InOrder:
+    return _in_order(*mocks)
+
+
+def verify_all() -> _BulkVerify:
+    return _verify_all()
+
+
+def calls(mock: Any) -> Any:
+    return _calls(mock)
+
+
+def validate_module_type_hints(
+        module: Union[ModuleType, str],
+        type_safety: TypeSafety = TypeSafety.STRICT
+) -> Dict[type, List[MissingHint]]:
+    return _validate_module_type_hints(module=module, type_safety=type_safety)
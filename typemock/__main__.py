@@ -0,0 +1,5 @@
+import sys
+
+from typemock._cli import main
+
+sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Command line validation of the type hints of every class in a package, so that CI can check that they can be mocked.
+
+Examples:
+
+    python -m typemock my_package --report typemock-report.json --incremental
+
+"""
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import pkgutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any, Iterable
+
+from typemock._safety import get_missing_class_type_hints, module_classes
+from typemock._utils import try_instantiate_class
+from typemock.api import TypeSafety
+
+ModuleReport = Dict[str, Any]
+
+
+def module_sources(package: str) -> Dict[str, Optional[str]]:
+    """
+    Finds the modules of a package, and their source files, importing only the packages themselves.
+
+    Returns:
+
+        sources:
+
+            The source file of each module by name, or None if it has no source file.
+
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ValueError("Could not find package: {}".format(package))
+    sources = {package: spec.origin if spec.has_location else None}
+    if spec.submodule_search_locations is not None:
+        for module_info in pkgutil.iter_modules(spec.submodule_search_locations, prefix=package + "."):
+            if module_info.ispkg:
+                sources.update(module_sources(module_info.name))
+            else:
+                module_spec = importlib.util.find_spec(module_info.name)
+                has_location = module_spec is not None and module_spec.has_location
+                sources[module_info.name] = module_spec.origin if has_location else None  # type: ignore
+    return sources
+
+
+def source_hash(source: Optional[str]) -> Optional[str]:
+    if source is None or not os.path.isfile(source):
+        return None
+    with open(source, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+
+def validate_module(module_name: str, type_safety_name: str) -> Tuple[str, ModuleReport]:
+    """
+    Imports a module and finds the missing type hints of each class defined in it.
+
+    This runs in a worker process, so takes and returns only simple values.
+    """
+    type_safety = TypeSafety[type_safety_name]
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as e:
+        return module_name, {"error": "{}: {}".format(e.__class__.__name__, e), "classes": {}}
+    classes: Dict[str, List[Dict[str, Any]]] = {}
+    for clazz in module_classes(module):
+        missing = get_missing_class_type_hints(clazz, try_instantiate_class(clazz), type_safety)
+        if len(missing) > 0:
+            classes[clazz.__qualname__] = [
+                {"path": missing_hint.path, "member_type": missing_hint.member_type} for missing_hint in missing
+            ]
+    return module_name, {"error": None, "classes": classes}
+
+
+def _previous_modules(report_path: Optional[str], type_safety: TypeSafety) -> Dict[str, ModuleReport]:
+    if report_path is None or not os.path.isfile(report_path):
+        return {}
+    try:
+        with open(report_path) as report_file:
+            previous = json.load(report_file)
+    except ValueError:
+        return {}
+    if previous.get("type_safety") != type_safety.name:
+        return {}
+    return previous.get("modules", {})
+
+
+def validate_package(
+        package: str,
+        type_safety: TypeSafety = TypeSafety.STRICT,
+        workers: Optional[int] = None,
+        previous_modules: Optional[Dict[str, ModuleReport]] = None
+) -> Dict[str, Any]:
+    """
+    Validates the type hints of every class in a package, spreading the modules over a pool of processes.
+
+    Args:
+        package:
+        type_safety:
+        workers:
+
+            The number of processes to use. Defaults to the number of CPUs. With 1, modules are validated in this
+            process.
+
+        previous_modules:
+
+            The modules of a previous report. Modules whose source has the same hash are not validated again.
+
+    Returns:
+
+        report:
+
+            The type safety, and for each module its source hash, any error importing it, and the missing hints of
+            each of its classes which have any.
+
+    """
+    previous_modules = previous_modules or {}
+    modules: Dict[str, ModuleReport] = {}
+    to_validate = []
+    for module_name, source in sorted(module_sources(package).items()):
+        module_hash = source_hash(source)
+        previous = previous_modules.get(module_name)
+        if module_hash is not None and previous is not None and previous.get("hash") == module_hash:
+            modules[module_name] = previous
+        else:
+            modules[module_name] = {"hash": module_hash}
+            to_validate.append(module_name)
+    type_safety_names = [type_safety.name] * len(to_validate)
+    if workers == 1 or len(to_validate) <= 1:
+        results: Iterable[Tuple[str, ModuleReport]] = list(map(validate_module, to_validate, type_safety_names))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate_module, to_validate, type_safety_names))
+    for module_name, module_report in results:
+        modules[module_name].update(module_report)
+    return {"type_safety": type_safety.name, "modules": modules}
+
+
+def report_failed(report: Dict[str, Any]) -> bool:
+    return any(
+        module_report["error"] is not None or len(module_report["classes"]) > 0
+        for module_report in report["modules"].values()
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="typemock",
+        description="Checks that every class in a package has the type hints needed to be mocked."
+    )
+    parser.add_argument("package", help="The name of the package to validate, which must be importable.")
+    parser.add_argument(
+        "--type-safety",
+        choices=[type_safety.name for type_safety in TypeSafety if type_safety != TypeSafety.RELAXED],
+        default=TypeSafety.STRICT.name
+    )
+    parser.add_argument("--workers", type=int, default=None, help="The number of processes. Defaults to the CPUs.")
+    parser.add_argument("--report", default=None, help="The file to write the JSON report to, instead of stdout.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only validate the modules whose source has changed since the existing report."
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    if args.incremental and args.report is None:
+        _parser().error("--incremental needs a --report to compare against.")
+    type_safety = TypeSafety[args.type_safety]
+    previous_modules = _previous_modules(args.report, type_safety) if args.incremental else {}
+    report = validate_package(args.package, type_safety, args.workers, previous_modules)
+    if args.report is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=2, sort_keys=True)
+    return 1 if report_failed(report) else 0
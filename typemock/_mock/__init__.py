@@ -1,7 +1,7 @@
 from types import FunctionType
-from typing import Union, Type, cast, TypeVar, Awaitable
+from typing import Any, Union, Type, cast, TypeVar, Awaitable
 
-from typemock._mock.object import MockObject
+from typemock._mock.object import MockObject, MockFunction, fork_mock, is_mock
 from typemock.api import MockingError, TypeSafety, ResponseBuilder
 
 T = TypeVar('T')
@@ -25,11 +25,17 @@ You need to await async functions when defining behaviour of the mock. Example:
 """
 
 
-def _tmock(clazz: Union[Type[T], T], type_safety: TypeSafety = TypeSafety.STRICT) -> T:
+def _tmock(
+        clazz: Union[Type[T], T],
+        type_safety: TypeSafety = TypeSafety.STRICT,
+        spy: bool = False,
+        timed: bool = False
+) -> T:
     """
-    Mocks a given class.
+    Mocks a given class, object, function or module.
 
-    This must be used as a context in order to define the mocked behaviour with `when`.
+    This can be used as a context in order to define the mocked behaviour with `when`, or behaviour can be defined
+    at any time with `stub`.
 
     You must let the context close in order to use the mocked object as intended.
 
@@ -40,10 +46,26 @@ def _tmock(clazz: Union[Type[T], T], type_safety: TypeSafety = TypeSafety.STRICT
 
         result = my_mock.do_something()
 
+        stub(my_mock).do_something().then_return("Another Result")
+
+        with tmock(my_function) as my_function_mock:
+            when(my_function_mock(1)).then_return("A Result")
+
+        result = my_function_mock(1)
+
     Args:
 
         type_safety:
         clazz:
+        spy:
+
+            If True, calls with no specified behaviour are passed through to the real instance being mocked, without
+            type checks. They are still recorded for verification.
+
+        timed:
+
+            If True, the arrival time of each method call, and how long its response took, are recorded for querying
+            with `calls`.
 
     Returns:
 
@@ -51,8 +73,64 @@ def _tmock(clazz: Union[Type[T], T], type_safety: TypeSafety = TypeSafety.STRICT
 
     """
     if isinstance(clazz, FunctionType):
-        raise MockingError("Cannot mock a {} for now. Only objects and classes supported".format(clazz))
-    return cast(T, MockObject(clazz, type_safety))
+        return cast(T, MockFunction(clazz, type_safety, spy=spy, timed=timed))
+    return cast(T, MockObject(clazz, type_safety, spy=spy, timed=timed))
+
+
+def _reset(mock: T, behaviour: bool = True, interactions: bool = True) -> None:
+    """
+    Resets a mock in place, so that it can be reused without the cost of building a new one.
+
+    Args:
+        mock:
+        behaviour:
+
+            Clears all specified behaviour if True, else only rewinds it, eg. back to the first of many responses.
+
+        interactions:
+
+            Clears the record of interactions used by `verify` if True.
+
+    """
+    if not is_mock(mock):
+        raise MockingError("Can only reset a mock, not {}".format(mock))
+    mock_object = cast(MockObject[Any], mock)
+    for method_state in mock_object._mock_method_states:
+        method_state.reset(behaviour=behaviour, interactions=interactions)
+    for attribute_state in mock_object._mock_attribute_states.values():
+        attribute_state.reset(behaviour=behaviour, interactions=interactions)
+
+
+def _fork(mock: T) -> T:
+    """
+    Forks a mock, so that a base set of behaviour can be specified once and changed a little for each test.
+
+    The fork has the behaviour specified for the mock so far, and no interactions. Behaviour specified for either of
+    them afterwards does not affect the other. The specified behaviour is shared rather than copied, so forking costs
+    the same however much has been specified.
+
+    Examples:
+
+        with tmock(MyClass) as base_mock:
+            when(base_mock.do_something(1)).then_return("A Result")
+
+        my_mock = fork(base_mock)
+        stub(my_mock).do_something(2).then_return("Another Result")
+
+    Args:
+        mock:
+
+    Returns:
+
+        fork:
+
+    """
+    if not is_mock(mock):
+        raise MockingError("Can only fork a mock, not {}".format(mock))
+    mock_object = cast(MockObject[Any], mock)
+    if mock_object.is_open():
+        raise MockingError("Cannot fork a mock while its behaviour is being specified")
+    return cast(T, fork_mock(mock_object))
 
 
 def _when(mock_call_result: T) -> ResponseBuilder[T]:
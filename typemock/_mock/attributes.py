@@ -1,35 +1,71 @@
-from typing import Any, Generic, Type, List, TypeVar, Tuple
-
-from typemock._mock.responders import Responder, ResponderBasic, ResponderMany, ResponderRaise, ResponderDo
-from typemock._utils import Blank, is_type
-from typemock.api import MockTypeSafetyError, DoFunction
+import copy
+from typing import Any, Generic, Type, List, TypeVar, Optional
+
+from typemock._mock.responders import (
+    Responder,
+    ResponderBasic,
+    ResponderMany,
+    ResponderRaise,
+    ResponderDo,
+    ResponderSnapshot,
+    ResponderStream,
+    ResponderChaos,
+    StreamItemCheck
+)
+from typemock._utils import Blank, is_type, stream_item_type
+from typemock.api import MockTypeSafetyError, DoFunction, StreamSource
 from typemock.api import ResponseBuilder
+from typemock.chaos import ChaosSchedule
+from typemock.match import as_matcher
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+_NO_SET = object()
+
 
 class CalledSetRecord:
 
-    def __init__(self, call: Any, count: int, other_calls: List[Any]):
+    __slots__ = ('call', 'count', 'other_count', 'first_other_call')
+
+    def __init__(self, call: Any, count: int, other_count: int, first_other_call: Any):
         self.call = call
         self.count = count
-        self.other_calls = other_calls
-
-
-def _null_ordered_call(*args, **kwargs) -> Tuple[Tuple[str, Any], ...]:
-    return tuple([])
+        self.other_count = other_count
+        self.first_other_call = first_other_call
 
 
 class MockAttributeState(Generic[R]):
 
-    def __init__(self, name: str, initial_value: R, type_hint: Type):
+    __slots__ = (
+        'name',
+        'type_hint',
+        '_initial_value',
+        '_delegate',
+        '_pass_through',
+        '_responder',
+        '_call_count',
+        '_set_calls',
+    )
+
+    def __init__(self, name: str, initial_value: R, type_hint: Type, delegate: Optional[Any] = None):
         self.name = name
         self.type_hint = type_hint
-        self._responder: Responder = ResponderBasic(initial_value)
+        self._initial_value = initial_value
+        self._delegate = delegate
+        # Gets and sets are passed through to a spied object, without type checks, until behaviour is specified.
+        self._pass_through: Optional[Responder] = None
+        if delegate is not None:
+            self._pass_through = ResponderDo(lambda: getattr(delegate, name))
+        self._responder: Responder = self._unset_responder()
         self._call_count = 0
         self._set_calls: List[R] = []
 
+    def _unset_responder(self) -> Responder:
+        if self._pass_through is not None:
+            return self._pass_through
+        return ResponderBasic(self._initial_value)
+
     def _validate_return(self, response: R):
         if not isinstance(self.type_hint, Blank):
             if not is_type(response, self.type_hint):
@@ -42,6 +78,10 @@ class MockAttributeState(Generic[R]):
         self._validate_return(response)
         self._responder = ResponderBasic(response)
 
+    def set_response_snapshot(self, response: R):
+        self._validate_return(response)
+        self._responder = ResponderSnapshot(response)
+
     def set_response_many(self, results: List[R], loop: bool):
         for response in results:
             self._validate_return(response)
@@ -50,47 +90,141 @@ class MockAttributeState(Generic[R]):
     def set_error_response(self, error: Exception):
         self._responder = ResponderRaise(error)
 
+    def set_response_chaos(self, schedule: ChaosSchedule[R]):
+        for _, outcome in schedule.outcomes:
+            if not outcome.is_error():
+                self._validate_return(outcome.result)
+        self._responder = ResponderChaos(schedule)
+
     def set_response_do(self, do_function: DoFunction):
-        self._responder = ResponderDo(do_function, _null_ordered_call)
+        self._responder = ResponderDo(do_function)
+
+    def set_response_stream(self, source: StreamSource):
+        item_type, is_async = stream_item_type(self.type_hint)
+        if is_async is None:
+            if self.type_hint is not Blank:
+                raise MockTypeSafetyError("Attribute: {} must be an Iterator or AsyncIterator to stream, not:{}".format(
+                    self.name,
+                    self.type_hint
+                ))
+            is_async = False
+
+        check_item = StreamItemCheck("Attribute: {}".format(self.name), item_type)
+        self._responder = ResponderStream(source, check_item, is_async)
 
     def response(self) -> R:
         self._call_count += 1
         r = self._responder.response()
-        self._validate_return(r)
+        if self._responder is not self._pass_through:
+            self._validate_return(r)
         return r
 
     def call_count_gets(self) -> int:
         return self._call_count
 
+    def record_gets(self, count: int):
+        """
+        Records gets which were made elsewhere, such as in another process.
+        """
+        self._call_count += count
+
+    def record_set(self, item: R):
+        """
+        Records a set which was made elsewhere, such as in another process, without changing the behaviour here.
+        """
+        self._set_calls.append(item)
+
+    def recorded_sets(self) -> List[R]:
+        return self._set_calls
+
+    def specified_responder(self) -> Optional[Responder]:
+        """
+        The responder of the behaviour specified for the attribute, or None if gets are passed through to a spied object.
+        """
+        if self._responder is self._pass_through:
+            return None
+        return self._responder
+
     def called_set_with(self, item):
         self._validate_return(item)
         self._set_calls.append(item)
-        self._responder = ResponderBasic(item)
+        if self._delegate is not None:
+            setattr(self._delegate, self.name, item)
+            self._responder = self._unset_responder()
+        else:
+            self._responder = ResponderBasic(item)
+
+    def reset(self, behaviour: bool = True, interactions: bool = True):
+        """
+        Resets the state in place, so that the mock can be reused without being rebuilt.
+
+        Args:
+            behaviour:
+
+                Reverts to responding with the initial value if True, else rewinds the specified behaviour.
+
+            interactions:
+
+                Clears the record of gets and sets if True.
+
+        """
+        if behaviour:
+            self._responder = self._unset_responder()
+        else:
+            self._responder.rewind()
+        if interactions:
+            self._call_count = 0
+            self._set_calls = []
+
+    def fork(self) -> 'MockAttributeState[R]':
+        """
+        Returns a copy of the state with no gets or sets, which shares the behaviour specified so far.
+        """
+        forked = copy.copy(self)
+        forked._responder = self._responder.fork()
+        forked._call_count = 0
+        forked._set_calls = []
+        return forked
 
     def called_set_record(self, expected_call) -> CalledSetRecord:
-        other_calls = []
         count = 0
+        # Attributes can be set to None, so None cannot mark that there is no other set.
+        first_other_call: Any = _NO_SET
+        matches = as_matcher(expected_call).compile()
         for call in self._set_calls:
-            if expected_call == call:
+            if matches(call):
                 count += 1
-            else:
-                other_calls.append(call)
-        return CalledSetRecord(expected_call, count, other_calls)
+            elif first_other_call is _NO_SET:
+                first_other_call = call
+        if first_other_call is _NO_SET:
+            first_other_call = None
+        return CalledSetRecord(expected_call, count, len(self._set_calls) - count, first_other_call)
 
 
 class AttributeResponseBuilder(Generic[R], ResponseBuilder[R]):
 
+    __slots__ = ('_attribute_state',)
+
     def __init__(self, attribute_state: MockAttributeState):
         self._attribute_state = attribute_state
 
     def then_return(self, result: R) -> None:
         self._attribute_state.set_response(result)
 
+    def then_return_snapshot(self, result: R) -> None:
+        self._attribute_state.set_response_snapshot(result)
+
     def then_raise(self, error: Exception) -> None:
         self._attribute_state.set_error_response(error)
 
     def then_return_many(self, results: List[R], loop: bool = False) -> None:
         self._attribute_state.set_response_many(results, loop)
 
+    def then_chaos(self, schedule: ChaosSchedule[R]) -> None:
+        self._attribute_state.set_response_chaos(schedule)
+
     def then_do(self, do_function: DoFunction) -> None:
         self._attribute_state.set_response_do(do_function)
+
+    def then_stream(self, source: StreamSource) -> None:
+        self._attribute_state.set_response_stream(source)
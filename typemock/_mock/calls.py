@@ -0,0 +1,206 @@
+import math
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Callable, Union
+
+OrderedCallValues = Tuple[Tuple[str, Any], ...]
+
+
+# The types of value whose signature is more than their type.
+_NESTED_SIGNATURE_TYPES = frozenset([tuple, frozenset, float, complex])
+
+
+def _type_signature(value: Any) -> Any:
+    """
+    The types of a hashable value, and of everything in it, which tells apart equal values such as 1 and True.
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return value_type, tuple([
+            _type_signature(item) if type(item) in _NESTED_SIGNATURE_TYPES else type(item) for item in value
+        ])
+    if value_type is frozenset:
+        return value_type, frozenset((item, _type_signature(item)) for item in value)
+    if value_type is float:
+        # -0.0 is equal to 0.0.
+        return value_type, math.copysign(1.0, value)
+    if value_type is complex:
+        return value_type, math.copysign(1.0, value.real), math.copysign(1.0, value.imag)
+    return value_type
+
+
+def _call_signature(call: OrderedCallValues) -> Tuple[Any, ...]:
+    """
+    The type signature of a call, which only needs the signatures of its values, as its arg names are all strings.
+    """
+    return tuple([
+        _type_signature(value) if type(value) in _NESTED_SIGNATURE_TYPES else type(value) for _, value in call
+    ])
+
+
+# The typecode of the array which holds a column of values of each type.
+_COLUMN_TYPECODES = {int: 'q', float: 'd'}
+
+
+class CallColumn:
+    """
+    The values of one arg, for each call, in the order they were called.
+
+    Values are kept in an array while they are all ints, or all floats, which can be read into numpy without converting
+    each value, and in a list otherwise.
+    """
+
+    __slots__ = ('_values', '_value_type')
+
+    def __init__(self):
+        self._values: Union[array, List[Any]] = []
+        # The type of every value, while they are kept in an array.
+        self._value_type: Optional[type] = None
+
+    def append(self, value: Any):
+        if self._value_type is not None:
+            if type(value) is self._value_type:
+                try:
+                    self._values.append(value)
+                    return
+                except OverflowError:
+                    pass
+            self._values = list(self._values)
+            self._value_type = None
+        elif len(self._values) == 0 and type(value) in _COLUMN_TYPECODES:
+            self._values = array(_COLUMN_TYPECODES[type(value)])
+            self._value_type = type(value)
+            self.append(value)
+            return
+        self._values.append(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def values(self) -> Union[array, List[Any]]:
+        """
+        The values, as an array if they are all ints or all floats.
+        """
+        return self._values
+
+
+class CallLog:
+    """
+    An append-only log of calls, which keeps the value of each arg of each call in a column per arg, and a small int id
+    for each call, of the distinct call it is equal to.
+
+    Calls are counted by their distinct call, which is interned by equality and by the types of its values, so that
+    eg. a call with True is not counted as a call with 1. Calls which cannot be hashed are not interned. Calls read
+    back from the log have the values each call was made with, rather than those of the distinct call.
+    """
+
+    __slots__ = ('_ids', '_distinct', '_counts', '_id_by_call', '_equal_ids', '_unhashable_ids', '_columns')
+
+    def __init__(self):
+        self._ids = array('L')
+        self._distinct: List[OrderedCallValues] = []
+        self._counts: List[int] = []
+        # Ids of distinct calls by the call and the types of its values.
+        self._id_by_call: Dict[Tuple[OrderedCallValues, Any], int] = {}
+        # Ids of the distinct calls which are equal to a call, whatever the types of their values.
+        self._equal_ids: Dict[OrderedCallValues, List[int]] = {}
+        self._unhashable_ids: List[int] = []
+        self._columns: List[CallColumn] = []
+
+    def append(self, call: OrderedCallValues, signature: Any = None):
+        """
+        Args:
+            call:
+            signature:
+
+                The type signature of the call, if it is already known.
+
+        """
+        try:
+            typed_call = (call, _call_signature(call) if signature is None else signature)
+            call_id: Optional[int] = self._id_by_call.get(typed_call)
+            hashable = True
+        except TypeError:
+            call_id = None
+            hashable = False
+        if call_id is None:
+            call_id = len(self._distinct)
+            self._distinct.append(call)
+            self._counts.append(0)
+            if hashable:
+                self._id_by_call[typed_call] = call_id
+                self._equal_ids.setdefault(call, []).append(call_id)
+            else:
+                self._unhashable_ids.append(call_id)
+        if len(self._ids) == 0:
+            self._columns = [CallColumn() for _ in call]
+        for column, (_, value) in zip(self._columns, call):
+            column.append(value)
+        self._ids.append(call_id)
+        self._counts[call_id] += 1
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> OrderedCallValues:
+        if index < 0:
+            index += len(self._ids)
+        call = self._distinct[self._ids[index]]
+        return tuple([(name, column.values()[index]) for (name, _), column in zip(call, self._columns)])
+
+    def __iter__(self) -> Iterator[OrderedCallValues]:
+        distinct = self._distinct
+        columns = [column.values() for column in self._columns]
+        for index, call_id in enumerate(self._ids):
+            yield tuple([(name, values[index]) for (name, _), values in zip(distinct[call_id], columns)])
+
+    def ids(self) -> array:
+        """
+        The id of each call, in the order they were called, which indexes `distinct`.
+
+        A distinct call is equal to the calls with its id, but has the values of the first of them.
+        """
+        return self._ids
+
+    def distinct(self) -> List[OrderedCallValues]:
+        return self._distinct
+
+    def column(self, position: int) -> Union[array, List[Any]]:
+        """
+        The values of the arg at the given position of the calls, for each call, in the order they were called.
+        """
+        if len(self._columns) == 0:
+            return []
+        return self._columns[position].values()
+
+    def count_equal(self, expected_call: OrderedCallValues) -> int:
+        count = 0
+        try:
+            for call_id in self._equal_ids.get(expected_call, ()):
+                count += self._counts[call_id]
+        except TypeError:
+            pass
+        for call_id in self._unhashable_ids:
+            if self._distinct[call_id] == expected_call:
+                count += self._counts[call_id]
+        return count
+
+    def count_matching(self, matches: Callable[[OrderedCallValues], bool]) -> Tuple[int, Optional[OrderedCallValues]]:
+        """
+        Counts the calls which match, checking each distinct call only once.
+
+        Returns:
+
+            (count, first_other_call):
+
+                The first other call is the earliest call which did not match, if any.
+
+        """
+        count = 0
+        first_other_call = None
+        # Distinct calls are in the order they were first called.
+        for call, call_count in zip(self._distinct, self._counts):
+            if matches(call):
+                count += call_count
+            elif first_other_call is None:
+                first_other_call = call
+        return count, first_other_call
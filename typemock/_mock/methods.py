@@ -1,27 +1,50 @@
+import copy
 import inspect
+import itertools
+from array import array
+from bisect import bisect_right
 from collections import OrderedDict
 from inspect import Signature
+from time import monotonic, perf_counter
 from types import FunctionType
-from typing import Tuple, Any, Generic, Dict, List, Callable, TypeVar
-
-from typemock._mock.responders import Responder, ResponderBasic, ResponderMany, ResponderRaise, ResponderDo
-from typemock._utils import is_type, InefficientUnHashableKeyDict
-from typemock.api import MockTypeSafetyError, NoBehaviourSpecifiedError, DoFunction
+from typing import Tuple, Any, Generic, Dict, List, Callable, TypeVar, Optional, Awaitable, Set
+
+from typemock._mock.responders import (
+    Responder,
+    ResponderBasic,
+    ResponderImmutable,
+    ResponderMany,
+    ResponderRaise,
+    ResponderDo,
+    ResponderSnapshot,
+    ResponderStream,
+    ResponderChaos,
+    StreamItemCheck,
+    _is_immutable
+)
+from typemock._mock.calls import CallLog, OrderedCallValues, _call_signature
+from typemock._mock.sequence import next_sequence
+from typemock._utils import is_type, HashedKeyDict, stream_item_type, Blank, short_repr, type_hints
+from typemock.api import MockTypeSafetyError, NoBehaviourSpecifiedError, DoFunction, StreamSource, MockingError
 from typemock.api import TypeSafety, ResponseBuilder
-from typemock.match import Matcher
+from typemock.chaos import ChaosSchedule
+from typemock.match import Matcher, MatchAny, Captor, as_matcher, contains_matcher, contains_captor
 
 T = TypeVar('T')
 R = TypeVar('R')
 
-OrderedCallValues = Tuple[Tuple[str, Any], ...]
+CallPredicate = Callable[[OrderedCallValues], bool]
 
 
 class CallCount:
 
-    def __init__(self, call: OrderedCallValues, count: int, other_calls: List[OrderedCallValues]):
+    __slots__ = ('call', 'count', 'other_count', 'first_other_call')
+
+    def __init__(self, call: OrderedCallValues, count: int, other_count: int, first_other_call: Any):
         self.call = call
         self.count = count
-        self.other_calls = other_calls
+        self.other_count = other_count
+        self.first_other_call = first_other_call
 
 
 _error_invalid_mock_args = """
@@ -35,38 +58,178 @@ Expected: {actual_signature}
 """
 
 
+_error_no_behaviour = """
+
+No behaviour specified for method: '{method_name}' with args:
+
+{args}
+{closest}"""
+
+_error_closest_behaviour = """
+The closest specified behaviour is for args:
+
+{closest_args}
+"""
+
+
+def _arg_matches(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, (MatchAny, Captor)):
+        return True
+    try:
+        if isinstance(expected, Matcher):
+            return expected.matches(actual)
+        return bool(expected == actual)
+    except Exception:
+        return False
+
+
 def has_matchers(call: OrderedCallValues) -> bool:
     for call_param in call:
-        if isinstance(call_param[1], Matcher):
+        if contains_matcher(call_param[1]):
             return True
     return False
 
 
+def matcher_key(call: OrderedCallValues) -> OrderedCallValues:
+    """
+    Returns a hashable key for a call with matchers, where matchers of the same kind and parameters are equal.
+    """
+    return tuple((name, as_matcher(value)) for name, value in call)
+
+
+def compile_call_matcher(call: OrderedCallValues) -> CallPredicate:
+    """
+    Compiles a call which has matchers into a predicate of the calls it matches.
+
+    Args:
+        call:
+
+    Returns:
+
+        predicate:
+
+    """
+    length = len(call)
+    matchers = [as_matcher(value) for _, value in call]
+    checks = [
+        (i, matcher.compile_check())
+        for i, matcher in enumerate(matchers)
+        if not isinstance(matcher, (MatchAny, Captor))
+    ]
+    # Captors, including those in the `*args` or `**kwargs` of a call, only capture once the whole call has matched.
+    compiled_captures = [(i, matcher.compile_capture()) for i, matcher in enumerate(matchers)]
+    captures = [(i, capture) for i, capture in compiled_captures if capture is not None]
+
+    def predicate(other: OrderedCallValues) -> bool:
+        if len(other) != length:
+            return False
+        for i, check in checks:
+            if not check(other[i][1]):
+                return False
+        for i, capture in captures:
+            capture(other[i][1])
+        return True
+
+    return predicate
+
+
+_VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+# Where an arg of a call comes from, in a binding plan.
+_FROM_ARGS = 0
+_FROM_KWARGS = 1
+_FROM_DEFAULT = 2
+
+# The duration of a timed call which has not yet responded.
+_NOT_RESPONDED = float("nan")
+
+
+class DelegatedAwaitable:
+    """
+    Wraps the awaitable result of a call delegated to a real async method, so that the mock knows to await it.
+    """
+
+    __slots__ = ('awaitable',)
+
+    def __init__(self, awaitable: Awaitable):
+        self.awaitable = awaitable
+
+
 class MockMethodState(Generic[R]):
 
+    __slots__ = (
+        'name',
+        'func',
+        '_type_hints',
+        '_signature',
+        '_type_safety',
+        '_delegate',
+        '_responses',
+        '_matcher_responses',
+        '_shared_responses',
+        '_shared_matchers',
+        '_arg_index_to_arg_name',
+        '_arg_name_to_parameter',
+        '_call_log',
+        '_call_sequence',
+        '_timed',
+        '_call_times',
+        '_call_durations',
+        '_arg_name_to_call_position',
+        '_checked_calls',
+        '_checks_args',
+        '_binding_plans',
+    )
+
     def __init__(
             self,
             name: str,
             signature: Signature,
             func: FunctionType,
-            type_safety: TypeSafety
+            type_safety: TypeSafety,
+            delegate: Optional[Callable] = None,
+            timed: bool = False
     ):
         self.name = name
         self.func = func
+        self._type_hints = type_hints(func)
         self._signature = signature
         self._type_safety = type_safety
-        self._responses: InefficientUnHashableKeyDict[OrderedCallValues, Responder] = InefficientUnHashableKeyDict()
-        self._matcher_responses: InefficientUnHashableKeyDict[
-            OrderedCallValues, Responder] = InefficientUnHashableKeyDict()
-        self._open = False
+        self._delegate = delegate
+        if delegate is not None and inspect.iscoroutinefunction(func):
+            self._delegate = lambda *args, **kwargs: DelegatedAwaitable(delegate(*args, **kwargs))
+        self._responses: HashedKeyDict[OrderedCallValues, Responder] = HashedKeyDict()
+        self._matcher_responses: Dict[OrderedCallValues, Tuple[CallPredicate, Responder]] = {}
+        # Behaviour frozen by forking, newest first, which is shared with forks and looked up after `_responses`.
+        self._shared_responses: Tuple[HashedKeyDict[OrderedCallValues, Responder], ...] = ()
+        # The matcher responses are copied before they are changed, if they are shared with forks.
+        self._shared_matchers = False
         self._arg_index_to_arg_name: Dict[int, str] = {}
         self._arg_name_to_parameter: Dict[str, inspect.Parameter] = {}
-        self._call_record: List[OrderedCallValues] = []
+        self._call_log = CallLog()
+        self._call_sequence: List[int] = []
+        # Arrival times and responder durations, in seconds, kept compactly in step with the call record if timed.
+        self._timed = timed
+        self._call_times = array('d')
+        self._call_durations = array('d')
         i = 0
         for name, param in signature.parameters.items():
             self._arg_index_to_arg_name[i] = name
             self._arg_name_to_parameter[name] = param
             i += 1
+        # The position of each arg in a recorded call, which does not include self.
+        self._arg_name_to_call_position: Dict[str, int] = {
+            name: position for position, name in enumerate(list(signature.parameters)[1:])
+        }
+        # The distinct calls, with their type signatures, which have passed type checks.
+        self._checked_calls: Set[Tuple[OrderedCallValues, Any]] = set()
+        # Whether any arg has a type hint to check calls against, which relaxed type safety does not require.
+        self._checks_args = any(name in self._type_hints for name in self._arg_name_to_call_position)
+        # Where each arg of a call comes from, for each number of args and names of kwargs it has been called with. Only
+        # signatures without `*args` or `**kwargs` are bound this way.
+        self._binding_plans: Optional[Dict[Tuple[int, Tuple[str, ...]], Tuple[Tuple[str, int, Any], ...]]] = None
+        if not any(param.kind in _VAR_KINDS for param in signature.parameters.values()):
+            self._binding_plans = {}
 
     def _populate_defaults(self, ordered_call: OrderedCallValues) -> OrderedCallValues:
         if len(ordered_call) == len(self._arg_index_to_arg_name):
@@ -75,9 +238,8 @@ class MockMethodState(Generic[R]):
         for name, value in ordered_call:
             args_dict[name] = value
         ordered_key_values = []
-        for name, param in self._signature.parameters.items():
-            if name == "self":
-                continue
+        # The first parameter receives the mock itself.
+        for name, param in list(self._signature.parameters.items())[1:]:
             value = args_dict.get(
                 name,
                 self._arg_name_to_parameter[name].default
@@ -85,13 +247,17 @@ class MockMethodState(Generic[R]):
             ordered_key_values.append((name, value))
         return tuple(ordered_key_values)
 
-    def _ordered_call(self, *args, **kwargs) -> OrderedCallValues:
+    def _bound_call(self, *args, **kwargs) -> OrderedCallValues:
+        binding_plans = self._binding_plans
+        if binding_plans is not None:
+            plan = binding_plans.get((len(args), tuple(kwargs)))
+            if plan is not None:
+                return tuple([
+                    (name, args[source] if kind is _FROM_ARGS else kwargs[source] if kind is _FROM_KWARGS else source)
+                    for name, kind, source in plan
+                ])
         try:
             binding = self._signature.bind(*args, **kwargs)
-            ordered_call = tuple(binding.arguments.items())[1:]
-            ordered_call = self._populate_defaults(ordered_call)
-            self._check_key_type_safety(ordered_call)
-            return ordered_call
         except TypeError as e:
             raise MockTypeSafetyError(_error_invalid_mock_args.format(
                 method_name=self.name,
@@ -99,38 +265,330 @@ class MockMethodState(Generic[R]):
                 attempted_kwargs=kwargs,
                 actual_signature=self._signature
             )) from e
+        ordered_call = tuple(binding.arguments.items())[1:]
+        if binding_plans is not None:
+            binding_plans[(len(args), tuple(kwargs))] = self._binding_plan(len(args), kwargs)
+        return self._populate_defaults(ordered_call)
+
+    def _binding_plan(self, arg_count: int, kwargs: Dict[str, Any]) -> Tuple[Tuple[str, int, Any], ...]:
+        """
+        Where each arg comes from, in calls with the same number of args and names of kwargs as a call which was bound.
+
+        Without `*args` or `**kwargs`, whether such calls bind, and where each arg comes from, only depends on those.
+        """
+        plan: List[Tuple[str, int, Any]] = []
+        # The first parameter receives the mock itself.
+        for i, (name, param) in enumerate(self._signature.parameters.items()):
+            if i == 0:
+                continue
+            if name in kwargs:
+                plan.append((name, _FROM_KWARGS, name))
+            elif i < arg_count:
+                plan.append((name, _FROM_ARGS, i))
+            else:
+                plan.append((name, _FROM_DEFAULT, param.default))
+        return tuple(plan)
+
+    def _ordered_call(self, *args, **kwargs) -> OrderedCallValues:
+        ordered_call = self._bound_call(*args, **kwargs)
+        self._check_key_type_safety(ordered_call)
+        return ordered_call
+
+    def _checked_call(self, *args, **kwargs) -> Tuple[OrderedCallValues, Any]:
+        """
+        The ordered, type checked call, and its type signature.
+
+        Every call is bound from its own args, and type checked once for each distinct call, told apart by equality and
+        by the types of its values, like recorded calls. Calls with args which cannot be hashed are checked every time,
+        and have no signature. Nothing is checked, or looked up, for methods with no arg hints.
+        """
+        ordered_call = self._bound_call(*args, **kwargs)
+        if not self._checks_args:
+            return ordered_call, None
+        try:
+            signature = _call_signature(ordered_call)
+            typed_call = (ordered_call, signature)
+            checked = typed_call in self._checked_calls
+        except TypeError:
+            self._check_key_type_safety(ordered_call)
+            return ordered_call, None
+        if not checked:
+            self._check_key_type_safety(ordered_call)
+            self._checked_calls.add(typed_call)
+        return ordered_call, signature
+
+    def _record_call_for(self, *args, **kwargs) -> OrderedCallValues:
+        if self._delegate is None:
+            key, signature = self._checked_call(*args, **kwargs)
+        else:
+            # Calls passed through to a spied object are not type checked.
+            key = self._bound_call(*args, **kwargs)
+            signature = None
+        self._call_log.append(key, signature)
+        self._call_sequence.append(next_sequence())
+        return key
+
+    def _start_timing(self) -> Tuple[array, int]:
+        """
+        Records the arrival time of a call, and keeps a place for its duration, which is filled in once it has
+        responded, so that durations stay in call order when calls overlap.
+
+        Returns:
+
+            (durations, index):
+
+        """
+        self._call_times.append(monotonic())
+        durations = self._call_durations
+        durations.append(_NOT_RESPONDED)
+        return durations, len(durations) - 1
 
     def response_for(self, *args, **kwargs) -> R:
-        key = self._ordered_call(*args, **kwargs)
-        self._call_record.append(key)
-        if key in self._responses:
-            r = self._responses[key].response(*args, **kwargs)
-            self._validate_return(r)
+        key = self._record_call_for(*args, **kwargs)
+        if not self._timed:
+            return self._respond(key, *args, **kwargs)
+        durations, index = self._start_timing()
+        start = perf_counter()
+        try:
+            return self._respond(key, *args, **kwargs)
+        finally:
+            durations[index] = perf_counter() - start
+
+    async def async_response_for(self, *args, **kwargs) -> R:
+        """
+        Responds to a call of an async method, awaiting a spied method, so that its duration is included if timed.
+        """
+        key = self._record_call_for(*args, **kwargs)
+        if not self._timed:
+            return await self._awaited_response(key, *args, **kwargs)
+        durations, index = self._start_timing()
+        start = perf_counter()
+        try:
+            return await self._awaited_response(key, *args, **kwargs)
+        finally:
+            durations[index] = perf_counter() - start
+
+    async def _awaited_response(self, key: OrderedCallValues, *args, **kwargs) -> R:
+        response: Any = self._respond(key, *args, **kwargs)
+        if type(response) is DelegatedAwaitable:
+            return await response.awaitable
+        return response
+
+    def _respond(self, key: OrderedCallValues, *args, **kwargs) -> R:
+        exact_responder = self._responses.get(key, None)
+        if exact_responder is None and self._shared_responses:
+            exact_responder = self._shared_response(key)
+        if exact_responder is not None:
+            if self._delegate is not None:
+                # Only the calls which pass through to a spied object go unchecked.
+                self._check_key_type_safety(key)
+            r = exact_responder.response(*args[1:], **kwargs)
+            if not exact_responder.validated:
+                self._validate_return(r)
             return r
         else:
-            for matcher_key, responder in self._matcher_responses.items():
-                if matcher_key == key:
+            for hashable_key, (predicate, responder) in self._matcher_responses.items():
+                if predicate(key):
+                    if self._shared_matchers:
+                        self._own_matchers()
+                        _, responder = self._matcher_responses[hashable_key]
                     self._check_key_type_safety(key)
                     r = responder.response(**OrderedDict(key))
-                    self._validate_return(r)
+                    if not responder.validated:
+                        self._validate_return(r)
                     return r
-            raise NoBehaviourSpecifiedError(
-                "No behaviour specified for method: {} with args: {}".format(self.name, key)
+            if self._delegate is not None:
+                return self._delegate(*args[1:], **kwargs)
+            raise NoBehaviourSpecifiedError(self._no_behaviour_message(key))
+
+    def _shared_response(self, key: OrderedCallValues) -> Optional[Responder]:
+        for responses in self._shared_responses:
+            responder = responses.get(key, None)
+            if responder is not None:
+                # Responders are forked on first use, so that any state they keep is not shared.
+                responder = responder.fork()
+                self._responses[key] = responder
+                return responder
+        return None
+
+    def _own_matchers(self):
+        if self._shared_matchers:
+            # Every responder is forked along with the matchers, so that no state is left shared with the forks.
+            self._matcher_responses = {
+                hashable_key: (predicate, responder.fork())
+                for hashable_key, (predicate, responder) in self._matcher_responses.items()
+            }
+            self._shared_matchers = False
+
+    def _own_behaviour(self):
+        """
+        Takes this state's own copy of any behaviour it shares with forks.
+        """
+        for responses in self._shared_responses:
+            for key, responder in responses.items():
+                if self._responses.get(key, None) is None:
+                    self._responses[key] = responder.fork()
+        self._shared_responses = ()
+        self._own_matchers()
+
+    def specified_responders(self) -> List[Tuple[OrderedCallValues, Responder]]:
+        """
+        The responder for each specified call, in the order they were specified.
+
+        Calls with matchers have the matchers in place of their args.
+        """
+        self._own_behaviour()
+        responders = list(self._responses.items())
+        responders.extend((key, responder) for key, (_, responder) in self._matcher_responses.items())
+        return responders
+
+    def _no_behaviour_message(self, key: OrderedCallValues) -> str:
+        closest = None
+        closest_score = 0
+        specified_keys = itertools.chain(
+            (specified_key for specified_key, _ in self._responses.items()),
+            (specified_key for responses in self._shared_responses for specified_key, _ in responses.items()),
+            self._matcher_responses.keys()
+        )
+        for specified_key in specified_keys:
+            score = sum(
+                1 for (_, expected), (_, actual) in zip(specified_key, key) if _arg_matches(expected, actual)
             )
+            if closest is None or score > closest_score:
+                closest = specified_key
+                closest_score = score
+        return _error_no_behaviour.format(
+            method_name=self.name,
+            args=short_repr(key),
+            closest="" if closest is None else _error_closest_behaviour.format(closest_args=short_repr(closest))
+        )
+
+    def _call_matcher(self, expected_call: OrderedCallValues) -> CallPredicate:
+        if has_matchers(expected_call):
+            return compile_call_matcher(expected_call)
+        return expected_call.__eq__
 
     def call_count_for(self, *args, **kwargs) -> CallCount:
-        other_calls = []
-        count = 0
         expected_call = self._ordered_call(*args, **kwargs)
-        for call in self._call_record:
-            if call == expected_call:
-                count += 1
+        matches = self._call_matcher(expected_call)
+        if any(contains_captor(value) for _, value in expected_call):
+            # Captors need to see every call, not just every distinct call.
+            count = 0
+            first_other_call = None
+            for call in self._call_log:
+                if matches(call):
+                    count += 1
+                elif first_other_call is None:
+                    first_other_call = call
+        else:
+            count, first_other_call = self._call_log.count_matching(matches)
+        return CallCount(expected_call, count, len(self._call_log) - count, first_other_call)
+
+    def call_counts_for(self, expected_args: List[Tuple[tuple, dict]]) -> List[Tuple[OrderedCallValues, int]]:
+        """
+        Counts the calls for many expected sets of args, checking each distinct call at most once per expectation.
+
+        Args:
+            expected_args:
+
+                Pairs of args and kwargs, as the method would be called with, including self.
+
+        Returns:
+
+            counts:
+
+                Pairs of the expected call and its count, in the same order as the expected args.
+
+        """
+        expected_calls = [self._ordered_call(*args, **kwargs) for args, kwargs in expected_args]
+        counts = []
+        for expected_call in expected_calls:
+            if any(contains_captor(value) for _, value in expected_call):
+                # Captors need to see every call, not just every distinct call.
+                matches = compile_call_matcher(expected_call)
+                count = sum(1 for call in self._call_log if matches(call))
+            elif has_matchers(expected_call):
+                count, _ = self._call_log.count_matching(compile_call_matcher(expected_call))
             else:
-                other_calls.append(call)
-        return CallCount(expected_call, count, other_calls)
+                count = self._call_log.count_equal(expected_call)
+            counts.append((expected_call, count))
+        return counts
+
+    def sequences_after(self, after: int, limit: int, *args, **kwargs) -> Tuple[OrderedCallValues, List[int]]:
+        """
+        Finds the global sequence numbers of the first calls with the given args after a sequence number.
+
+        Args:
+            after:
+            limit:
+
+                The most sequence numbers to find.
+
+        Returns:
+
+            (expected_call, sequences):
+
+        """
+        expected_call = self._ordered_call(*args, **kwargs)
+        matches = self._call_matcher(expected_call)
+        sequences = []
+        call_log = self._call_log
+        for i in range(bisect_right(self._call_sequence, after), len(call_log)):
+            if matches(call_log[i]):
+                sequences.append(self._call_sequence[i])
+                if len(sequences) == limit:
+                    break
+        return expected_call, sequences
+
+    def record_call(self, call: OrderedCallValues, timing: Optional[Tuple[float, float]] = None):
+        """
+        Records a call which was made elsewhere, such as in another process, as if it had just been made.
+
+        Args:
+            call:
+            timing:
+
+                The arrival time and duration of the call, if the method is timed.
+
+        """
+        self._call_log.append(call)
+        self._call_sequence.append(next_sequence())
+        if self._timed:
+            arrived, duration = timing if timing is not None else (float("nan"), float("nan"))
+            self._call_times.append(arrived)
+            self._call_durations.append(duration)
+
+    def recorded_calls(self) -> CallLog:
+        return self._call_log
+
+    def recorded_sequences(self) -> List[int]:
+        return self._call_sequence
+
+    def is_timed(self) -> bool:
+        return self._timed
+
+    def recorded_times(self) -> array:
+        return self._call_times
+
+    def recorded_durations(self) -> array:
+        return self._call_durations
+
+    def call_position_of(self, arg_name: str) -> int:
+        """
+        The position of the arg with the given name in a recorded call.
+
+        Raises:
+
+            MockingError: If the method has no such arg.
+
+        """
+        try:
+            return self._arg_name_to_call_position[arg_name]
+        except KeyError:
+            raise MockingError("Method: {} has no arg: {}".format(self.name, arg_name))
 
     def _validate_return(self, response: R):
-        func_annotations = self.func.__annotations__
+        func_annotations = self._type_hints
         if self._type_safety == TypeSafety.NO_RETURN_IS_NONE_RETURN:
             return_type = func_annotations.get("return")
             if return_type is None:
@@ -161,17 +619,26 @@ class MockMethodState(Generic[R]):
 
     def _set_key_to_responder(self, key: OrderedCallValues, responder: Responder):
         if has_matchers(key):
-            self._matcher_responses[key] = responder
+            self._own_matchers()
+            hashable_key = matcher_key(key)
+            # Re-specifying the behaviour for the same matchers moves it to the back of the queue.
+            self._matcher_responses.pop(hashable_key, None)
+            self._matcher_responses[hashable_key] = (compile_call_matcher(key), responder)
         else:
             self._responses[key] = responder
 
     def set_response(self, response: R, *args, **kwargs):
         key = self._ordered_call(*args, **kwargs)
         self._validate_return(response)
-        if has_matchers(key):
-            self._matcher_responses[key] = ResponderBasic(response)
+        if _is_immutable(response):
+            self._set_key_to_responder(key, ResponderImmutable(response))
         else:
-            self._responses[key] = ResponderBasic(response)
+            self._set_key_to_responder(key, ResponderBasic(response))
+
+    def set_response_snapshot(self, response: R, *args, **kwargs):
+        key = self._ordered_call(*args, **kwargs)
+        self._validate_return(response)
+        self._set_key_to_responder(key, ResponderSnapshot(response))
 
     def set_response_many(self, results: List[R], loop: bool, *args, **kwargs):
         key = self._ordered_call(*args, **kwargs)
@@ -183,25 +650,90 @@ class MockMethodState(Generic[R]):
         key = self._ordered_call(*args, **kwargs)
         self._set_key_to_responder(key, ResponderRaise(error))
 
+    def set_response_chaos(self, schedule: ChaosSchedule[R], *args, **kwargs):
+        key = self._ordered_call(*args, **kwargs)
+        for _, outcome in schedule.outcomes:
+            if not outcome.is_error():
+                self._validate_return(outcome.result)
+        self._set_key_to_responder(key, ResponderChaos(schedule))
+
     def set_response_do(self, do_function: DoFunction, *args, **kwargs):
         key = self._ordered_call(*args, **kwargs)
-        self._set_key_to_responder(key, ResponderDo(do_function, self._ordered_call))
+        self._set_key_to_responder(key, ResponderDo(do_function))
 
-    def open_for_setup(self):
-        self._open = True
+    def set_response_stream(self, source: StreamSource, *args, **kwargs):
+        key = self._ordered_call(*args, **kwargs)
+        return_type = self._type_hints.get("return", Blank)
+        item_type, is_async = stream_item_type(return_type)
+        if is_async is None:
+            if return_type is not Blank:
+                raise MockTypeSafetyError("Method: {} must return an Iterator or AsyncIterator to stream, not:{}".format(
+                    self.name,
+                    return_type
+                ))
+            is_async = False
 
-    def close_setup(self):
-        self._open = False
+        check_item = StreamItemCheck("Method: {}".format(self.name), item_type)
+        self._set_key_to_responder(key, ResponderStream(source, check_item, is_async))
 
-    def is_open(self) -> bool:
-        return self._open
+    def reset(self, behaviour: bool = True, interactions: bool = True):
+        """
+        Resets the state in place, so that the mock can be reused without being rebuilt.
+
+        Args:
+            behaviour:
+
+                Clears all specified behaviour if True, else rewinds it, eg. back to the first of many responses.
+
+            interactions:
+
+                Clears the record of calls if True.
+
+        """
+        if behaviour:
+            self._responses = HashedKeyDict()
+            self._matcher_responses = {}
+            self._shared_responses = ()
+            self._shared_matchers = False
+        else:
+            # Shared behaviour is forked before it is rewound, so that forks are not rewound with it.
+            self._own_behaviour()
+            for _, responder in self._responses.items():
+                responder.rewind()
+            for _, responder in self._matcher_responses.values():
+                responder.rewind()
+        if interactions:
+            self._call_log = CallLog()
+            self._checked_calls = set()
+            self._call_sequence = []
+            self._call_times = array('d')
+            self._call_durations = array('d')
+
+    def fork(self) -> 'MockMethodState[R]':
+        """
+        Returns a copy of the state with no calls, which shares the behaviour specified so far.
+
+        The behaviour specified so far is frozen and shared by both states, and behaviour specified later is kept to
+        the state it is specified for. So forking costs the same however much behaviour has been specified.
+        """
+        if len(self._responses) > 0:
+            self._shared_responses = (self._responses,) + self._shared_responses
+            self._responses = HashedKeyDict()
+        self._shared_matchers = True
+        forked = copy.copy(self)
+        forked._responses = HashedKeyDict()
+        forked._call_log = CallLog()
+        forked._call_sequence = []
+        forked._call_times = array('d')
+        forked._call_durations = array('d')
+        return forked
 
     def _check_key_type_safety(self, key: OrderedCallValues):
-        func_annotations = self.func.__annotations__
+        func_annotations = self._type_hints
         for call_arg in key:
             arg_name = call_arg[0]
             arg_value = call_arg[1]
-            if isinstance(arg_value, Matcher):
+            if contains_matcher(arg_value):
                 continue
             if arg_name in func_annotations:
                 param = self._arg_name_to_parameter[arg_name]
@@ -221,24 +753,35 @@ class MockMethodState(Generic[R]):
 def mock_method(state: MockMethodState) -> Callable:
     if inspect.iscoroutinefunction(state.func):
         async def method_mock(*args, **kwargs):
-            if state.is_open():
-                return MethodResponseBuilder(state, *args, **kwargs)
-            else:
-                return state.response_for(*args, **kwargs)
-
-        return method_mock
+            return await state.async_response_for(*args, **kwargs)
     else:
         def method_mock(*args, **kwargs):
-            if state.is_open():
-                return MethodResponseBuilder(state, *args, **kwargs)
-            else:
-                return state.response_for(*args, **kwargs)
+            return state.response_for(*args, **kwargs)
+
+    method_mock.__name__ = state.name
+    return method_mock
 
-        return method_mock
+
+def setup_method(state: MockMethodState) -> Callable:
+    """
+    Builds the method which specifies behaviour for its args, in place of the mocked method, while a mock is open.
+    """
+    if inspect.iscoroutinefunction(state.func):
+        async def async_method_setup(*args, **kwargs):
+            return MethodResponseBuilder(state, *args, **kwargs)
+
+        return async_method_setup
+    else:
+        def method_setup(*args, **kwargs):
+            return MethodResponseBuilder(state, *args, **kwargs)
+
+        return method_setup
 
 
 class MethodResponseBuilder(Generic[R], ResponseBuilder[R]):
 
+    __slots__ = ('_method_state', '_args', '_kwargs')
+
     def __init__(self, method_state: MockMethodState, *args, **kwargs):
         self._method_state = method_state
         self._args = args
@@ -247,11 +790,20 @@ class MethodResponseBuilder(Generic[R], ResponseBuilder[R]):
     def then_return(self, result: R) -> None:
         self._method_state.set_response(result, *self._args, **self._kwargs)
 
+    def then_return_snapshot(self, result: R) -> None:
+        self._method_state.set_response_snapshot(result, *self._args, **self._kwargs)
+
     def then_raise(self, error: Exception) -> None:
         self._method_state.set_error_response(error, *self._args, **self._kwargs)
 
     def then_return_many(self, results: List[R], loop: bool = False) -> None:
         self._method_state.set_response_many(results, loop, *self._args, **self._kwargs)
 
+    def then_chaos(self, schedule: ChaosSchedule[R]) -> None:
+        self._method_state.set_response_chaos(schedule, *self._args, **self._kwargs)
+
     def then_do(self, do_function: DoFunction) -> None:
         self._method_state.set_response_do(do_function, *self._args, **self._kwargs)
+
+    def then_stream(self, source: StreamSource) -> None:
+        self._method_state.set_response_stream(source, *self._args, **self._kwargs)
@@ -1,97 +1,294 @@
 import inspect
-from typing import Generic, Union, Type, cast, Optional, List, Dict, TypeVar
+from types import FunctionType, MethodType, ModuleType
+from typing import Generic, Union, Type, cast, Optional, List, Dict, TypeVar, Any, Tuple
 
 from typemock._mock.attributes import MockAttributeState, AttributeResponseBuilder
-from typemock._mock.methods import MockMethodState, mock_method
-from typemock._safety import validate_class_type_hints
-from typemock._utils import try_instantiate_class, methods, bind, attributes
-from typemock.api import TypeSafety
+from typemock._mock.methods import MockMethodState, mock_method, setup_method
+from typemock._safety import validate_class_type_hints, validate_function_type_hints
+from typemock._utils import (
+    try_instantiate_class,
+    methods,
+    bind,
+    attributes,
+    module_functions,
+    with_leading_self,
+    FunctionEntry
+)
+from typemock.api import TypeSafety, MockingError
 
 T = TypeVar('T')
 R = TypeVar('R')
 
 
+class _MockAttribute:
+    """
+    Serves gets and sets of a mocked attribute, from the state of the attribute on the mock.
+    """
+
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, mock: Any, owner: Any = None) -> Any:
+        if mock is None:
+            return self
+        return mock._mock_attribute_states[self._name].response()
+
+    def __set__(self, mock: Any, item: Any):
+        mock._mock_attribute_states[self._name].called_set_with(item)
+
+
+class _SetupAttribute:
+    """
+    Serves response builders for a mocked attribute, while its mock is open.
+    """
+
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, mock: Any, owner: Any = None) -> Any:
+        if mock is None:
+            return self
+        return AttributeResponseBuilder(mock._mock_attribute_states[self._name])
+
+    def __set__(self, mock: Any, item: Any):
+        raise Exception("Cannot mock behaviour of setting an attribute at this time")
+
+
+class _SetupMethod:
+    """
+    Serves methods which return response builders, in place of a mocked method, while its mock is open.
+    """
+
+    __slots__ = ('_name',)
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, mock: Any, owner: Any = None) -> Any:
+        if mock is None:
+            return self
+        return MethodType(setup_method(mock._mock_method_states_by_name[self._name]), mock)
+
+    def __set__(self, mock: Any, item: Any):
+        raise MockingError("Cannot replace the mocked method '{}'".format(self._name))
+
+
+def _setup_call(mock: Any, *args, **kwargs) -> Any:
+    return getattr(mock, mock._function_name)(*args, **kwargs)
+
+
+# Mocks with attributes are given a type with a descriptor for each attribute, so that other attributes are looked up
+# as normal. Types are shared by mocks with the same attributes.
+_mock_types: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+# While a mock is open its type is switched to one which specifies behaviour, so calls to a closed mock never need to
+# check whether it is open.
+_setup_types: Dict[Tuple[type, Tuple[str, ...], Tuple[str, ...]], type] = {}
+
+# Assigns the type of an object, bypassing the `__class__` property of mocks.
+_set_class = object.__dict__["__class__"].__set__
+
+
+def _mock_type(base: type, attribute_names: Tuple[str, ...]) -> type:
+    key = (base, attribute_names)
+    mock_type = _mock_types.get(key)
+    if mock_type is None:
+        namespace: Dict[str, Any] = {name: _MockAttribute(name) for name in attribute_names}
+        namespace.update(__module__=base.__module__, __qualname__=base.__qualname__)
+        mock_type = type(base.__name__, (base,), namespace)
+        _mock_types[key] = mock_type
+    return mock_type
+
+
+def _setup_type(base: type, method_names: Tuple[str, ...], attribute_names: Tuple[str, ...]) -> type:
+    key = (base, method_names, attribute_names)
+    setup_type = _setup_types.get(key)
+    if setup_type is None:
+        namespace: Dict[str, Any] = {name: _SetupMethod(name) for name in method_names}
+        namespace.update({name: _SetupAttribute(name) for name in attribute_names})
+        if issubclass(base, MockFunction):
+            namespace["__call__"] = _setup_call
+        namespace.update(__module__=base.__module__, __qualname__=base.__qualname__)
+        setup_type = type(base.__name__, (base,), namespace)
+        _setup_types[key] = setup_type
+    return setup_type
+
+
 class MockObject(Generic[T], object):
 
-    def __init__(self, mocked_thing: Union[Type[T], T], type_safety: TypeSafety):
-        if not inspect.isclass(mocked_thing):
-            mocked_instance: T = cast(T, mocked_thing)
+    # Set while the mock is shared with other processes, to pickle it as a reference to its shared state.
+    _mock_share: Optional[Any] = None
+
+    def __init__(
+            self,
+            mocked_thing: Union[Type[T], T],
+            type_safety: TypeSafety,
+            spy: bool = False,
+            timed: bool = False
+    ):
+        mocked_functions: Optional[List[FunctionEntry]] = None
+        if isinstance(mocked_thing, FunctionType):
+            mocked_functions = [FunctionEntry(mocked_thing.__name__, mocked_thing, is_static=True)]
+        elif isinstance(mocked_thing, ModuleType):
+            mocked_functions = module_functions(mocked_thing)
+        if mocked_functions is not None:
             mocked_class: Type[T] = cast(Type[T], mocked_thing.__class__)
+            mocked_instance: Optional[T] = None
+            validate_function_type_hints(mocked_thing, mocked_functions, type_safety)
+        elif not inspect.isclass(mocked_thing):
+            mocked_instance = cast(T, mocked_thing)
+            mocked_class = cast(Type[T], mocked_thing.__class__)
+        elif spy:
+            raise MockingError("Can only spy on an instance, not the class {}".format(mocked_thing))
         else:
             mocked_class = mocked_thing  # type: ignore
-            mocked_instance: Optional[T] = try_instantiate_class(cast(Type[T], mocked_thing))  # type: ignore
-        validate_class_type_hints(
-            clazz=mocked_class,
-            instance=mocked_instance,
-            type_safety=type_safety)
+            mocked_instance = try_instantiate_class(cast(Type[T], mocked_thing))
+        if mocked_functions is None:
+            validate_class_type_hints(
+                clazz=mocked_class,
+                instance=mocked_instance,
+                type_safety=type_safety)
         self._mocked_class = mocked_class
+        self._mocked_thing = mocked_thing
+        self._type_safety = type_safety
+        self._spy = spy
+        self._timed = timed
         self._mock_method_states: List[MockMethodState] = []
+        self._mock_method_states_by_name: Dict[str, MockMethodState] = {}
+        # Verification objects are cached by the `exactly` they verify for, as they hold no other state.
+        self._verify_objects: Dict[int, Any] = {}
         self._mock_attribute_states: Dict[str, MockAttributeState] = {}
         self._open = False
 
         # Set up method mocks
-        for func_entry in methods(mocked_class):
+        for func_entry in mocked_functions if mocked_functions is not None else methods(mocked_class):
             sig = inspect.signature(func_entry.func)
+            if func_entry.is_static:
+                # Static functions are bound to the mock like methods, so they need somewhere to receive it.
+                sig = with_leading_self(sig)
+            if mocked_functions is not None:
+                delegate = func_entry.func if spy else None
+            else:
+                delegate = getattr(mocked_instance, func_entry.name) if spy else None
             method_state: MockMethodState = MockMethodState(
                 name=func_entry.name,
                 signature=sig,
                 func=func_entry.func,
-                type_safety=type_safety
+                type_safety=type_safety,
+                delegate=delegate,
+                timed=timed
             )
             self._mock_method_states.append(method_state)
+            self._mock_method_states_by_name[func_entry.name] = method_state
             mocked_method = mock_method(method_state)
             bind(self, mocked_method, func_entry.name)
 
         # Set up attribute mocks
+        if mocked_functions is not None:
+            return
         attributes_entries = attributes(mocked_class, mocked_instance)
         for attribute_entry in attributes_entries:
             attribute_state = MockAttributeState(
                 name=attribute_entry.name,
                 initial_value=attribute_entry.initial_value,
-                type_hint=attribute_entry.type_hint
+                type_hint=attribute_entry.type_hint,
+                delegate=mocked_instance if spy else None
             )
             self._mock_attribute_states[attribute_entry.name] = attribute_state
-
-    def __getattribute__(self, item: str):
-        if item.startswith("_") or item in {"is_open"}:
-            return object.__getattribute__(self, item)
-        if self.is_open():
-            if item in self._mock_attribute_states:
-                state = self._mock_attribute_states[item]
-                return AttributeResponseBuilder(state)
-            else:
-                return object.__getattribute__(self, item)
-        else:
-            if item in self._mock_attribute_states:
-                state = self._mock_attribute_states[item]
-                return state.response()
-            else:
-                return object.__getattribute__(self, item)
-
-    def __setattr__(self, key, item):
-        if hasattr(self, "_mock_attribute_states"):
-            mock_attribute_states = self._mock_attribute_states
-            if key in mock_attribute_states:
-                if self.is_open():
-                    raise Exception("Cannot mock behaviour of setting an attribute at this time")
-                state = mock_attribute_states[key]
-                state.called_set_with(item)
-        object.__setattr__(self, key, item)
+        if self._mock_attribute_states:
+            _set_class(self, _mock_type(type(self), tuple(self._mock_attribute_states)))
 
     @property  # type: ignore
     def __class__(self):
         return self._mocked_class
 
     def __enter__(self) -> T:
-        self._open = True
-        for method_state in self._mock_method_states:
-            method_state.open_for_setup()
+        if not self._open:
+            self._open = True
+            _set_class(self, _setup_type(
+                type(self),
+                tuple(self._mock_method_states_by_name),
+                tuple(self._mock_attribute_states)
+            ))
         return cast(T, self)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._open = False
-        for method_state in self._mock_method_states:
-            method_state.close_setup()
+        if self._open:
+            self._open = False
+            # The setup type is always a direct subclass of the type it was opened from.
+            _set_class(self, type(self).__base__)
 
     def is_open(self) -> bool:
         return self._open
+
+    def __reduce_ex__(self, protocol):
+        if self._mock_share is None:
+            return super().__reduce_ex__(protocol)
+        return self._mock_share.reduce()
+
+
+def fork_mock(mock: MockObject[T]) -> MockObject[T]:
+    """
+    Builds a mock with no interactions, which shares the behaviour specified for the given mock so far.
+
+    Nothing is introspected or validated again, and the specified behaviour is shared rather than copied.
+    """
+    forked = object.__new__(type(mock))
+    forked._mocked_class = mock._mocked_class
+    forked._mocked_thing = mock._mocked_thing
+    forked._type_safety = mock._type_safety
+    forked._spy = mock._spy
+    forked._timed = mock._timed
+    forked._mock_method_states = []
+    forked._mock_method_states_by_name = {}
+    forked._verify_objects = {}
+    forked._mock_attribute_states = {
+        name: attribute_state.fork() for name, attribute_state in mock._mock_attribute_states.items()
+    }
+    forked._open = False
+    for method_state in mock._mock_method_states:
+        forked_state = method_state.fork()
+        forked._mock_method_states.append(forked_state)
+        forked._mock_method_states_by_name[forked_state.name] = forked_state
+        bind(forked, mock_method(forked_state), forked_state.name)
+    if is_mock_function(mock):
+        forked_function = cast(MockFunction[T], forked)
+        function_name = cast(MockFunction[T], mock)._function_name
+        forked_function._function_name = function_name
+        forked_function._function_mock = object.__getattribute__(forked, function_name)
+    return forked
+
+
+class MockFunction(MockObject[T]):
+    """
+    A mock of a plain function, which is called, has behaviour specified, and is verified, just like the function.
+    """
+
+    def __init__(self, mocked_function: FunctionType, type_safety: TypeSafety, spy: bool = False, timed: bool = False):
+        super().__init__(cast(Any, mocked_function), type_safety, spy=spy, timed=timed)
+        self._function_name = mocked_function.__name__
+        self._function_mock = object.__getattribute__(self, mocked_function.__name__)
+
+    def __call__(self, *args, **kwargs):
+        return self._function_mock(*args, **kwargs)
+
+
+def is_mock(thing: Any) -> bool:
+    """
+    Checks if a thing is a mock.
+
+    The type of the thing is checked, as a mock claims to be of the class it mocks, and on python 3.6 the types built
+    for mocks are not instances of the generic `MockObject` as far as `isinstance` is concerned.
+    """
+    return issubclass(type(thing), MockObject)
+
+
+def is_mock_function(thing: Any) -> bool:
+    """
+    Checks if a thing is a mock of a function.
+    """
+    return issubclass(type(thing), MockFunction)
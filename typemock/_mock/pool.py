@@ -0,0 +1,82 @@
+import inspect
+from typing import Dict, List, Tuple, Type, TypeVar, Any, cast
+
+from typemock._mock import _tmock, _reset
+from typemock.api import MockingError, TypeSafety
+
+T = TypeVar('T')
+
+_PoolKey = Tuple[Type[Any], TypeSafety]
+
+
+class MockPool:
+    """
+    Hands out reset mocks, reusing those which have been released rather than building new ones.
+
+    Building a mock involves introspecting and validating the mocked class, which can add up over a large suite of tests.
+
+    Examples:
+
+        pool = MockPool()
+
+        class MyTest(TestCase):
+
+            def setUp(self):
+                self.my_mock = pool.tmock(MyThing)
+
+            def tearDown(self):
+                pool.release_all()
+
+    """
+
+    def __init__(self):
+        self._free: Dict[_PoolKey, List[Any]] = {}
+        self._in_use: List[Tuple[_PoolKey, Any]] = []
+
+    def tmock(self, clazz: Type[T], type_safety: TypeSafety = TypeSafety.STRICT) -> T:
+        """
+        Returns a mock of the given class, with no behaviour or interactions, which is not in use.
+
+        Args:
+            clazz:
+            type_safety:
+
+        Returns:
+
+            mock:
+
+        """
+        if not inspect.isclass(clazz):
+            raise MockingError("Only classes can be pooled, not {}".format(clazz))
+        key = (clazz, type_safety)
+        free = self._free.get(key)
+        if free:
+            mock = free.pop()
+            _reset(mock)
+        else:
+            mock = _tmock(cast(Any, clazz), type_safety=type_safety)
+        self._in_use.append((key, mock))
+        return mock
+
+    def release(self, mock: Any) -> None:
+        """
+        Returns a mock to the pool to be handed out again.
+
+        Args:
+            mock:
+
+        """
+        for i, (key, in_use) in enumerate(self._in_use):
+            if in_use is mock:
+                del self._in_use[i]
+                self._free.setdefault(key, []).append(mock)
+                return
+        raise MockingError("{} was not handed out by this pool".format(mock))
+
+    def release_all(self) -> None:
+        """
+        Returns all mocks in use to the pool to be handed out again.
+        """
+        for key, mock in self._in_use:
+            self._free.setdefault(key, []).append(mock)
+        self._in_use = []
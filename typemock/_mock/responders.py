@@ -1,24 +1,52 @@
-from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar, Callable, Any, Tuple
+import copy
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from abc import ABCMeta, abstractmethod
+from enum import Enum
+from typing import Generic, List, TypeVar, Callable, Any, AsyncIterable, Iterator, AsyncIterator, Optional, Set
 
-from typemock.api import NoBehaviourSpecifiedError, DoFunction
+from typemock._utils import Blank, is_type
+from typemock.api import NoBehaviourSpecifiedError, DoFunction, StreamSource, MockTypeSafetyError
+from typemock.chaos import ChaosSchedule, Outcome
 
 T = TypeVar('T')
 R = TypeVar('R')
 
 
-class Responder(ABC, Generic[R]):
+class Responder(Generic[R], metaclass=ABCMeta):
     """
     Base Responder for a given set of args. Allows for implementation of different logic to get the response.
     """
 
+    # The metaclass is used rather than an ABC base, as before python 3.7 ABC gives its subclasses an instance dict.
+    __slots__ = ()
+
+    # Whether every response was type checked when the responder was specified, so need not be checked again.
+    validated = False
+
     @abstractmethod
     def response(self, *args, **kwargs) -> R:
         pass
 
+    def rewind(self) -> None:
+        """
+        Returns the responder to the state it was in before its first response.
+        """
+
+    def fork(self) -> 'Responder[R]':
+        """
+        Returns a responder for a forked mock, which carries on from the state of this one without affecting it.
+
+        Responders which hold no state between responses are shared.
+        """
+        return self
+
 
 class ResponderBasic(Generic[R], Responder[R]):
 
+    __slots__ = ('_response',)
+
     def __init__(self, response: R):
         self._response = response
 
@@ -26,8 +54,107 @@ class ResponderBasic(Generic[R], Responder[R]):
         return self._response
 
 
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, type(None), range, frozenset, Enum)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if type(value) is tuple:
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+class ResponderImmutable(Generic[R], ResponderBasic[R]):
+    """
+    Responds with an immutable response, which cannot stop being of the type it was checked to be when specified.
+    """
+
+    __slots__ = ()
+
+    validated = True
+
+
+class _RepeatedContainer(Exception):
+    pass
+
+
+def _snapshot_copier(value: Any) -> Callable[[], Any]:
+    """
+    Compiles a function which rebuilds only the mutable parts of the given value.
+
+    Immutable members are shared between copies, plain lists, dicts and sets are shallow copied with only their
+    mutable members being rebuilt. Anything else falls back to a deepcopy of that member. A value which holds the same
+    list, dict or set more than once, such as a list which contains itself, is deep copied whole, so that its copies
+    hold it more than once too.
+
+    Args:
+        value:
+
+    Returns:
+
+        copier:
+
+    """
+    try:
+        return _container_copier(value, set())
+    except _RepeatedContainer:
+        return lambda: copy.deepcopy(value)
+
+
+def _container_copier(value: Any, seen: Set[int]) -> Callable[[], Any]:
+    if _is_immutable(value):
+        return lambda: value
+    value_type = type(value)
+    if value_type is list or value_type is dict or value_type is set:
+        if id(value) in seen:
+            raise _RepeatedContainer()
+        seen.add(id(value))
+    if value_type is list or value_type is dict:
+        keys = range(len(value)) if value_type is list else value.keys()
+        children = [(key, _container_copier(value[key], seen)) for key in keys if not _is_immutable(value[key])]
+        if not children:
+            return value.copy
+
+        def copy_container():
+            copied = value.copy()
+            for key, copier in children:
+                copied[key] = copier()
+            return copied
+
+        return copy_container
+    if value_type is tuple:
+        copiers = [_container_copier(item, seen) for item in value]
+        return lambda: tuple(copier() for copier in copiers)
+    if value_type is set:
+        return value.copy
+    return lambda: copy.deepcopy(value)
+
+
+class ResponderSnapshot(Generic[R], Responder[R]):
+    """
+    Responds with a fresh copy of a snapshot of the response, so that callers can not corrupt each other's results.
+    """
+
+    __slots__ = ('_snapshot', '_copier')
+
+    validated = True
+
+    def __init__(self, response: R):
+        self._snapshot = copy.deepcopy(response)
+        self._copier = _snapshot_copier(self._snapshot)
+
+    def __reduce__(self):
+        return ResponderSnapshot, (self._snapshot,)
+
+    def response(self, *args, **kwargs) -> R:
+        return self._copier()
+
+
 class ResponderRaise(Responder[Exception]):
 
+    __slots__ = ('_error',)
+
     def __init__(self, error: Exception):
         self._error = error
 
@@ -37,12 +164,24 @@ class ResponderRaise(Responder[Exception]):
 
 class ResponderMany(Generic[R], Responder[R]):
 
+    __slots__ = ('_responses', '_loop', '_index', '_counter')
+
     def __init__(self, responses: List[R], loop: bool):
         self._responses = responses
         self._loop = loop
         self._index = 0
+        # Hands out the index of each response instead, while the position is shared with other processes.
+        self._counter: Optional[Callable[[], int]] = None
+
+    def __reduce__(self):
+        return ResponderMany, (self._responses, self._loop)
 
     def response(self, *args, **kwargs) -> R:
+        if self._counter is not None:
+            index = self._counter()
+            if index < 0:
+                raise NoBehaviourSpecifiedError("No more responses. Do you want to loop through many responses?")
+            return self._responses[index]
         if self._index > len(self._responses) - 1:
             if self._loop:
                 self._index = 0
@@ -52,12 +191,135 @@ class ResponderMany(Generic[R], Responder[R]):
         self._index += 1
         return response
 
+    def rewind(self) -> None:
+        self._index = 0
+
+    def fork(self) -> 'ResponderMany[R]':
+        forked = ResponderMany(self._responses, self._loop)
+        forked._index = self._index
+        return forked
+
+
+class ResponderChaos(Generic[R], Responder[R]):
+    """
+    Picks a weighted random outcome for each call, from a seeded random generator.
+    """
+
+    __slots__ = (
+        '_schedule',
+        '_outcomes',
+        '_cumulative_weights',
+        '_total_weight',
+        '_random',
+        '_burst_outcome',
+        '_burst_remaining',
+        '_started_at',
+    )
+
+    def __init__(self, schedule: ChaosSchedule[R]):
+        self._schedule = schedule
+        self._outcomes = [outcome for _, outcome in schedule.outcomes]
+        self._cumulative_weights = list(accumulate(weight for weight, _ in schedule.outcomes))
+        self._total_weight = self._cumulative_weights[-1]
+        self.rewind()
+
+    def rewind(self) -> None:
+        self._random = random.Random(self._schedule.seed)
+        self._burst_outcome: Outcome[R] = self._outcomes[0]
+        self._burst_remaining = 0
+        self._started_at: Optional[float] = None
+
+    def fork(self) -> 'ResponderChaos[R]':
+        forked = copy.copy(self)
+        forked._random = random.Random()
+        forked._random.setstate(self._random.getstate())
+        return forked
+
+    def response(self, *args, **kwargs) -> R:
+        schedule = self._schedule
+        if schedule.outages:
+            now = schedule.clock()
+            if self._started_at is None:
+                self._started_at = now
+            elapsed = now - self._started_at
+            for outage in schedule.outages:
+                if outage.start <= elapsed < outage.end:
+                    raise outage.error
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            outcome = self._burst_outcome
+        else:
+            index = bisect_right(self._cumulative_weights, self._random.random() * self._total_weight)
+            outcome = self._outcomes[min(index, len(self._outcomes) - 1)]
+            if outcome.error is not None:
+                self._burst_outcome = outcome
+                self._burst_remaining = schedule.burst_length - 1
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.result
+
 
 class ResponderDo(Generic[R], Responder[R]):
 
-    def __init__(self, do_function: DoFunction, ordered_call: Callable[..., Tuple[Tuple[str, Any], ...]]):
-        self._ordered_call = ordered_call
+    __slots__ = ('_do_function',)
+
+    def __init__(self, do_function: DoFunction):
         self._do_function = do_function
 
     def response(self, *args, **kwargs) -> R:
         return self._do_function(*args, **kwargs)
+
+
+def _stream(items: Any, check_item: Callable[[Any], None]) -> Iterator[Any]:
+    for item in items:
+        check_item(item)
+        yield item
+
+
+async def _async_stream(items: Any, check_item: Callable[[Any], None]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            check_item(item)
+            yield item
+    else:
+        for item in items:
+            check_item(item)
+            yield item
+
+
+class StreamItemCheck:
+    """
+    Checks the type of each item of a stream, as it is yielded.
+    """
+
+    __slots__ = ('_member', '_item_type')
+
+    def __init__(self, member: str, item_type: Any):
+        self._member = member
+        self._item_type = item_type
+
+    def __call__(self, item: Any) -> None:
+        if self._item_type is not Blank and not is_type(item, self._item_type):
+            raise MockTypeSafetyError("{} stream item must be of type:{}".format(
+                self._member,
+                self._item_type
+            ))
+
+
+class ResponderStream(Responder[Any]):
+    """
+    Responds with a lazy stream over the items of a fresh iterable from the source on each call.
+    """
+
+    __slots__ = ('_source', '_check_item', '_is_async')
+
+    def __init__(self, source: StreamSource, check_item: Callable[[Any], None], is_async: bool):
+        self._source = source
+        self._check_item = check_item
+        self._is_async = is_async
+
+    def response(self, *args, **kwargs) -> Any:
+        items = self._source(*args, **kwargs)
+        if self._is_async:
+            return _async_stream(items, self._check_item)
+        return _stream(items, self._check_item)
@@ -0,0 +1,6 @@
+from itertools import count
+from typing import Callable
+
+# A global, monotonically increasing numbering of interactions with all mocks, so that the order of interactions can be
+# verified across methods and mocks.
+next_sequence: Callable[[], int] = count(1).__next__
@@ -0,0 +1,345 @@
+import importlib
+import math
+import os
+import pickle
+import threading
+import uuid
+from functools import partial
+from multiprocessing.managers import BaseManager
+from multiprocessing.util import Finalize
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from typemock._mock import _tmock
+from typemock._mock.object import MockObject, MockFunction, is_mock, is_mock_function
+from typemock._mock.responders import Responder, ResponderMany
+from typemock.api import MockingError
+
+_error_not_picklable = """
+Could not send the behaviour of {mock} to other processes.
+
+The mocked class or function, and the args and results of its specified behaviour, must be picklable.
+"""
+
+
+class _SharedStore:
+    """
+    Lives in a manager process, and holds the state of shared mocks which is shared by all processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._specs: Dict[str, bytes] = {}
+        self._records: List[Tuple[str, Any]] = []
+        # The next index, number of responses, and whether to loop, of each series of responses.
+        self._sequences: List[List[Any]] = []
+
+    def publish(self, mock_id: str, spec: bytes) -> None:
+        self._specs[mock_id] = spec
+
+    def spec(self, mock_id: str) -> bytes:
+        return self._specs[mock_id]
+
+    def add_sequence(self, index: int, length: int, loop: bool) -> int:
+        with self._lock:
+            self._sequences.append([index, length, loop])
+            return len(self._sequences) - 1
+
+    def next_index(self, sequence_id: int) -> int:
+        """
+        Hands out the index of the next response of a series, or -1 if the series has no more responses.
+        """
+        with self._lock:
+            sequence = self._sequences[sequence_id]
+            index, length, loop = sequence
+            if index >= length:
+                if not loop or length == 0:
+                    return -1
+                index = 0
+            sequence[0] = index + 1
+            return index
+
+    def sequence_index(self, sequence_id: int) -> int:
+        return self._sequences[sequence_id][0]
+
+    def record(self, mock_id: str, batch: Any) -> None:
+        with self._lock:
+            self._records.append((mock_id, batch))
+
+    def drain(self) -> List[Tuple[str, Any]]:
+        with self._lock:
+            records = self._records
+            self._records = []
+            return records
+
+
+class _SharedStoreManager(BaseManager):
+    pass
+
+
+_SharedStoreManager.register("SharedStore", _SharedStore)
+
+# The mocks shared by this process, by their id.
+_shared_mocks: Dict[str, MockObject[Any]] = {}
+
+# The mocks rebuilt in a worker process, by the id of the mock they were rebuilt from.
+_worker_mocks: Dict[str, MockObject[Any]] = {}
+
+
+class _MockShare:
+
+    def __init__(self, store: Any, mock_id: str, batch_size: int):
+        self.store = store
+        self.mock_id = mock_id
+        self.batch_size = batch_size
+        self.pid = os.getpid()
+
+    def reduce(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return _worker_mock, (self.store, self.mock_id, self.pid, self.batch_size)
+
+
+def _sequence_id(store: Any, responder: Responder, shared_sequences: List[Tuple[ResponderMany, int]]) -> Optional[int]:
+    """
+    Moves the position of a series of responses into the store, so that it is shared by every process.
+    """
+    if not isinstance(responder, ResponderMany):
+        return None
+    sequence_id = store.add_sequence(responder._index, len(responder._responses), responder._loop)
+    responder._counter = partial(store.next_index, sequence_id)
+    shared_sequences.append((responder, sequence_id))
+    return sequence_id
+
+
+def _mock_spec(mock: MockObject[Any], store: Any, shared_sequences: List[Tuple[ResponderMany, int]]) -> bytes:
+    mocked_thing = mock._mocked_thing
+    if isinstance(mocked_thing, ModuleType):
+        mocked_thing = mocked_thing.__name__
+    methods = {
+        method_state.name: [
+            (key, responder, _sequence_id(store, responder, shared_sequences))
+            for key, responder in method_state.specified_responders()
+        ]
+        for method_state in mock._mock_method_states
+    }
+    attributes = {}
+    for name, attribute_state in mock._mock_attribute_states.items():
+        responder = attribute_state.specified_responder()
+        if responder is not None:
+            attributes[name] = (responder, _sequence_id(store, responder, shared_sequences))
+    spec = (mocked_thing, mock._type_safety, mock._spy, mock._timed, methods, attributes)
+    try:
+        return pickle.dumps(spec)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise MockingError(_error_not_picklable.format(mock=mock)) from e
+
+
+class _WorkerRecorder:
+    """
+    Sends the interactions with a mock rebuilt in a worker process to the store, in batches.
+    """
+
+    def __init__(self, store: Any, mock_id: str, mock: MockObject[Any], batch_size: int):
+        self._store = store
+        self._mock_id = mock_id
+        self._mock = mock
+        self._batch_size = batch_size
+        self._pending = 0
+        self._sent_calls: Dict[str, int] = {}
+        self._sent_gets: Dict[str, int] = {}
+        self._sent_sets: Dict[str, int] = {}
+
+    def tick(self) -> None:
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self._pending = 0
+        calls = []
+        for method_state in self._mock._mock_method_states:
+            call_log = method_state.recorded_calls()
+            sequences = method_state.recorded_sequences()
+            start = self._sent_calls.get(method_state.name, 0)
+            end = len(call_log)
+            if method_state.is_timed():
+                # A call which is still responding has no duration yet, so it is sent, along with the calls after it,
+                # with the next batch.
+                durations = method_state.recorded_durations()
+                end = next((i for i in range(start, end) if math.isnan(durations[i])), end)
+            for i in range(start, end):
+                timing = None
+                if method_state.is_timed():
+                    timing = (method_state.recorded_times()[i], method_state.recorded_durations()[i])
+                calls.append((sequences[i], method_state.name, call_log[i], timing))
+            self._sent_calls[method_state.name] = end
+        calls.sort(key=lambda call: call[0])
+        gets = {}
+        sets = {}
+        for name, attribute_state in self._mock._mock_attribute_states.items():
+            count = attribute_state.call_count_gets()
+            if count > self._sent_gets.get(name, 0):
+                gets[name] = count - self._sent_gets.get(name, 0)
+            self._sent_gets[name] = count
+            set_calls = attribute_state.recorded_sets()
+            if len(set_calls) > self._sent_sets.get(name, 0):
+                sets[name] = set_calls[self._sent_sets.get(name, 0):]
+            self._sent_sets[name] = len(set_calls)
+        if calls or gets or sets:
+            self._store.record(self._mock_id, (calls, gets, sets))
+
+
+def _recorded(method: Any, recorder: _WorkerRecorder) -> Any:
+    def recorded_method(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            recorder.tick()
+
+    return recorded_method
+
+
+def _build_worker_mock(store: Any, mock_id: str, batch_size: int) -> MockObject[Any]:
+    mocked_thing, type_safety, spy, timed, methods, attributes = pickle.loads(store.spec(mock_id))
+    if isinstance(mocked_thing, str):
+        mocked_thing = importlib.import_module(mocked_thing)
+    mock: MockObject[Any] = _tmock(mocked_thing, type_safety=type_safety, spy=spy, timed=timed)
+    for name, responders in methods.items():
+        method_state = mock._mock_method_states_by_name[name]
+        for key, responder, sequence_id in responders:
+            if sequence_id is not None:
+                responder._counter = partial(store.next_index, sequence_id)
+            method_state._set_key_to_responder(key, responder)
+    for name, (responder, sequence_id) in attributes.items():
+        if sequence_id is not None:
+            responder._counter = partial(store.next_index, sequence_id)
+        mock._mock_attribute_states[name]._responder = responder
+    recorder = _WorkerRecorder(store, mock_id, mock, batch_size)
+    for method_state in mock._mock_method_states:
+        # Bound methods of the mock are replaced with ones which count towards the next batch.
+        mock.__dict__[method_state.name] = _recorded(mock.__dict__[method_state.name], recorder)
+    if is_mock_function(mock):
+        function_mock = cast(MockFunction[Any], mock)
+        function_mock._function_mock = mock.__dict__[function_mock._function_name]
+    # Whatever is left is sent when the worker process exits.
+    Finalize(None, recorder.flush, exitpriority=10)
+    return mock
+
+
+def _worker_mock(store: Any, mock_id: str, pid: int, batch_size: int) -> MockObject[Any]:
+    """
+    Unpickles a shared mock. In the process which shared it this is the mock itself, and in any other process it is
+    rebuilt from the shared behaviour, once per process.
+    """
+    if os.getpid() == pid:
+        return _shared_mocks[mock_id]
+    mock = _worker_mocks.get(mock_id)
+    if mock is None:
+        mock = _build_worker_mock(store, mock_id, batch_size)
+        _worker_mocks[mock_id] = mock
+    return mock
+
+
+def _merge(mock: MockObject[Any], batch: Any) -> None:
+    calls, gets, sets = batch
+    for _, name, call, timing in calls:
+        mock._mock_method_states_by_name[name].record_call(call, timing)
+    for name, count in gets.items():
+        mock._mock_attribute_states[name].record_gets(count)
+    for name, items in sets.items():
+        for item in items:
+            mock._mock_attribute_states[name].record_set(item)
+
+
+class SharedMocks:
+    """
+    Shares mocks with other processes, such as the workers of a `ProcessPoolExecutor`, while the context is open.
+
+    The behaviour of each mock is sent to a process once, the first time the mock is unpickled there. The workers
+    send their interactions back in batches, and series of responses are shared, so that each response is only given
+    once across all processes. Interactions are merged into the mocks when the context closes, or on `sync`.
+    """
+
+    def __init__(self, mocks: Tuple[Any, ...], batch_size: int):
+        for mock in mocks:
+            if not is_mock(mock):
+                raise MockingError("Can only share a mock, not {}".format(mock))
+            if mock.is_open():
+                raise MockingError("Cannot share a mock while its behaviour is being specified")
+            if mock._mock_share is not None:
+                raise MockingError("{} is already shared".format(mock))
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self._mocks: List[MockObject[Any]] = list(mocks)
+        self._batch_size = batch_size
+        self._manager: Optional[_SharedStoreManager] = None
+        self._store: Any = None
+        self._shared_sequences: List[Tuple[ResponderMany, int]] = []
+
+    def __enter__(self) -> 'SharedMocks':
+        self._manager = _SharedStoreManager()
+        self._manager.start()
+        self._store = self._manager.SharedStore()  # type: ignore
+        try:
+            for mock in self._mocks:
+                mock_id = uuid.uuid4().hex
+                self._store.publish(mock_id, _mock_spec(mock, self._store, self._shared_sequences))
+                mock._mock_share = _MockShare(self._store, mock_id, self._batch_size)
+                _shared_mocks[mock_id] = mock
+        except Exception:
+            self._close()
+            raise
+        return self
+
+    def sync(self) -> None:
+        """
+        Merges the interactions which other processes have sent so far into the mocks, so that they can be verified.
+
+        Workers send their interactions when they have made `batch_size` of them, and when they exit.
+        """
+        for mock_id, batch in self._store.drain():
+            _merge(_shared_mocks[mock_id], batch)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._close()
+
+    def _close(self):
+        try:
+            self.sync()
+            for responder, sequence_id in self._shared_sequences:
+                responder._index = self._store.sequence_index(sequence_id)
+                responder._counter = None
+        finally:
+            for mock in self._mocks:
+                if mock._mock_share is not None:
+                    del _shared_mocks[mock._mock_share.mock_id]
+                    del mock._mock_share
+            self._shared_sequences = []
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+
+
+def _share(*mocks: Any, batch_size: int = 100) -> SharedMocks:
+    """
+    Shares mocks with other processes, such as the workers of a `ProcessPoolExecutor`, while the context is open.
+
+    Examples:
+
+        with share(my_mock):
+            with ProcessPoolExecutor() as executor:
+                executor.map(do_work, [my_mock] * 10)
+
+        verify(my_mock, exactly=10).do_something()
+
+    Args:
+        mocks:
+        batch_size:
+
+            How many calls a worker makes to the mocks before sending its interactions.
+
+    Returns:
+
+        shared_mocks:
+
+    """
+    return SharedMocks(mocks, batch_size)
@@ -0,0 +1,213 @@
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Generic, Sequence, TypeVar, cast
+
+from typemock._mock import MockObject
+from typemock._mock.object import is_mock, is_mock_function
+from typemock._mock.methods import MockMethodState
+from typemock.api import MockingError
+from typemock.match import as_matcher, contains_captor
+
+T = TypeVar('T')
+
+_error_not_timed = """
+Method: {method_name} has no timings.
+
+Mock with timed=True to record them, eg. tmock(MyThing, timed=True).
+"""
+
+
+def _numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+        return numpy
+    except ImportError:
+        return None
+
+
+class CallQuery:
+    """
+    A query over the recorded calls of a mocked method.
+
+    Queries are immutable, and refining one with `where` returns a new query over the subset of calls which match.
+    Args are looked up by name, by their position in the recorded calls. Each condition is checked once per distinct
+    call, rather than once per call, and the values of an arg are read from the column of its values for every call,
+    which is an array while they are all ints or all floats.
+    """
+
+    def __init__(self, method_state: MockMethodState, indices: Optional[Sequence[int]] = None):
+        self._method_state = method_state
+        call_log = method_state.recorded_calls()
+        self._call_log = call_log
+        self._call_ids = call_log.ids()
+        self._distinct_calls = call_log.distinct()
+        if indices is None:
+            indices = range(len(self._call_ids))
+        self._indices = indices
+
+    def where(self, **conditions: Any) -> 'CallQuery':
+        """
+        Returns a query over the calls which match all of the conditions.
+
+        Args:
+            conditions:
+
+                The names of args, with a value or matcher for them to match.
+
+        """
+        indices = self._indices
+        call_ids = self._call_ids
+        for arg_name, condition in conditions.items():
+            position = self._method_state.call_position_of(arg_name)
+            matches = as_matcher(condition).compile()
+            if contains_captor(condition):
+                # Captors need to see the value of every call, not just of every distinct call.
+                values = self._call_log.column(position)
+                indices = [i for i in indices if matches(values[i])]
+            else:
+                matched = [matches(call[position][1]) for call in self._distinct_calls]
+                indices = [i for i in indices if matched[call_ids[i]]]
+        return CallQuery(self._method_state, indices)
+
+    def count(self) -> int:
+        return len(self._indices)
+
+    def column(self, arg_name: str) -> List[Any]:
+        """
+        The values of the arg with the given name, for each call, in the order they were called.
+        """
+        values = self._column_values(arg_name)
+        if len(self._indices) == len(values):
+            return list(values)
+        return [values[i] for i in self._indices]
+
+    def _column_values(self, arg_name: str) -> Any:
+        return self._call_log.column(self._method_state.call_position_of(arg_name))
+
+    def array(self, arg_name: str) -> Any:
+        """
+        The values of the arg with the given name as a numpy array, for fast aggregation.
+
+        Raises:
+
+            MockingError: If numpy is not installed.
+
+        """
+        numpy = _numpy()
+        if numpy is None:
+            raise MockingError("numpy must be installed to query calls as arrays.")
+        values = self._column_values(arg_name)
+        if not isinstance(values, array):
+            return numpy.asarray(self.column(arg_name))
+        # Ints and floats are copied from the column's array as they are, without converting each one.
+        column = numpy.array(values)
+        if len(self._indices) == len(values):
+            return column
+        return column[numpy.asarray(self._indices, dtype=numpy.intp)]
+
+    def sequences(self) -> List[int]:
+        """
+        The global sequence number of each call, which orders calls across all methods and mocks.
+        """
+        sequences = self._method_state.recorded_sequences()
+        return [sequences[i] for i in self._indices]
+
+    def _timing(self, recorded: Any) -> List[float]:
+        if not self._method_state.is_timed():
+            raise MockingError(_error_not_timed.format(method_name=self._method_state.name))
+        return [recorded[i] for i in self._indices]
+
+    def timestamps(self) -> List[float]:
+        """
+        The monotonic time, in seconds, at which each call arrived.
+        """
+        return self._timing(self._method_state.recorded_times())
+
+    def durations(self) -> List[float]:
+        """
+        How long, in seconds, each call took to respond, including any `then_do` function or spied method, and awaiting
+        a spied async method. A call which is still responding has a duration of nan.
+        """
+        return self._timing(self._method_state.recorded_durations())
+
+    def rate(self) -> float:
+        """
+        The calls per second, between the first and last call.
+        """
+        timestamps = self.timestamps()
+        if len(timestamps) < 2:
+            return 0.0
+        elapsed = timestamps[-1] - timestamps[0]
+        if elapsed <= 0:
+            return float("inf")
+        return (len(timestamps) - 1) / elapsed
+
+    def duration_percentile(self, percentile: float) -> float:
+        """
+        The duration, in seconds, below which the given percentage of calls responded.
+
+        Args:
+            percentile:
+
+                Between 0 and 100. Values between calls are linearly interpolated.
+
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be between 0 and 100.")
+        durations = sorted(self.durations())
+        if len(durations) == 0:
+            raise ValueError("There are no calls.")
+        position = (len(durations) - 1) * percentile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(durations) - 1)
+        return durations[lower] + (durations[upper] - durations[lower]) * (position - lower)
+
+    def group_by(self, arg_name: str) -> Dict[Any, int]:
+        """
+        Counts the calls for each distinct value of the arg with the given name.
+        """
+        column = self.column(arg_name)
+        try:
+            return dict(Counter(column))
+        except TypeError:
+            return dict(Counter(repr(value) for value in column))
+
+    def histogram(self, arg_name: str, bin_width: Any) -> Dict[Any, int]:
+        """
+        Counts the calls for numeric bins of the arg with the given name.
+
+        Args:
+            arg_name:
+            bin_width:
+
+                Values are counted in the bin which starts at the nearest multiple of the width below them.
+
+        """
+        numpy = _numpy()
+        if numpy is not None and len(self._indices) > 0:
+            bins, counts = numpy.unique(
+                (self.array(arg_name) // bin_width) * bin_width,
+                return_counts=True
+            )
+            return {bin_start.item(): count.item() for bin_start, count in zip(bins, counts)}
+        return dict(Counter((value // bin_width) * bin_width for value in self.column(arg_name)))
+
+
+class _CallsObject(Generic[T]):
+
+    def __init__(self, mock: MockObject[T]):
+        self._mock = mock
+
+    def __getattr__(self, item: str) -> CallQuery:
+        method_state = self._mock._mock_method_states_by_name.get(item)
+        if method_state is None:
+            raise MockingError("Only the calls of methods can be queried, not '{}'".format(item))
+        return CallQuery(method_state)
+
+
+def _calls(mock: Any) -> Any:
+    if not is_mock(mock):
+        raise MockingError("Can only query the calls of a mock, not {}".format(mock))
+    if is_mock_function(mock):
+        return CallQuery(mock._mock_method_states_by_name[mock._function_name])
+    return _CallsObject(cast(MockObject[Any], mock))
@@ -1,38 +1,48 @@
+import importlib
 import inspect
-from typing import List, Type, TypeVar, Optional
+import pkgutil
+import weakref
+from types import ModuleType
+from typing import List, Type, TypeVar, Optional, Dict, Tuple, Any, Union, Iterator
 
-from typemock._utils import methods, attributes, Blank, try_instantiate_class
+from typemock._utils import methods, attributes, Blank, try_instantiate_class, FunctionEntry
 from typemock.api import MemberType, MissingHint, MissingTypeHintsError, TypeSafety
 
 T = TypeVar('T')
 
+# Validation only depends on the class, the safety level, and which instance attributes there are. Entries are dropped
+# along with their class, so that classes which are redefined, eg. by reloading a module, are validated afresh.
+_validation_cache: 'weakref.WeakKeyDictionary[type, Dict[Tuple[Any, ...], List[MissingHint]]]' = \
+    weakref.WeakKeyDictionary()
 
-def _validate_method_annotations(clazz: Type[T], type_safety: TypeSafety, missing: List[MissingHint]):
-    for func_entry in methods(clazz):
+
+def _validate_function_annotations(func_entries: List[FunctionEntry], type_safety: TypeSafety, missing: List[MissingHint]):
+    for func_entry in func_entries:
         func = func_entry.func
         name = func_entry.name
         sig = inspect.signature(func_entry.func)
-        if len(sig.parameters) > 0:
-            annotations = func.__annotations__
-            for param_name in sig.parameters:
-                if param_name == "self":
-                    continue
-                else:
-                    if param_name not in annotations:
-                        missing.append(
-                            MissingHint(
-                                path=[name, param_name],
-                                member_type=MemberType.ARG
-                            )
+        annotations = func.__annotations__
+        # The first parameter of a method receives the instance or class, so needs no hint.
+        param_names = list(sig.parameters) if func_entry.is_static else list(sig.parameters)[1:]
+        for param_name in param_names:
+            if param_name == "self":
+                continue
+            else:
+                if param_name not in annotations:
+                    missing.append(
+                        MissingHint(
+                            path=[name, param_name],
+                            member_type=MemberType.ARG
                         )
-
-            if type_safety != TypeSafety.NO_RETURN_IS_NONE_RETURN and "return" not in annotations:
-                missing.append(
-                    MissingHint(
-                        path=[name],
-                        member_type=MemberType.RETURN
                     )
+
+        if type_safety != TypeSafety.NO_RETURN_IS_NONE_RETURN and "return" not in annotations:
+            missing.append(
+                MissingHint(
+                    path=[name],
+                    member_type=MemberType.RETURN
                 )
+            )
 
 
 def _validate_attributes(clazz: Type[T], instance: Optional[T], missing: List[MissingHint]):
@@ -49,10 +59,81 @@ def _validate_attributes(clazz: Type[T], instance: Optional[T], missing: List[Mi
 def get_missing_class_type_hints(clazz: Type[T], instance: Optional[T], type_safety: TypeSafety) -> List[MissingHint]:
     missing: List[MissingHint] = []
     _validate_attributes(clazz, instance, missing)
-    _validate_method_annotations(clazz, type_safety, missing)
+    _validate_function_annotations(methods(clazz), type_safety, missing)
     return missing
 
 
+def _instance_layout(instance: Any) -> Optional[Tuple[str, ...]]:
+    if instance is None:
+        return None
+    return tuple(sorted(getattr(instance, "__dict__", {})))
+
+
+def _cached_missing_class_type_hints(clazz: Type[T], instance: Optional[T], type_safety: TypeSafety) -> List[MissingHint]:
+    key = (type_safety, _instance_layout(instance))
+    try:
+        results = _validation_cache.setdefault(clazz, {})
+    except TypeError:
+        # The class cannot be weakly referenced, so is validated every time.
+        return get_missing_class_type_hints(clazz, instance, type_safety)
+    missing = results.get(key)
+    if missing is None:
+        missing = get_missing_class_type_hints(clazz, instance, type_safety)
+        results[key] = missing
+    return list(missing)
+
+
+def _modules(module: ModuleType) -> Iterator[ModuleType]:
+    yield module
+    for module_info in pkgutil.walk_packages(getattr(module, "__path__", []), prefix=module.__name__ + "."):
+        yield importlib.import_module(module_info.name)
+
+
+def module_classes(module: ModuleType) -> List[type]:
+    """
+    The classes defined in a module, rather than imported into it.
+    """
+    return [
+        clazz for _, clazz in inspect.getmembers(module, inspect.isclass) if clazz.__module__ == module.__name__
+    ]
+
+
+def _validate_module_type_hints(
+        module: Union[ModuleType, str],
+        type_safety: TypeSafety = TypeSafety.STRICT
+) -> Dict[type, List[MissingHint]]:
+    """
+    Validates the type hints of every class defined in a module, or in a package and all of its modules, in one pass.
+
+    The results are cached, so that mocking the classes later does not validate them again.
+
+    Args:
+        module:
+
+            The module or package, or its name.
+
+        type_safety:
+
+    Returns:
+
+        missing:
+
+            The missing hints of each class which has any.
+
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    report: Dict[type, List[MissingHint]] = {}
+    if type_safety == TypeSafety.RELAXED:
+        return report
+    for each_module in _modules(module):
+        for clazz in module_classes(each_module):
+            missing = _cached_missing_class_type_hints(clazz, try_instantiate_class(clazz), type_safety)
+            if len(missing) > 0:
+                report[clazz] = missing
+    return report
+
+
 def validate_class_type_hints(
         clazz: Type[T],
         instance: Optional[T] = None,
@@ -71,10 +152,35 @@ def validate_class_type_hints(
     """
     if type_safety == TypeSafety.RELAXED:
         return
-    instance = instance or try_instantiate_class(clazz)
-    missing = get_missing_class_type_hints(clazz, instance, type_safety)
+    if instance is None:
+        instance = try_instantiate_class(clazz)
+    missing = _cached_missing_class_type_hints(clazz, instance, type_safety)
     if len(missing) > 0:
         raise MissingTypeHintsError(
             "{} has missing type hints.".format(clazz),
             missing
         )
+
+
+def validate_function_type_hints(
+        mocked_thing: Any,
+        func_entries: List[FunctionEntry],
+        type_safety: TypeSafety = TypeSafety.STRICT
+) -> None:
+    """
+    Validates the type hints of a function, or of the functions of a module.
+
+    Raises:
+
+        MissingTypeHintsError
+
+    """
+    if type_safety == TypeSafety.RELAXED:
+        return
+    missing: List[MissingHint] = []
+    _validate_function_annotations(func_entries, type_safety, missing)
+    if len(missing) > 0:
+        raise MissingTypeHintsError(
+            "{} has missing type hints.".format(mocked_thing),
+            missing
+        )
@@ -0,0 +1,71 @@
+from functools import partial
+from types import MethodType
+from typing import Any, cast
+
+from typemock._mock import MockObject
+from typemock._mock.attributes import AttributeResponseBuilder
+from typemock._mock.methods import MethodResponseBuilder
+from typemock._mock.object import MockFunction, is_mock, is_mock_function
+from typemock.api import MockingError
+
+_error_not_stubbable = """
+Can only stub a mock, or a method of a mock, not {thing}
+
+Examples:
+
+    stub(my_mock).do_something(1).then_return("A Result")
+    stub(my_mock.do_something)(1).then_return("A Result")
+"""
+
+
+class _StubObject:
+    """
+    Specifies the behaviour of a mock without opening it, so the mock can be stubbed and used at any point.
+    """
+
+    __slots__ = ('_mock',)
+
+    def __init__(self, mock: MockObject[Any]):
+        self._mock = mock
+
+    def __getattr__(self, item: str) -> Any:
+        mock = self._mock
+        method_state = mock._mock_method_states_by_name.get(item)
+        if method_state is not None:
+            return partial(MethodResponseBuilder, method_state, mock)
+        attribute_state = mock._mock_attribute_states.get(item)
+        if attribute_state is not None:
+            return AttributeResponseBuilder(attribute_state)
+        raise MockingError("Only the methods and attributes of a mock can be stubbed, not '{}'".format(item))
+
+    def __call__(self, *args, **kwargs) -> Any:
+        mock = self._mock
+        if not is_mock_function(mock):
+            raise MockingError("Only a mocked function can be stubbed by calling it, not {}".format(mock))
+        return getattr(self, cast(MockFunction[Any], mock)._function_name)(*args, **kwargs)
+
+
+def _stub(thing: Any) -> Any:
+    """
+    Returns a view of a mock, or of one of its methods, which returns response builders instead of responses.
+
+    Examples:
+
+        stub(my_mock).do_something(1).then_return("A Result")
+        stub(my_mock.do_something)(1).then_return("A Result")
+        stub(my_mock).an_attribute.then_return("A Result")
+        stub(my_function_mock)(1).then_return("A Result")
+
+    Args:
+        thing:
+
+    Returns:
+
+        stub:
+
+    """
+    if is_mock(thing):
+        return _StubObject(thing)
+    if isinstance(thing, MethodType) and is_mock(thing.__self__):
+        return getattr(_StubObject(cast(MockObject[Any], thing.__self__)), thing.__func__.__name__)
+    raise MockingError(_error_not_stubbable.format(thing=thing))
@@ -1,12 +1,23 @@
+import collections.abc
 import inspect
 import logging
+import os
+import reprlib
+import sys
+import sysconfig
 import types
 import typing
+import weakref
 from types import FunctionType
-from typing import List, Type, Dict, Optional, TypeVar, Union, Any
+from typing import List, Type, Dict, Optional, TypeVar, Union, Any, Tuple, Callable, cast
 
 from typeguard import check_type  # type: ignore
 
+try:
+    import dataclasses
+except ImportError:  # Before python 3.7
+    dataclasses = None  # type: ignore
+
 T = TypeVar('T')
 
 K = TypeVar('K')
@@ -17,18 +28,94 @@ class Blank:
     pass
 
 
+_short_repr = reprlib.Repr()
+_short_repr.maxstring = 80
+_short_repr.maxother = 80
+_short_repr.maxlevel = 4
+_MAX_REPR_LENGTH = 500
+
+
+def short_repr(value: Any) -> str:
+    """
+    A repr which is bounded in size, so that huge args do not make errors slow to build, or unreadable.
+    """
+    represented = _short_repr.repr(value)
+    if len(represented) > _MAX_REPR_LENGTH:
+        return represented[:_MAX_REPR_LENGTH] + "..."
+    return represented
+
+
+# Resolved hints are cached for as long as the function or class they belong to exists.
+_type_hints_cache: 'weakref.WeakKeyDictionary[Any, Dict[str, Any]]' = weakref.WeakKeyDictionary()
+
+
+def _resolve_type_hints(thing: Any, annotations: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        resolved = typing.get_type_hints(thing)
+    except Exception:
+        # Resolve each hint on its own, leaving any that cannot be as they are.
+        if inspect.isclass(thing):
+            module = sys.modules.get(thing.__module__)
+            global_namespace = dict(vars(module)) if module is not None else {}
+            local_namespace: Optional[Dict[str, Any]] = dict(vars(thing))
+            local_namespace.setdefault(thing.__name__, thing)  # type: ignore
+        else:
+            global_namespace = getattr(thing, "__globals__", {})
+            local_namespace = None
+        resolved = {}
+        for name, hint in annotations.items():
+            try:
+                resolved[name] = eval(hint, global_namespace, local_namespace) if isinstance(hint, str) else hint
+            except Exception:
+                resolved[name] = hint
+    # A None hint is kept as None, rather than as the NoneType it is resolved to.
+    return {name: None if hint is None else resolved.get(name, hint) for name, hint in annotations.items()}
+
+
+def type_hints(thing: Any) -> Dict[str, Any]:
+    """
+    The annotations of a function, or the annotations declared by a class itself, with string and forward reference
+    hints resolved, eg. under `from __future__ import annotations`.
+
+    Hints are resolved once per function or class, and cached.
+    """
+    try:
+        return _type_hints_cache[thing]
+    except (KeyError, TypeError):
+        pass
+    if inspect.isclass(thing):
+        annotations = thing.__dict__.get("__annotations__", {})
+    else:
+        annotations = getattr(thing, "__annotations__", None) or {}
+    hints = _resolve_type_hints(thing, annotations) if len(annotations) > 0 else {}
+    try:
+        _type_hints_cache[thing] = hints
+    except TypeError:
+        pass
+    return hints
+
+
 def typemock_logger():
     return logging.getLogger("typemock")
 
 
 class FunctionEntry:
+    """
+    A function to mock. Static functions, such as staticmethods and plain functions, are not passed the instance.
+    """
 
-    def __init__(self, name: str, func: FunctionType):
+    __slots__ = ('name', 'func', 'is_static')
+
+    def __init__(self, name: str, func: FunctionType, is_static: bool = False):
         self.name = name
         self.func = func
+        self.is_static = is_static
 
 
 class AttributeEntry:
+
+    __slots__ = ('name', 'initial_value', 'type_hint')
+
     def __init__(self, name: str, initial_value, type_hint: Type):
         self.name = name
         self.initial_value = initial_value
@@ -120,43 +207,213 @@ def getmembers(object, predicate=None):
     return results
 
 
+# The methods each class defines itself, by name, cached for as long as the class exists, along with the members they
+# were found from. Names which the class defines as something other than a method map to None, as they hide any method
+# of the same name in a base class.
+_own_methods_cache: 'weakref.WeakKeyDictionary[type, Tuple[Tuple[Tuple[str, Any], ...], Dict[str, Optional[FunctionEntry]]]]' = weakref.WeakKeyDictionary()
+
+_NO_METHODS_MODULES = ("builtins", "typing", "abc")
+
+_STDLIB_PATH = os.path.normcase(sysconfig.get_paths()["stdlib"])
+_SITE_PATHS = tuple(os.path.normcase(sysconfig.get_paths()[name]) for name in ("purelib", "platlib"))
+
+_stdlib_modules: Dict[str, bool] = {}
+
+
+def _is_stdlib_module(module_name: str) -> bool:
+    is_stdlib = _stdlib_modules.get(module_name)
+    if is_stdlib is None:
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        if module_file is None:
+            is_stdlib = module_name in sys.builtin_module_names
+        else:
+            module_file = os.path.normcase(os.path.abspath(module_file))
+            is_stdlib = module_file.startswith(_STDLIB_PATH) and not module_file.startswith(_SITE_PATHS)
+        _stdlib_modules[module_name] = is_stdlib
+    return is_stdlib
+
+
+def _own_methods(cls) -> Dict[str, Optional[FunctionEntry]]:
+    # Magic members are left out, as they are never mocked, and some of them refer back to the class.
+    members = tuple((name, member) for name, member in cls.__dict__.items() if not _is_magic(name))
+    cached = _own_methods_cache.get(cls)
+    if cached is not None:
+        cached_members, cached_methods = cached
+        # Members can be added to, or replaced on, a class after it is first mocked.
+        if len(cached_members) == len(members) and all(
+                cached_name == name and cached_member is member
+                for (cached_name, cached_member), (name, member) in zip(cached_members, members)
+        ):
+            return cached_methods
+    own_methods: Dict[str, Optional[FunctionEntry]] = {}
+    for name, member in members:
+        if isinstance(member, FunctionType):
+            own_methods[name] = FunctionEntry(name=name, func=member)
+        elif isinstance(member, classmethod) and isinstance(member.__func__, FunctionType):
+            own_methods[name] = FunctionEntry(name=name, func=member.__func__)
+        elif isinstance(member, staticmethod) and isinstance(member.__func__, FunctionType):
+            own_methods[name] = FunctionEntry(name=name, func=member.__func__, is_static=True)
+        else:
+            own_methods[name] = None
+    _own_methods_cache[cls] = (members, own_methods)
+    return own_methods
+
+
 def methods(cls, include_private=False) -> List[FunctionEntry]:
+    """
+    The methods of a class, including those inherited from its bases, as resolved by its MRO.
+
+    The class's own methods come first, followed by those it inherits. Methods which a class from outside the standard
+    library inherits from it, such as the mixin methods of `collections.abc` classes, are not included.
+    """
     function_entries = []
-    for name, func in cls.__dict__.items():
-        if isinstance(func, FunctionType):
-            if _is_magic(name):
+    seen = set()
+    # A standard library class is mocked along with what it inherits from the rest of the standard library.
+    skip_stdlib_bases = not _is_stdlib_module(cls.__module__)
+    for base in cls.__mro__:
+        if base.__module__ in _NO_METHODS_MODULES:
+            continue
+        if skip_stdlib_bases and _is_stdlib_module(base.__module__):
+            continue
+        for name, function_entry in _own_methods(base).items():
+            if name in seen:
                 continue
-            elif name.startswith("_"):
-                if include_private:
-                    function_entries.append(FunctionEntry(
-                        name=name,
-                        func=func
-                    ))
-            else:
-                function_entries.append(FunctionEntry(
-                    name=name,
-                    func=func
-                ))
+            seen.add(name)
+            if function_entry is None:
+                continue
+            if name.startswith("_") and not include_private:
+                continue
+            function_entries.append(function_entry)
     return function_entries
 
 
+def module_functions(module: types.ModuleType) -> List[FunctionEntry]:
+    """
+    The public functions defined in a module, rather than imported into it.
+    """
+    return [
+        FunctionEntry(name=name, func=func, is_static=True)
+        for name, func in vars(module).items()
+        if isinstance(func, FunctionType) and not name.startswith("_") and func.__module__ == module.__name__
+    ]
+
+
+def with_leading_self(signature: inspect.Signature) -> inspect.Signature:
+    """
+    The signature with an extra leading positional arg, so that a function can be bound and called like a method.
+    """
+    name = "self"
+    while name in signature.parameters:
+        name = "_" + name
+    leading = inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY)
+    return signature.replace(parameters=[leading] + list(signature.parameters.values()))
+
+
 def _type_hint_for_attribute_from_value(current_hint, value) -> Any:
     if isinstance(value, property):
-        return typing.get_type_hints(value.fget).get("return", current_hint)
+        return type_hints(value.fget).get("return", current_hint)
     else:
         return current_hint
 
 
-def attributes(cls, instance=None) -> List[AttributeEntry]:
+class _DeclaredAttribute:
+
+    __slots__ = ('name', 'type_hint', 'default', 'default_factory')
+
+    def __init__(self, name: str, type_hint: Any, default: Any, default_factory: Optional[Callable[[], Any]]):
+        self.name = name
+        self.type_hint = type_hint
+        self.default = default
+        self.default_factory = default_factory
+
+    def entry(self) -> AttributeEntry:
+        initial_value = self.default_factory() if self.default_factory is not None else self.default
+        return AttributeEntry(name=self.name, initial_value=initial_value, type_hint=self.type_hint)
+
+
+# Declared attributes are cached for as long as their class exists.
+_declared_attributes_cache: 'weakref.WeakKeyDictionary[type, List[_DeclaredAttribute]]' = weakref.WeakKeyDictionary()
+
+
+def _slot_names(cls) -> List[str]:
+    names: List[str] = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def _is_dataclass(cls) -> bool:
+    return dataclasses is not None and dataclasses.is_dataclass(cls)
+
+
+def is_declared_class(cls) -> bool:
+    """
+    Checks if the attributes of a class can be found from its declaration, without instantiating it.
+
+    This is the case for dataclasses, Protocols, abstract classes and classes with `__slots__`, which either cannot be
+    instantiated, or cannot be instantiated with None for every arg without losing attributes.
+    """
+    try:
+        if cls in _declared_attributes_cache:
+            return True
+    except TypeError:
+        return False
+    if _is_dataclass(cls) or getattr(cls, "_is_protocol", False) or inspect.isabstract(cls):
+        return True
+    return any(name not in ("__dict__", "__weakref__") for name in _slot_names(cls))
+
+
+def _declared_type_hints(cls) -> Dict[str, Any]:
+    hints: Dict[str, Any] = {}
+    for base in reversed(cls.__mro__):
+        if base.__module__ not in ("builtins", "typing", "abc"):
+            hints.update(type_hints(base))
+    return hints
+
+
+def _declared_attributes(cls) -> List[_DeclaredAttribute]:
+    declared = _declared_attributes_cache.get(cls)
+    if declared is not None:
+        return declared
+    hints = _declared_type_hints(cls)
+    init_annotations = type_hints(cls.__init__)
+    entries = {entry.name: entry for entry in _attributes(cls, None, hints, init_annotations)}
+    attributes: Dict[str, _DeclaredAttribute] = {
+        name: _DeclaredAttribute(name, entry.type_hint, entry.initial_value, None) for name, entry in entries.items()
+    }
+    # Attributes which are only annotated, such as the members of a Protocol, or fields without defaults.
+    for name, type_hint in hints.items():
+        if name not in attributes and not _is_magic(name) and not _is_private(name):
+            attributes[name] = _DeclaredAttribute(name, type_hint, None, None)
+    for name in _slot_names(cls):
+        if not _is_magic(name) and not _is_private(name):
+            attributes[name] = _DeclaredAttribute(name, hints.get(name, init_annotations.get(name, Blank)), None, None)
+    if _is_dataclass(cls):
+        for field in dataclasses.fields(cls):
+            if _is_private(field.name):
+                continue
+            default_factory = None if field.default_factory is dataclasses.MISSING else field.default_factory
+            default = None if field.default is dataclasses.MISSING else field.default
+            attributes[field.name] = _DeclaredAttribute(
+                field.name, hints.get(field.name, Blank), default, default_factory
+            )
+    declared = list(attributes.values())
+    _declared_attributes_cache[cls] = declared
+    return declared
+
+
+def _attributes(cls, instance, annotations: Dict[str, Any], init_annotations: Dict[str, Any]) -> List[AttributeEntry]:
     entries: Dict[str, AttributeEntry] = {}
-    annotations = cls.__dict__.get("__annotations__", {})
-    init_signature = inspect.getfullargspec(cls.__init__)
     class_attributes = getmembers(cls, lambda a: not (inspect.isroutine(a)))
     class_attributes = [a for a in class_attributes if not _is_magic(a[0]) and not _is_private(a[0])]
     for attribute in class_attributes:
         name = attribute[0]
         value = attribute[1]
-        type_hint = annotations.get(name, init_signature.annotations.get(name, Blank))
+        if inspect.ismemberdescriptor(value):
+            # A slot, which only has a value on an instance.
+            value = getattr(instance, name, None)
+        type_hint = annotations.get(name, init_annotations.get(name, Blank))
         if type_hint is Blank:
             type_hint = _type_hint_for_attribute_from_value(type_hint, value)
         entries[name] = AttributeEntry(
@@ -172,7 +429,7 @@ def attributes(cls, instance=None) -> List[AttributeEntry]:
         if name in entries:
             pass
         else:
-            type_hint = init_signature.annotations.get(attribute[0], Blank)
+            type_hint = init_annotations.get(attribute[0], Blank)
             if type_hint is Blank:
                 type_hint = _type_hint_for_attribute_from_value(type_hint, value)
             entries[name] = AttributeEntry(
@@ -184,6 +441,12 @@ def attributes(cls, instance=None) -> List[AttributeEntry]:
     return list(entries.values())
 
 
+def attributes(cls, instance=None) -> List[AttributeEntry]:
+    if instance is None and is_declared_class(cls):
+        return [declared.entry() for declared in _declared_attributes(cls)]
+    return _attributes(cls, instance, type_hints(cls), type_hints(cls.__init__))
+
+
 def bind(instance, func, as_name=None):
     if as_name is None:
         as_name = func.__name__
@@ -193,6 +456,9 @@ def bind(instance, func, as_name=None):
 
 
 def try_instantiate_class(cls: Type[T]) -> Optional[T]:
+    if is_declared_class(cls):
+        # Its attributes are found from its declaration instead.
+        return None
     init_signature = inspect.getfullargspec(cls.__init__)
     stub_args = tuple([None for _ in range(1, len(init_signature.args))])
     try:
@@ -219,6 +485,39 @@ def is_type(value: Any, expected_type: Any) -> bool:
         return False
 
 
+_SYNC_STREAM_ORIGINS = (collections.abc.Iterator, collections.abc.Iterable, collections.abc.Generator)
+_ASYNC_STREAM_ORIGINS = (collections.abc.AsyncIterator, collections.abc.AsyncIterable, collections.abc.AsyncGenerator)
+
+
+def stream_item_type(type_hint: Any) -> Tuple[Any, Optional[bool]]:
+    """
+    Determines the type of the items yielded by an Iterator or AsyncIterator style type hint.
+
+    Args:
+        type_hint:
+
+    Returns:
+
+        (item_type, is_async):
+
+            The item type is Blank if the items are not typed. is_async is None if the hint is not a stream.
+
+    """
+    origin = getattr(type_hint, "__origin__", None)
+    # Before python 3.7 the origin is the typing generic, eg. typing.Iterator, which keeps its abc as __extra__.
+    origin = getattr(origin or type_hint, "__extra__", origin)
+    if origin in _SYNC_STREAM_ORIGINS:
+        is_async = False
+    elif origin in _ASYNC_STREAM_ORIGINS:
+        is_async = True
+    else:
+        return Blank, None
+    args = getattr(type_hint, "__args__", None)
+    if not args or isinstance(args[0], TypeVar):
+        return Blank, is_async
+    return args[0], is_async
+
+
 class InefficientUnHashableKeyDict(typing.Generic[K, V]):
 
     def __init__(self):
@@ -258,3 +557,38 @@ class InefficientUnHashableKeyDict(typing.Generic[K, V]):
 
     def items(self):
         return zip(self._backing_keys, self._backing_values).__iter__()
+
+
+class HashedKeyDict(typing.Generic[K, V]):
+    """
+    A dict which falls back to an InefficientUnHashableKeyDict for keys which cannot be hashed.
+    """
+
+    def __init__(self):
+        self._hashed: Dict[Any, Any] = {}
+        self._unhashable: InefficientUnHashableKeyDict[K, V] = InefficientUnHashableKeyDict()
+
+    def __setitem__(self, key: K, value: V):
+        try:
+            self._hashed[key] = value
+        except TypeError:
+            self._unhashable[key] = value
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            return self._hashed[key]
+        except TypeError:
+            return self._unhashable[key]
+
+    def __len__(self) -> int:
+        return len(self._hashed) + len(self._unhashable._backing_keys)
+
+    def get(self, key: K, default: Optional[V]) -> Optional[V]:
+        try:
+            return self._hashed.get(key, default)
+        except TypeError:
+            return self._unhashable.get(key, cast(V, default))
+
+    def items(self):
+        yield from self._hashed.items()
+        yield from self._unhashable.items()
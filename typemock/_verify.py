@@ -1,9 +1,10 @@
-from typing import Callable, Generic, cast, TypeVar
+from typing import Callable, Generic, cast, TypeVar, Any, Tuple, Dict, List
 
 from typemock._mock import MockObject
+from typemock._mock.object import is_mock, is_mock_function
 from typemock._mock.methods import MockMethodState
-from typemock._utils import bind
-from typemock.api import VerifyError
+from typemock._utils import short_repr
+from typemock.api import VerifyError, MockingError
 
 T = TypeVar('T')
 
@@ -106,36 +107,57 @@ No other `sets`.
 """
 
 
+_error_bulk = """
+
+{count} of {total} expected interaction(s) did not happen:
+
+{mismatches}
+
+"""
+
+_error_bulk_mismatch = "Expected {expected_count} interaction(s) with '{method_name}' with args: {expected_args}. There were {actual_interactions}."
+
+_error_not_in_order = """
+
+Expected {expected_count} interaction(s) with '{method_name}' with args:
+
+{expected_args}
+
+After the previously verified interactions, but there were {actual_interactions}.
+
+"""
+
+
 def _verify_method(method_state: MockMethodState, exactly: int) -> Callable:
     def method_mock(*args, **kwargs):
         call_count = method_state.call_count_for(*args, **kwargs)
         if exactly == -1:
             if call_count.count < 1:
-                if len(call_count.other_calls) > 0:
+                if call_count.other_count > 0:
                     raise VerifyError(
                         _error_no_interactions_with_others.format(
                             method_name=method_state.name,
-                            expected_args=call_count.call,
-                            count=len(call_count.other_calls),
-                            first_other=call_count.other_calls[0]
+                            expected_args=short_repr(call_count.call),
+                            count=call_count.other_count,
+                            first_other=short_repr(call_count.first_other_call)
                         )
                     )
                 else:
                     raise VerifyError(
                         _error_no_interactions.format(
                             method_name=method_state.name,
-                            expected_args=call_count.call
+                            expected_args=short_repr(call_count.call)
                         )
                     )
         else:
             if call_count.count != exactly:
-                if len(call_count.other_calls) > 0:
+                if call_count.other_count > 0:
                     raise VerifyError(
                         _error_incorrect_amount_of_interactions_others.format(
                             method_name=method_state.name,
-                            expected_args=call_count.call,
-                            other_count=len(call_count.other_calls),
-                            first_other=call_count.other_calls[0],
+                            expected_args=short_repr(call_count.call),
+                            other_count=call_count.other_count,
+                            first_other=short_repr(call_count.first_other_call),
                             expected_count=exactly,
                             actual_interactions=call_count.count
                         )
@@ -146,7 +168,7 @@ def _verify_method(method_state: MockMethodState, exactly: int) -> Callable:
                             method_name=method_state.name,
                             expected_count=exactly,
                             actual_interactions=call_count.count,
-                            expected_args=call_count.call
+                            expected_args=short_repr(call_count.call)
                         )
                     )
 
@@ -159,15 +181,22 @@ class _VerifyObject(Generic[T]):
     def __init__(self, mock: MockObject[T], exactly: int):
         self._mock = mock
         self._exactly = exactly
-        for method_state in mock._mock_method_states:
-            verify_method = _verify_method(method_state, exactly)
-            bind(self, verify_method, method_state.name)
+        # Verify methods are only built for the methods which are verified, when they are first verified.
+        self._verify_methods: Dict[str, Callable] = {}
         self._tmock_initialised = True
 
     def __getattribute__(self, item: str):
         if object.__getattribute__(self, "_tmock_initialised"):
             mock = object.__getattribute__(self, "_mock")
             exactly = object.__getattribute__(self, "_exactly")
+            method_state = mock._mock_method_states_by_name.get(item)
+            if method_state is not None:
+                verify_methods = object.__getattribute__(self, "_verify_methods")
+                verify_method = verify_methods.get(item)
+                if verify_method is None:
+                    verify_method = _verify_method(method_state, exactly).__get__(self, _VerifyObject)
+                    verify_methods[item] = verify_method
+                return verify_method
             if item in mock._mock_attribute_states:
                 state = mock._mock_attribute_states[item]
                 get_calls = state.call_count_gets()
@@ -195,6 +224,12 @@ class _VerifyObject(Generic[T]):
                         return
         return object.__getattribute__(self, item)
 
+    def __call__(self, *args, **kwargs):
+        mock = object.__getattribute__(self, "_mock")
+        if not is_mock_function(mock):
+            raise MockingError("Only a mocked function can be verified by calling it, not {}".format(mock))
+        return getattr(self, mock._function_name)(*args, **kwargs)
+
     def __setattr__(self, key, item):
         if self._tmock_initialised:
             mock = self._mock
@@ -204,20 +239,20 @@ class _VerifyObject(Generic[T]):
                 called_set_record = state.called_set_record(item)
                 if exactly == -1:
                     if called_set_record.count < 1:
-                        if len(called_set_record.other_calls) > 0:
+                        if called_set_record.other_count > 0:
                             raise VerifyError(
                                 _error_no_sets_others.format(
                                     attribute_name=state.name,
-                                    expected_args=called_set_record.call,
-                                    count=len(called_set_record.other_calls),
-                                    first_other=called_set_record.other_calls[0]
+                                    expected_args=short_repr(called_set_record.call),
+                                    count=called_set_record.other_count,
+                                    first_other=short_repr(called_set_record.first_other_call)
                                 )
                             )
                         else:
                             raise VerifyError(
                                 _error_no_sets.format(
                                     attribute_name=state.name,
-                                    expected_args=called_set_record.call
+                                    expected_args=short_repr(called_set_record.call)
                                 )
                             )
 
@@ -225,14 +260,14 @@ class _VerifyObject(Generic[T]):
                         return
                 else:
                     if called_set_record.count != exactly:
-                        if len(called_set_record.other_calls) > 0:
+                        if called_set_record.other_count > 0:
                             raise VerifyError(
                                 _error_incorrect_sets_others.format(
                                     attribute_name=state.name,
-                                    expected_args=called_set_record.call,
+                                    expected_args=short_repr(called_set_record.call),
                                     expected_count=exactly,
-                                    other_count=len(called_set_record.other_calls),
-                                    first_other=called_set_record.other_calls[0],
+                                    other_count=called_set_record.other_count,
+                                    first_other=short_repr(called_set_record.first_other_call),
                                     actual_interactions=called_set_record.count
                                 )
                             )
@@ -240,7 +275,7 @@ class _VerifyObject(Generic[T]):
                             raise VerifyError(
                                 _error_no_sets.format(
                                     attribute_name=state.name,
-                                    expected_args=called_set_record.call
+                                    expected_args=short_repr(called_set_record.call)
                                 )
                             )
                     else:
@@ -250,4 +285,160 @@ class _VerifyObject(Generic[T]):
 
 
 def _verify(mock: T, exactly: int = -1) -> T:
-    return cast(T, _VerifyObject(cast(MockObject[T], mock), exactly=exactly))
+    verify_objects = cast(MockObject[T], mock)._verify_objects
+    verify_object = verify_objects.get(exactly)
+    if verify_object is None:
+        verify_object = _VerifyObject(cast(MockObject[T], mock), exactly=exactly)
+        verify_objects[exactly] = verify_object
+    return cast(T, verify_object)
+
+
+class _InOrder:
+    """
+    Verifies that interactions happened in the order in which they are verified, across methods and mocks.
+    """
+
+    def __init__(self, mocks: Tuple[Any, ...]):
+        for mock in mocks:
+            if not is_mock(mock):
+                raise MockingError("Can only verify the order of interactions with mocks, not {}".format(mock))
+        self._mocks = mocks
+        self._after = 0
+
+    def verify(self, mock: T, exactly: int = -1) -> T:
+        """
+        Verifies the next interaction, after those already verified.
+
+        Args:
+            mock:
+            exactly:
+
+                The number of interactions expected in order. The default of -1 expects at least one.
+
+        """
+        if self._mocks and not any(mock is in_order_mock for in_order_mock in self._mocks):
+            raise MockingError("{} was not given to in_order".format(mock))
+        return cast(T, _MethodVerifyObject(cast(MockObject[T], mock), exactly, self._verify_next))
+
+    def _verify_next(self, method_state: MockMethodState, exactly: int, *args, **kwargs):
+        expected_count = 1 if exactly == -1 else exactly
+        # Looking for one more than exactly expected, to check there are no more.
+        limit = 1 if exactly == -1 else exactly + 1
+        expected_call, sequences = method_state.sequences_after(self._after, limit, *args, **kwargs)
+        if len(sequences) < expected_count or (exactly != -1 and len(sequences) != exactly):
+            raise VerifyError(
+                _error_not_in_order.format(
+                    expected_count=expected_count,
+                    method_name=method_state.name,
+                    expected_args=short_repr(expected_call),
+                    actual_interactions=len(sequences)
+                )
+            )
+        if expected_count > 0:
+            self._after = sequences[expected_count - 1]
+
+
+class _MethodVerifyObject(Generic[T]):
+    """
+    Passes calls of the methods of a mock on to a verification function, along with the state of the method.
+    """
+
+    def __init__(self, mock: MockObject[T], exactly: int, verify_call: Callable[..., None]):
+        self._mock = mock
+        self._exactly = exactly
+        self._verify_call = verify_call
+
+    def __getattr__(self, item: str):
+        method_state = self._mock._mock_method_states_by_name.get(item)
+        if method_state is not None:
+            mock = self._mock
+            exactly = self._exactly
+            verify_call = self._verify_call
+
+            def verify_method(*args, **kwargs):
+                verify_call(method_state, exactly, mock, *args, **kwargs)
+
+            return verify_method
+        raise MockingError("Only method interactions can be verified here, not '{}'".format(item))
+
+    def __call__(self, *args, **kwargs):
+        if not is_mock_function(self._mock):
+            raise MockingError("Only a mocked function can be verified by calling it, not {}".format(self._mock))
+        getattr(self, self._mock._function_name)(*args, **kwargs)
+
+
+def _in_order(*mocks: Any) -> _InOrder:
+    return _InOrder(mocks)
+
+
+class _BulkVerify:
+    """
+    Collects many expected interactions, and then verifies them all together.
+
+    The expected interactions for each method are counted in a single pass over its recorded calls.
+    """
+
+    def __init__(self):
+        self._expectations: Dict[MockMethodState, List[Tuple[int, tuple, dict]]] = {}
+        self._total = 0
+
+    def verify(self, mock: T, exactly: int = -1) -> T:
+        """
+        Adds an expected interaction, to be checked along with the others.
+
+        Args:
+            mock:
+            exactly:
+
+                The number of interactions expected. The default of -1 expects at least one.
+
+        """
+        if not is_mock(mock):
+            raise MockingError("Can only verify interactions with mocks, not {}".format(mock))
+        return cast(T, _MethodVerifyObject(cast(MockObject[T], mock), exactly, self._expect))
+
+    def _expect(self, method_state: MockMethodState, exactly: int, *args, **kwargs):
+        self._expectations.setdefault(method_state, []).append((exactly, args, kwargs))
+        self._total += 1
+
+    def check(self) -> None:
+        """
+        Verifies all of the expected interactions.
+
+        Raises:
+
+            VerifyError: Describing every expected interaction which did not happen.
+
+        """
+        mismatches = []
+        for method_state, expectations in self._expectations.items():
+            counts = method_state.call_counts_for([(args, kwargs) for _, args, kwargs in expectations])
+            for (exactly, _, _), (expected_call, count) in zip(expectations, counts):
+                if (exactly == -1 and count < 1) or (exactly != -1 and count != exactly):
+                    mismatches.append(
+                        _error_bulk_mismatch.format(
+                            expected_count="at least 1" if exactly == -1 else exactly,
+                            method_name=method_state.name,
+                            expected_args=short_repr(expected_call),
+                            actual_interactions=count
+                        )
+                    )
+        if mismatches:
+            raise VerifyError(
+                _error_bulk.format(
+                    count=len(mismatches),
+                    total=self._total,
+                    mismatches="\n".join(mismatches)
+                )
+            )
+
+    def __enter__(self) -> '_BulkVerify':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.check()
+
+
+def _verify_all() -> _BulkVerify:
+    return _BulkVerify()
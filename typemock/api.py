@@ -1,14 +1,19 @@
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
 from enum import Enum
-from typing import TypeVar, List, Generic, Callable
+from typing import TypeVar, List, Generic, Callable, Union, Iterable, AsyncIterable, Any
+
+from typemock.chaos import ChaosSchedule
 
 T = TypeVar('T')
 R = TypeVar('R')
 
 DoFunction = Callable[..., R]
+StreamSource = Callable[..., Union[Iterable[Any], AsyncIterable[Any]]]
+
 
+class ResponseBuilder(Generic[R], metaclass=ABCMeta):
 
-class ResponseBuilder(ABC, Generic[R]):
+    __slots__ = ()
 
     @abstractmethod
     def then_return(self, result: R) -> None:
@@ -20,6 +25,20 @@ class ResponseBuilder(ABC, Generic[R]):
 
         """
 
+    @abstractmethod
+    def then_return_snapshot(self, result: R) -> None:
+        """
+        Sets the behaviour of the mock to return a fresh copy of the given response on each call.
+
+        The result is snapshotted when the behaviour is defined, so mutating a response, or the original result,
+        will not affect later responses. Only the mutable parts of the snapshot are copied on each call, which is
+        much cheaper than a `copy.deepcopy` for large structures of mostly immutable values.
+
+        Args:
+            result:
+
+        """
+
     @abstractmethod
     def then_raise(self, error: Exception) -> None:
         """
@@ -47,6 +66,19 @@ class ResponseBuilder(ABC, Generic[R]):
 
         """
 
+    @abstractmethod
+    def then_chaos(self, schedule: ChaosSchedule[R]) -> None:
+        """
+        Sets the behaviour of the mock to pick a random result or error on each call, according to a schedule.
+
+        This is intended for resilience and load testing of things like retries and circuit breakers. The picks are
+        reproducible from the seed of the schedule, and cheap to make. See `typemock.chaos`.
+
+        Args:
+            schedule:
+
+        """
+
     @abstractmethod
     def then_do(self, do_function: DoFunction) -> None:
         """
@@ -65,6 +97,23 @@ class ResponseBuilder(ABC, Generic[R]):
 
         """
 
+    @abstractmethod
+    def then_stream(self, source: StreamSource) -> None:
+        """
+        Sets the behaviour of the mock to lazily yield the items of the iterable returned by the source function.
+
+        This is for mocking things which return an Iterator or an AsyncIterator. The source is called with the args
+        provided on each call, and its items are only pulled as the caller consumes the stream, so nothing needs to
+        be held in memory. Each item is type checked as it is yielded.
+
+        Args:
+
+            source:
+
+                A function which returns an Iterable, or an AsyncIterable when streaming to an AsyncIterator.
+
+        """
+
 
 class TypeSafety(Enum):
     STRICT = 1  # Everything must be type hinted
@@ -0,0 +1,138 @@
+import time
+from typing import Any, Callable, List, Tuple, TypeVar, Generic
+
+T = TypeVar('T')
+
+Clock = Callable[[], float]
+
+
+class Outcome(Generic[T]):
+    """
+    A single possible response of a chaos schedule: either a result to return, or an error to raise.
+    """
+
+    def __init__(self, result: Any, error: Any):
+        self.result = result
+        self.error = error
+
+    def is_error(self) -> bool:
+        return self.error is not None
+
+
+class Outage:
+    """
+    A window of time, relative to the first call, during which every call raises the given error.
+    """
+
+    def __init__(self, start: float, end: float, error: Exception):
+        self.start = start
+        self.end = end
+        self.error = error
+
+
+class ChaosSchedule(Generic[T]):
+    """
+    Describes a reproducible mix of results and errors for `then_chaos`.
+    """
+
+    def __init__(
+            self,
+            outcomes: List[Tuple[float, Outcome[T]]],
+            seed: int,
+            burst_length: int,
+            clock: Clock,
+            outages: List[Outage]
+    ):
+        self.outcomes = outcomes
+        self.seed = seed
+        self.burst_length = burst_length
+        self.clock = clock
+        self.outages = outages
+
+    def with_outage(self, start: float, end: float, error: Exception) -> 'ChaosSchedule[T]':
+        """
+        Returns a copy of this schedule with an outage.
+
+        Args:
+            start:
+
+                Seconds after the first call when the outage starts.
+
+            end:
+
+                Seconds after the first call when the outage ends.
+
+            error:
+
+                The error to raise during the outage.
+
+        """
+        return ChaosSchedule(
+            outcomes=self.outcomes,
+            seed=self.seed,
+            burst_length=self.burst_length,
+            clock=self.clock,
+            outages=self.outages + [Outage(start, end, error)]
+        )
+
+
+def returns(result: T) -> Outcome[T]:
+    """
+    An outcome which returns the given result.
+    """
+    return Outcome(result, None)
+
+
+def raises(error: Exception) -> Outcome[Any]:
+    """
+    An outcome which raises the given error.
+    """
+    return Outcome(None, error)
+
+
+def weighted(
+        outcomes: List[Tuple[float, Outcome[T]]],
+        seed: int = 0,
+        burst_length: int = 1,
+        clock: Clock = time.monotonic
+) -> ChaosSchedule[T]:
+    """
+    Returns a schedule which picks an outcome at random for each call, in proportion to the given weights.
+
+    The choices are reproducible for a given seed.
+
+    Examples:
+
+        when(my_mock.fetch(match.anything())).then_chaos(
+            chaos.weighted([(95, chaos.returns("ok")), (5, chaos.raises(IOError()))], seed=42)
+        )
+
+    Args:
+        outcomes:
+
+            Pairs of weight and outcome.
+
+        seed:
+
+        burst_length:
+
+            When an error outcome is picked, it is repeated for this many calls in total.
+
+        clock:
+
+            The clock used for outages, in seconds.
+
+    """
+    if len(outcomes) == 0:
+        raise ValueError("At least one outcome is needed.")
+    if any(weight < 0 for weight, _ in outcomes) or sum(weight for weight, _ in outcomes) <= 0:
+        raise ValueError("Weights must not be negative, and must not all be 0.")
+    if burst_length < 1:
+        raise ValueError("burst_length must be at least 1.")
+    return ChaosSchedule(
+        outcomes=list(outcomes),
+        seed=seed,
+        burst_length=burst_length,
+        clock=clock,
+        outages=[]
+    )
@@ -1,15 +1,63 @@
+import re
 from abc import ABC, abstractmethod
-from typing import TypeVar, Any
+from array import array
+from collections import Counter
+from typing import TypeVar, Any, Callable, Tuple, Type, Optional, Hashable, Generic, Union, List, Dict
 
 T = TypeVar('T')
 
+Predicate = Callable[[Any], bool]
+
 
 class Matcher(ABC):
+    """
+    Base matcher of args.
+
+    Matchers are compiled into a predicate when behaviour is specified, so that they are not re-evaluated through
+    `__eq__` on each call. Matchers are equal to, and hash the same as, matchers of the same kind and parameters.
+    """
 
     @abstractmethod
     def matches(self, other: Any) -> bool:
         pass
 
+    def compile(self) -> Predicate:
+        """
+        Returns a function which checks if a value matches.
+        """
+        return self.matches
+
+    def compile_check(self) -> Predicate:
+        """
+        Returns a function which checks if a value matches, without capturing it in any captors the matcher has.
+        """
+        return self.compile()
+
+    def compile_capture(self) -> Optional[Callable[[Any], None]]:
+        """
+        Returns a function which captures a value which matched in the captors the matcher has, or None if it has none.
+        """
+        return None
+
+    def _identity(self) -> Hashable:
+        return ()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return False
+        return _hashable(self._identity()) == _hashable(other._identity())
+
+    def __hash__(self):
+        return hash((self.__class__, _hashable(self._identity())))
+
+
+def _hashable(identity: Any) -> Hashable:
+    try:
+        hash(identity)
+        return identity
+    except TypeError:
+        return repr(identity)
+
 
 class MatchAny(Matcher):
 
@@ -22,12 +70,513 @@ class MatchAny(Matcher):
     def __hash__(self):
         return hash(self.__class__)
 
+    def __repr__(self):
+        return "anything()"
+
+
+class MatchInstanceOf(Matcher):
+
+    def __init__(self, types: Tuple[Type, ...]):
+        self._types = types
+
+    def matches(self, other: Any) -> bool:
+        return isinstance(other, self._types)
+
+    def compile(self) -> Predicate:
+        types = self._types
+        return lambda other: isinstance(other, types)
+
+    def _identity(self) -> Hashable:
+        return self._types
+
+    def __repr__(self):
+        return "instance_of{}".format(self._types)
+
+
+class MatchEqualTo(Matcher):
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def matches(self, other: Any) -> bool:
+        return bool(self._value == other)
+
+    def compile(self) -> Predicate:
+        value = self._value
+        return lambda other: bool(value == other)
+
+    def _identity(self) -> Hashable:
+        return self._value
+
+    def __repr__(self):
+        return "equal_to({!r})".format(self._value)
+
+
+class MatchInRange(Matcher):
+
+    def __init__(self, minimum: Any, maximum: Any):
+        self._minimum = minimum
+        self._maximum = maximum
+
+    def matches(self, other: Any) -> bool:
+        try:
+            if self._minimum is not None and other < self._minimum:
+                return False
+            if self._maximum is not None and other > self._maximum:
+                return False
+            return True
+        except TypeError:
+            return False
+
+    def _identity(self) -> Hashable:
+        return self._minimum, self._maximum
+
+    def __repr__(self):
+        return "in_range({!r}, {!r})".format(self._minimum, self._maximum)
+
+
+class MatchRegex(Matcher):
+
+    def __init__(self, pattern: str, flags: int):
+        self._pattern = re.compile(pattern, flags)
+
+    def matches(self, other: Any) -> bool:
+        return isinstance(other, str) and self._pattern.search(other) is not None
+
+    def compile(self) -> Predicate:
+        search = self._pattern.search
+        return lambda other: isinstance(other, str) and search(other) is not None
+
+    def _identity(self) -> Hashable:
+        return self._pattern.pattern, self._pattern.flags
+
+    def __repr__(self):
+        return "regex({!r})".format(self._pattern.pattern)
+
+
+class MatchContains(Matcher):
+
+    def __init__(self, items: Tuple[Any, ...]):
+        self._items = items
+
+    def matches(self, other: Any) -> bool:
+        try:
+            return all(item in other for item in self._items)
+        except TypeError:
+            return False
+
+    def _identity(self) -> Hashable:
+        return self._items
+
+    def __repr__(self):
+        return "contains{!r}".format(self._items)
+
+
+class MatchHasAttrs(Matcher):
+
+    def __init__(self, attrs: Tuple[Tuple[str, Matcher], ...]):
+        self._attrs = attrs
+
+    def matches(self, other: Any) -> bool:
+        return self.compile()(other)
+
+    def compile(self) -> Predicate:
+        checks = [(name, matcher.compile()) for name, matcher in self._attrs]
+        missing = object()
+
+        def predicate(other: Any) -> bool:
+            for name, check in checks:
+                value = getattr(other, name, missing)
+                if value is missing or not check(value):
+                    return False
+            return True
+
+        return predicate
+
+    def _identity(self) -> Hashable:
+        return self._attrs
+
+    def __repr__(self):
+        return "has_attrs({})".format(", ".join("{}={!r}".format(name, matcher) for name, matcher in self._attrs))
+
+
+class MatchAllOf(Matcher):
+
+    def __init__(self, matchers: Tuple[Matcher, ...]):
+        self._matchers = matchers
+
+    def matches(self, other: Any) -> bool:
+        return self.compile()(other)
+
+    def compile(self) -> Predicate:
+        checks = [matcher.compile() for matcher in self._matchers]
+        return lambda other: all(check(other) for check in checks)
+
+    def _identity(self) -> Hashable:
+        return self._matchers
+
+    def __repr__(self):
+        return "all_of{!r}".format(self._matchers)
+
+
+class MatchAnyOf(Matcher):
+
+    def __init__(self, matchers: Tuple[Matcher, ...]):
+        self._matchers = matchers
+
+    def matches(self, other: Any) -> bool:
+        return self.compile()(other)
+
+    def compile(self) -> Predicate:
+        checks = [matcher.compile() for matcher in self._matchers]
+        return lambda other: any(check(other) for check in checks)
+
+    def _identity(self) -> Hashable:
+        return self._matchers
+
+    def __repr__(self):
+        return "any_of{!r}".format(self._matchers)
+
+
+class MatchNot(Matcher):
+
+    def __init__(self, matcher: Matcher):
+        self._matcher = matcher
+
+    def matches(self, other: Any) -> bool:
+        return not self._matcher.matches(other)
+
+    def compile(self) -> Predicate:
+        check = self._matcher.compile()
+        return lambda other: not check(other)
+
+    def _identity(self) -> Hashable:
+        return self._matcher
+
+    def __repr__(self):
+        return "not_({!r})".format(self._matcher)
+
+
+class MatchSequence(Matcher):
+    """
+    Matches a tuple of values, such as the `*args` of a call, some of which are matchers.
+    """
+
+    def __init__(self, matchers: Tuple[Matcher, ...]):
+        self._matchers = matchers
+
+    def matches(self, other: Any) -> bool:
+        return self.compile()(other)
+
+    def compile(self) -> Predicate:
+        return _check_then_capture(self)
+
+    def compile_check(self) -> Predicate:
+        checks = [matcher.compile_check() for matcher in self._matchers]
+        length = len(checks)
+
+        def predicate(other: Any) -> bool:
+            if not isinstance(other, tuple) or len(other) != length:
+                return False
+            for check, value in zip(checks, other):
+                if not check(value):
+                    return False
+            return True
+
+        return predicate
+
+    def compile_capture(self) -> Optional[Callable[[Any], None]]:
+        compiled = [(i, matcher.compile_capture()) for i, matcher in enumerate(self._matchers)]
+        captures = [(i, capture) for i, capture in compiled if capture is not None]
+        if len(captures) == 0:
+            return None
+
+        def capture(other: Any) -> None:
+            for i, capture_item in captures:
+                capture_item(other[i])
+
+        return capture
+
+    def _identity(self) -> Hashable:
+        return self._matchers
+
+    def __repr__(self):
+        return repr(self._matchers)
+
+
+class MatchMapping(Matcher):
+    """
+    Matches a dict of values, such as the `**kwargs` of a call, some of which are matchers.
+    """
+
+    def __init__(self, matchers: Tuple[Tuple[Any, Matcher], ...]):
+        self._matchers = matchers
+
+    def matches(self, other: Any) -> bool:
+        return self.compile()(other)
+
+    def compile(self) -> Predicate:
+        return _check_then_capture(self)
+
+    def compile_check(self) -> Predicate:
+        checks = [(key, matcher.compile_check()) for key, matcher in self._matchers]
+        keys = set(key for key, _ in self._matchers)
+        missing = object()
+
+        def predicate(other: Any) -> bool:
+            if not isinstance(other, dict) or other.keys() != keys:
+                return False
+            for key, check in checks:
+                value = other.get(key, missing)
+                if value is missing or not check(value):
+                    return False
+            return True
+
+        return predicate
+
+    def compile_capture(self) -> Optional[Callable[[Any], None]]:
+        compiled = [(key, matcher.compile_capture()) for key, matcher in self._matchers]
+        captures = [(key, capture) for key, capture in compiled if capture is not None]
+        if len(captures) == 0:
+            return None
+
+        def capture(other: Any) -> None:
+            for key, capture_item in captures:
+                capture_item(other[key])
+
+        return capture
+
+    def _identity(self) -> Hashable:
+        return self._matchers
+
+    def __repr__(self):
+        return repr(dict(self._matchers))
+
+
+def _match_anything(other: Any) -> bool:
+    return True
+
+
+def _check_then_capture(matcher: Matcher) -> Predicate:
+    """
+    Compiles a matcher of many values, whose captors only capture once every value has matched.
+    """
+    check = matcher.compile_check()
+    capture = matcher.compile_capture()
+    if capture is None:
+        return check
+
+    def predicate(other: Any) -> bool:
+        if not check(other):
+            return False
+        capture(other)
+        return True
+
+    return predicate
+
+
+class Captor(Generic[T], Matcher):
+    """
+    Matches anything, and captures the values it matches in an append-only column.
+
+    When used to specify behaviour, the args of each call that gets the behaviour are captured. When used with `verify`,
+    the args of each recorded call which matches are captured.
+    """
+
+    def __init__(self, typecode: Optional[str]):
+        self.values: Union[List[T], array] = array(typecode) if typecode else []
+
+    def matches(self, other: Any) -> bool:
+        self.capture(other)
+        return True
+
+    def compile(self) -> Predicate:
+        append = self.values.append
+
+        def predicate(other: Any) -> bool:
+            append(other)
+            return True
+
+        return predicate
+
+    def compile_check(self) -> Predicate:
+        return _match_anything
+
+    def compile_capture(self) -> Optional[Callable[[Any], None]]:
+        return self.values.append
+
+    def capture(self, value: T):
+        self.values.append(value)
+
+    @property
+    def value(self) -> T:
+        """
+        The last captured value.
+        """
+        if len(self.values) == 0:
+            raise ValueError("No values have been captured.")
+        return self.values[-1]
+
+    def count(self) -> int:
+        return len(self.values)
+
+    def sum(self) -> Any:
+        return sum(self.values)
+
+    def min(self) -> T:
+        return min(self.values)
+
+    def max(self) -> T:
+        return max(self.values)
+
+    def histogram(self, bin_width: Optional[Any] = None) -> Dict[Any, int]:
+        """
+        Counts the captured values, by distinct value, or by numeric bins of the given width.
+
+        Args:
+            bin_width:
+
+                If given, values are counted in the bin which starts at the nearest multiple of the width below them.
+
+        Returns:
+
+            counts:
+
+        """
+        if bin_width is None:
+            return dict(Counter(self.values))
+        return dict(Counter((value // bin_width) * bin_width for value in self.values))
+
+    def _identity(self) -> Hashable:
+        return id(self)
+
+    def __repr__(self):
+        return "captor()"
+
 
 _MATCH_ANY = MatchAny()
 
 
+def contains_matcher(value: Any) -> bool:
+    """
+    Checks if a value is a matcher, or a tuple or dict of values which contains a matcher.
+    """
+    if isinstance(value, Matcher):
+        return True
+    if type(value) is tuple:
+        return any(isinstance(item, Matcher) for item in value)
+    if type(value) is dict:
+        return any(isinstance(item, Matcher) for item in value.values())
+    return False
+
+
+def contains_captor(value: Any) -> bool:
+    """
+    Checks if a value is a captor, or a tuple or dict of values which contains a captor.
+    """
+    return contains_matcher(value) and as_matcher(value).compile_capture() is not None
+
+
+def as_matcher(value: Any) -> Matcher:
+    """
+    Returns the value if it is already a matcher, or else a matcher for it.
+    """
+    if isinstance(value, Matcher):
+        return value
+    if contains_matcher(value):
+        if type(value) is tuple:
+            return MatchSequence(tuple(as_matcher(item) for item in value))
+        return MatchMapping(tuple((key, as_matcher(item)) for key, item in value.items()))
+    return MatchEqualTo(value)
+
+
 def anything() -> Matcher:
     """
     Returns a matcher that will match anything. Type safety is still preserved by the mock itself.
     """
     return _MATCH_ANY
+
+
+def captor(typecode: Optional[str] = None) -> Captor[Any]:
+    """
+    Returns a matcher of anything, which captures the values it matches.
+
+    Examples:
+
+        batch_sizes = match.captor("q")
+
+        verify(my_writer_mock).write(batch_sizes)
+
+        assert batch_sizes.max() <= 100
+
+    Args:
+        typecode:
+
+            If given, values are stored compactly in an `array.array` of this typecode, eg. "q" for ints or "d" for
+            floats, rather than in a list.
+
+    """
+    return Captor(typecode)
+
+
+def instance_of(*types: Type) -> Matcher:
+    """
+    Returns a matcher of values which are an instance of any of the given types.
+    """
+    return MatchInstanceOf(types)
+
+
+def equal_to(value: Any) -> Matcher:
+    """
+    Returns a matcher of values which are equal to the given value.
+    """
+    return MatchEqualTo(value)
+
+
+def in_range(minimum: Optional[Any] = None, maximum: Optional[Any] = None) -> Matcher:
+    """
+    Returns a matcher of values between the minimum and maximum, inclusive. Either bound can be left open with None.
+    """
+    return MatchInRange(minimum, maximum)
+
+
+def regex(pattern: str, flags: int = 0) -> Matcher:
+    """
+    Returns a matcher of strings in which the regular expression pattern can be found.
+    """
+    return MatchRegex(pattern, flags)
+
+
+def contains(*items: Any) -> Matcher:
+    """
+    Returns a matcher of containers which contain all of the given items.
+    """
+    return MatchContains(items)
+
+
+def has_attrs(**attrs: Any) -> Matcher:
+    """
+    Returns a matcher of objects which have the given attributes, with values that are equal or match.
+    """
+    return MatchHasAttrs(tuple((name, as_matcher(value)) for name, value in sorted(attrs.items())))
+
+
+def all_of(*matchers: Any) -> Matcher:
+    """
+    Returns a matcher of values which match all of the given matchers or values.
+    """
+    return MatchAllOf(tuple(as_matcher(matcher) for matcher in matchers))
+
+
+def any_of(*matchers: Any) -> Matcher:
+    """
+    Returns a matcher of values which match any of the given matchers or values.
+    """
+    return MatchAnyOf(tuple(as_matcher(matcher) for matcher in matchers))
+
+
+def not_(matcher: Any) -> Matcher:
+    """
+    Returns a matcher of values which do not match the given matcher or value.
+    """
+    return MatchNot(as_matcher(matcher))